@@ -0,0 +1,40 @@
+# Generated by Django 5.2.8 on 2026-10-17 04:08
+
+from django.db import migrations, models
+
+from apps.core.geo import encode_geohash, resolve_point
+
+
+def backfill_geohash(apps, schema_editor):
+    Address = apps.get_model("accounts", "Address")
+    batch = []
+    for address in Address.objects.only(
+        "id", "latitude", "longitude", "wilaya"
+    ).iterator(chunk_size=2000):
+        point = resolve_point(address.latitude, address.longitude, address.wilaya)
+        if point:
+            address.geohash = encode_geohash(*point)
+            batch.append(address)
+        if len(batch) >= 2000:
+            Address.objects.bulk_update(batch, ["geohash"])
+            batch = []
+    if batch:
+        Address.objects.bulk_update(batch, ["geohash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="address",
+            name="geohash",
+            field=models.CharField(
+                blank=True, db_index=True, default="", editable=False, max_length=12
+            ),
+        ),
+        migrations.RunPython(backfill_geohash, migrations.RunPython.noop),
+    ]
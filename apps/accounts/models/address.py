@@ -1,6 +1,7 @@
 import uuid
 from django.db import models
 from apps.core.models import BaseModel
+from apps.core.geo import encode_geohash, resolve_point
 
 class Address(BaseModel):
    
@@ -10,6 +11,8 @@ class Address(BaseModel):
     wilaya = models.CharField(max_length=100)
     latitude = models.DecimalField(max_digits=9, decimal_places=6, blank=True, null=True)
     longitude = models.DecimalField(max_digits=9, decimal_places=6, blank=True, null=True)
+    # Geohash of the coordinates (or the wilaya centroid) for proximity search
+    geohash = models.CharField(max_length=12, blank=True, default='', db_index=True, editable=False)
 
     class Meta:
         db_table = 'addresses'
@@ -19,4 +22,15 @@ class Address(BaseModel):
         ]
 
     def __str__(self):
-        return f"{self.city}, {self.wilaya}, Algeria"
\ No newline at end of file
+        return f"{self.city}, {self.wilaya}, Algeria"
+
+    def save(self, *args, **kwargs):
+        self.geohash = self.compute_geohash()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'latitude', 'longitude', 'wilaya'} & set(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {'geohash'}
+        super().save(*args, **kwargs)
+
+    def compute_geohash(self):
+        point = resolve_point(self.latitude, self.longitude, self.wilaya)
+        return encode_geohash(*point) if point else ''
\ No newline at end of file
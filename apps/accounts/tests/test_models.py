@@ -0,0 +1,43 @@
+from decimal import Decimal
+
+from django.test import TestCase
+
+from apps.accounts.models import Address
+from apps.core.geo import encode_geohash
+
+
+class AddressGeohashTests(TestCase):
+    """Address.save keeps the proximity geohash in step with the location"""
+
+    def test_geohash_from_coordinates(self):
+        address = Address.objects.create(
+            address_line_1='1 Place des Martyrs',
+            city='Algiers',
+            wilaya='Alger',
+            latitude=Decimal('36.785000'),
+            longitude=Decimal('3.060000')
+        )
+        self.assertEqual(address.geohash, encode_geohash(36.785, 3.06))
+
+    def test_geohash_falls_back_to_wilaya_centroid(self):
+        address = Address.objects.create(address_line_1='Centre', city='Oran', wilaya='Oran')
+        self.assertEqual(address.geohash, encode_geohash(35.697, -0.633))
+
+    def test_unknown_location_has_no_geohash(self):
+        address = Address.objects.create(address_line_1='Nowhere', city='Nowhere', wilaya='Atlantis')
+        self.assertEqual(address.geohash, '')
+
+    def test_update_fields_save_stores_recomputed_geohash(self):
+        address = Address.objects.create(address_line_1='Centre', city='Oran', wilaya='Oran')
+        address.wilaya = 'Blida'
+        address.save(update_fields=['wilaya'])
+
+        address.refresh_from_db()
+        self.assertEqual(address.geohash, encode_geohash(36.470, 2.828))
+
+        address.latitude = Decimal('36.500000')
+        address.longitude = Decimal('2.900000')
+        address.save(update_fields=['latitude', 'longitude'])
+
+        address.refresh_from_db()
+        self.assertEqual(address.geohash, encode_geohash(36.5, 2.9))
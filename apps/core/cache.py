@@ -0,0 +1,63 @@
+"""
+Version-stamped cache entries
+
+Cached values record the versions of the data they were built from.
+Writers bump a version instead of deleting entries, so a reader that
+computed a value from old data can never store it as current.
+"""
+import time
+from typing import Any, Callable, List, Optional
+
+from django.core.cache import cache
+
+
+def bump_versions(*version_keys: str) -> None:
+    """Outdate every entry built from the given versions"""
+    for key in version_keys:
+        cache.add(key, time.time_ns(), timeout=None)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Evicted between add and incr; the next read re-seeds it
+            pass
+
+
+def get_versioned(
+    cache_key: str,
+    version_keys: List[str],
+    compute: Callable[[], Any],
+    timeout: Optional[int] = None
+) -> Any:
+    """
+    Serve a value from the cache while none of its versions changed
+
+    The entry and the current versions are read in one cache round trip.
+    Versions are read before computing, so a concurrent write leaves a
+    fresh entry already outdated rather than serving stale data.
+    """
+    cached = cache.get_many([cache_key, *version_keys])
+    versions = [cached.get(key) for key in version_keys]
+
+    entry = cached.get(cache_key)
+    if entry is not None and None not in versions and entry['versions'] == versions:
+        return entry['value']
+
+    if None in versions:
+        versions = _seed_versions(version_keys, versions)
+
+    value = compute()
+    cache.set(cache_key, {'versions': versions, 'value': value}, timeout=timeout)
+    return value
+
+
+def _seed_versions(version_keys: List[str], versions: List[Optional[int]]) -> List[int]:
+    """
+    Seed missing versions. Seeds are time based so a version that was
+    evicted never restarts at a value an old cached entry recorded.
+    """
+    for key, version in zip(version_keys, versions):
+        if version is None:
+            cache.add(key, time.time_ns(), timeout=None)
+
+    current = cache.get_many(version_keys)
+    return [current.get(key) for key in version_keys]
@@ -120,6 +120,12 @@ class ProficiencyLevel:
         (ADVANCED, 'Advanced'),
         (EXPERT, 'Expert'),
     ]
+    ORDER = {
+        BEGINNER: 1,
+        INTERMEDIATE: 2,
+        ADVANCED: 3,
+        EXPERT: 4,
+    }
 
 
 class RequirementLevel:
@@ -133,6 +139,8 @@ class RequirementLevel:
         (REQUIRED, 'Required'),
         (CRITICAL, 'Critical'),
     ]
+    # Levels a volunteer must meet to qualify (the rest are preferred)
+    REQUIRED_LEVELS = [REQUIRED, CRITICAL]
 
 
 class NotificationType:
@@ -220,4 +228,67 @@ class ActionType:
         (VALIDATION, 'Validation'),
         (LOGIN, 'Login'),
         (LOGOUT, 'Logout'),
-    ]
\ No newline at end of file
+    ]
+
+class Wilaya:
+    # Approximate centroid (wilaya capital) used when an address has no coordinates
+    CENTROIDS = {
+        'Adrar': (27.874, -0.294),
+        'Chlef': (36.165, 1.334),
+        'Laghouat': (33.800, 2.865),
+        'Oum El Bouaghi': (35.877, 7.113),
+        'Batna': (35.556, 6.174),
+        'Béjaïa': (36.751, 5.056),
+        'Biskra': (34.851, 5.728),
+        'Béchar': (31.617, -2.216),
+        'Blida': (36.470, 2.828),
+        'Bouira': (36.375, 3.902),
+        'Tamanrasset': (22.785, 5.523),
+        'Tébessa': (35.404, 8.124),
+        'Tlemcen': (34.878, -1.315),
+        'Tiaret': (35.371, 1.317),
+        'Tizi Ouzou': (36.712, 4.046),
+        'Alger': (36.754, 3.059),
+        'Djelfa': (34.673, 3.263),
+        'Jijel': (36.820, 5.766),
+        'Sétif': (36.191, 5.414),
+        'Saïda': (34.830, 0.152),
+        'Skikda': (36.876, 6.907),
+        'Sidi Bel Abbès': (35.190, -0.631),
+        'Annaba': (36.900, 7.766),
+        'Guelma': (36.462, 7.426),
+        'Constantine': (36.365, 6.615),
+        'Médéa': (36.264, 2.754),
+        'Mostaganem': (35.931, 0.089),
+        'M\'Sila': (35.706, 4.542),
+        'Mascara': (35.397, 0.140),
+        'Ouargla': (31.949, 5.325),
+        'Oran': (35.697, -0.633),
+        'El Bayadh': (33.683, 1.020),
+        'Illizi': (26.483, 8.467),
+        'Bordj Bou Arréridj': (36.073, 4.761),
+        'Boumerdès': (36.766, 3.477),
+        'El Tarf': (36.767, 8.314),
+        'Tindouf': (27.674, -8.147),
+        'Tissemsilt': (35.607, 1.811),
+        'El Oued': (33.368, 6.868),
+        'Khenchela': (35.436, 7.143),
+        'Souk Ahras': (36.286, 7.951),
+        'Tipaza': (36.589, 2.447),
+        'Mila': (36.450, 6.264),
+        'Aïn Defla': (36.264, 1.968),
+        'Naâma': (33.267, -0.313),
+        'Aïn Témouchent': (35.297, -1.140),
+        'Ghardaïa': (32.490, 3.673),
+        'Relizane': (35.737, 0.556),
+        'Timimoun': (29.263, 0.231),
+        'Bordj Badji Mokhtar': (21.328, 0.955),
+        'Ouled Djellal': (34.417, 5.067),
+        'Béni Abbès': (30.131, -2.166),
+        'In Salah': (27.197, 2.483),
+        'In Guezzam': (19.572, 5.770),
+        'Touggourt': (33.105, 6.057),
+        'Djanet': (24.554, 9.484),
+        'El M\'Ghair': (33.950, 5.923),
+        'El Meniaa': (30.579, 2.879),
+    }
@@ -0,0 +1,118 @@
+"""
+Geographic helpers: geohash encoding, cell coverage and great-circle distance
+"""
+import math
+from typing import List, Optional, Tuple
+
+from .constants import Wilaya
+
+GEOHASH_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+GEOHASH_PRECISION = 9
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = 111.32
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Encode a coordinate pair as a geohash string"""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bit = 0
+    value = 0
+    even = True
+
+    while len(chars) < precision:
+        if even:
+            mid = (lon_range[0] + lon_range[1]) / 2
+            if longitude >= mid:
+                value = (value << 1) | 1
+                lon_range[0] = mid
+            else:
+                value <<= 1
+                lon_range[1] = mid
+        else:
+            mid = (lat_range[0] + lat_range[1]) / 2
+            if latitude >= mid:
+                value = (value << 1) | 1
+                lat_range[0] = mid
+            else:
+                value <<= 1
+                lat_range[1] = mid
+        even = not even
+
+        bit += 1
+        if bit == 5:
+            chars.append(GEOHASH_BASE32[value])
+            bit = 0
+            value = 0
+
+    return ''.join(chars)
+
+
+def cell_size_degrees(precision: int) -> Tuple[float, float]:
+    """Height and width (in degrees) of a geohash cell at a precision"""
+    bits = precision * 5
+    lon_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lon_bits)
+
+
+def covering_geohashes(latitude: float, longitude: float, radius_km: float) -> List[str]:
+    """
+    Geohash prefixes whose cells together cover a circle around a point
+
+    Picks the finest precision whose cells are at least radius_km tall and
+    wide, then returns the cell containing the point and its 8 neighbours.
+    A radius too large for any cell returns an empty prefix (everything).
+    """
+    # Longitude degrees shrink towards the poles: size cells for the circle's
+    # edge farthest from the equator
+    edge_latitude = min(abs(latitude) + radius_km / KM_PER_DEGREE, 89.0)
+    lat_scale = KM_PER_DEGREE
+    lon_scale = KM_PER_DEGREE * math.cos(math.radians(edge_latitude))
+
+    precision = 0
+    for candidate in range(GEOHASH_PRECISION, 0, -1):
+        height, width = cell_size_degrees(candidate)
+        if height * lat_scale >= radius_km and width * lon_scale >= radius_km:
+            precision = candidate
+            break
+
+    if precision == 0:
+        return ['']
+
+    height, width = cell_size_degrees(precision)
+    prefixes = []
+    for lat_step in (-1, 0, 1):
+        cell_lat = latitude + lat_step * height
+        if not -90.0 <= cell_lat <= 90.0:
+            continue
+        for lon_step in (-1, 0, 1):
+            cell_lon = (longitude + lon_step * width + 180.0) % 360.0 - 180.0
+            prefix = encode_geohash(cell_lat, cell_lon, precision)
+            if prefix not in prefixes:
+                prefixes.append(prefix)
+    return prefixes
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points, in kilometres"""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = math.radians(lat2 - lat1)
+    d_lambda = math.radians(lon2 - lon1)
+
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def resolve_point(latitude, longitude, wilaya: Optional[str]) -> Optional[Tuple[float, float]]:
+    """
+    Coordinates of an address, falling back to its wilaya centroid
+
+    Returns:
+        (latitude, longitude) or None when neither is known
+    """
+    if latitude is not None and longitude is not None:
+        return float(latitude), float(longitude)
+    return Wilaya.CENTROIDS.get(wilaya)
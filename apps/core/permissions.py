@@ -411,10 +411,10 @@ def get_skill_permissions(action):
     Helper to get appropriate permissions for skill actions.
     
     Rules:
-    - list/retrieve/by_category/search/popular: Public read access
+    - list/retrieve/by_category/search/autocomplete/popular: Public read access
     - create/update/delete: Admin only
     """
-    if action in ['list', 'retrieve', 'by_category', 'search', 'popular', 'statistics']:
+    if action in ['list', 'retrieve', 'by_category', 'search', 'autocomplete', 'popular', 'statistics']:
         # Public read access
         return [IsAuthenticatedOrReadOnly()]
     elif action in ['create', 'update', 'partial_update', 'destroy', 'activate', 'deactivate']:
@@ -428,16 +428,22 @@ def get_volunteer_skill_permissions(action):
     Helper to get appropriate permissions for volunteer skill actions.
     
     Rules:
-    - verify/review_verification: Admin only
+    - verify/review_verification/bulk_review_verification: Admin only
     - pending_verification_requests: Admin only
+    - claim_verification_requests/release_verification_requests: Admin only
+    - verification_request_statistics: Admin only
     - request_verification: Volunteer can request for own skills
     - verification_requests: Volunteer can view own verification requests
     - create/update/delete/bulk_import: Volunteer can manage own skills
     - list/retrieve: Volunteer sees own, admin sees all
-    - statistics/suggestions: Volunteer sees own, admin sees all
+    - statistics/suggestions/mission_recommendations: Volunteer sees own, admin sees all
     - check_requirements/verified: Volunteer sees own, admin sees all
     """
-    if action in ['verify', 'review_verification', 'pending_verification_requests']:
+    if action in [
+        'verify', 'review_verification', 'bulk_review_verification',
+        'pending_verification_requests', 'verification_request_statistics',
+        'claim_verification_requests', 'release_verification_requests'
+    ]:
         # Only admins can verify skills and review requests
         return [CanVerifySkills() | CanReviewVerificationRequests()]
     elif action in ['request_verification']:
@@ -449,7 +455,7 @@ def get_volunteer_skill_permissions(action):
     elif action in ['create', 'update', 'partial_update', 'destroy', 'bulk_import']:
         # Volunteers can manage their own skills
         return [CanManageOwnSkills()]
-    elif action in ['list', 'retrieve', 'statistics', 'suggestions', 'check_requirements', 'verified']:
+    elif action in ['list', 'retrieve', 'statistics', 'suggestions', 'mission_recommendations', 'check_requirements', 'verified']:
         # Volunteers see own, admins see all
         return [CanViewOwnSkills()]
     return [permissions.IsAuthenticated()]
@@ -484,4 +490,16 @@ def get_volunteer_search_permissions(action):
     Rules:
     - Only organizations and admins can search volunteers
     """
-    return [CanSearchVolunteers()]
\ No newline at end of file
+    return [CanSearchVolunteers()]
+
+def get_mission_permissions(action):
+    """
+    Helper to get appropriate permissions for mission actions.
+    
+    Rules:
+    - list/retrieve: Public read access (published and ongoing missions only)
+    """
+    if action in ['list', 'retrieve']:
+        # Public read access
+        return [IsAuthenticatedOrReadOnly()]
+    return [permissions.IsAuthenticated()]
@@ -0,0 +1,121 @@
+"""
+Ranked text search: PostgreSQL full-text + trigram queries, with a pure
+Python ranking that mirrors them on other databases
+"""
+import re
+from typing import Any, Iterable, List, Sequence, Set, Tuple
+
+from django.db import connections
+from django.db.models import F, Q, QuerySet
+
+SEARCH_CONFIG = 'simple'
+TRIGRAM_THRESHOLD = 0.3
+
+# ts_rank default weights for the A/B/C/D labels
+WEIGHT_SCORES = {'A': 1.0, 'B': 0.4, 'C': 0.2, 'D': 0.1}
+
+WORD_RE = re.compile(r'\w+')
+
+
+def is_postgres(using: str = 'default') -> bool:
+    """Whether a database connection supports the full-text search path"""
+    return connections[using].vendor == 'postgresql'
+
+
+def weighted_vector(weighted_fields: Sequence[Tuple[str, str]]):
+    """
+    Build a SearchVector expression from (field, weight) pairs
+    (PostgreSQL only)
+    """
+    from django.contrib.postgres.search import SearchVector
+
+    vector = None
+    for field, weight in weighted_fields:
+        part = SearchVector(field, weight=weight, config=SEARCH_CONFIG)
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def fulltext_search(
+    queryset: QuerySet,
+    query: str,
+    title_field: str = 'name',
+    vector_field: str = 'search_vector'
+) -> QuerySet:
+    """
+    Rank a queryset against a search query (PostgreSQL only)
+
+    Rows match on the stored tsvector (GIN index) or on trigram word
+    similarity of the title (pg_trgm index), so misspelled and partial
+    words still match. Ordered by full-text rank, then similarity.
+    """
+    from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+
+    search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type='websearch')
+    return queryset.annotate(
+        rank=SearchRank(F(vector_field), search_query),
+        similarity=TrigramWordSimilarity(query, title_field),
+    ).filter(
+        Q(**{vector_field: search_query}) |
+        Q(**{f'{title_field}__trigram_word_similar': query})
+    ).order_by('-rank', '-similarity', title_field)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased words of a text"""
+    return WORD_RE.findall((text or '').lower())
+
+
+def trigrams(text: str) -> Set[str]:
+    """pg_trgm style trigrams: each word padded with two leading and one trailing space"""
+    result = set()
+    for word in tokenize(text):
+        padded = f'  {word} '
+        result.update(padded[index:index + 3] for index in range(len(padded) - 2))
+    return result
+
+
+def word_similarity(query: str, text: str) -> float:
+    """Share of the query's trigrams found in the text (approximates pg_trgm word_similarity)"""
+    query_trigrams = trigrams(query)
+    if not query_trigrams:
+        return 0.0
+    return len(query_trigrams & trigrams(text)) / len(query_trigrams)
+
+
+def rank_in_python(
+    items: Iterable[Any],
+    query: str,
+    weighted_fields: Sequence[Tuple[str, str]],
+    title_field: str = 'name',
+    threshold: float = TRIGRAM_THRESHOLD
+) -> List[Any]:
+    """
+    Rank objects against a search query without database support
+
+    Mirrors fulltext_search: objects containing every query word are
+    ranked by the weights of the fields the words appear in, and objects
+    whose title is similar enough to the query still match with rank 0.
+    """
+    query_words = set(tokenize(query))
+    if not query_words:
+        return []
+
+    ranked = []
+    for item in items:
+        rank = 0.0
+        found = set()
+        for field, weight in weighted_fields:
+            field_matches = query_words.intersection(tokenize(getattr(item, field)))
+            rank += WEIGHT_SCORES[weight] * len(field_matches) / len(query_words)
+            found |= field_matches
+        if found != query_words:
+            rank = 0.0
+
+        title = getattr(item, title_field) or ''
+        similarity = word_similarity(query, title)
+        if rank or similarity >= threshold:
+            ranked.append((-rank, -similarity, title, item))
+
+    ranked.sort(key=lambda entry: entry[:3])
+    return [entry[3] for entry in ranked]
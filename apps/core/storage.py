@@ -0,0 +1,93 @@
+"""
+Content-addressed file storage
+
+Uploads are stored once under the SHA-256 of their bytes, so identical
+documents share one file (and one URL) however often they are uploaded.
+"""
+import hashlib
+import os
+import tempfile
+from typing import Optional
+
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+from django.utils.functional import cached_property
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    File system storage that names files after their content hash.
+
+    The file is hashed while it is streamed to a temporary file in chunks,
+    then moved to <prefix>/<aa>/<bb>/<sha256><ext>. When that blob already
+    exists the copy is discarded, so re-uploads cost one read and no extra
+    disk space. The directory from upload_to is ignored. Blobs are shared,
+    so callers must not delete one that other rows still reference (see
+    DocumentBlobService for reference counting).
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, prefix: str = 'documents', **kwargs):
+        super().__init__(**kwargs)
+        self.prefix = prefix
+
+    @cached_property
+    def _temp_dir(self) -> str:
+        return os.path.join(self.location, self.prefix, 'tmp')
+
+    def get_available_name(self, name, max_length=None):
+        # Names come from the content hash, so there is nothing to dedupe here
+        return name
+
+    def _save(self, name, content):
+        os.makedirs(self._temp_dir, exist_ok=True)
+        digest = hashlib.sha256()
+        with tempfile.NamedTemporaryFile(dir=self._temp_dir, delete=False) as temp_file:
+            try:
+                if hasattr(content, 'seek'):
+                    content.seek(0)
+                for chunk in content.chunks(chunk_size=self.CHUNK_SIZE):
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode()
+                    digest.update(chunk)
+                    temp_file.write(chunk)
+            except BaseException:
+                os.unlink(temp_file.name)
+                raise
+
+        blob_name = self.blob_name(digest.hexdigest(), name)
+        full_path = self.path(blob_name)
+        if os.path.exists(full_path):
+            os.unlink(temp_file.name)
+            return blob_name
+
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        # Atomic, so a concurrent upload of the same bytes never sees half a file
+        os.replace(temp_file.name, full_path)
+        if self.file_permissions_mode is not None:
+            os.chmod(full_path, self.file_permissions_mode)
+        return blob_name
+
+    def blob_name(self, sha256: str, original_name: str = '') -> str:
+        """Storage name of the blob with the given hash"""
+        extension = os.path.splitext(original_name)[1].lower()
+        return f'{self.prefix}/{sha256[:2]}/{sha256[2:4]}/{sha256}{extension}'
+
+    def digest_of(self, name: Optional[str]) -> Optional[str]:
+        """SHA-256 of a blob from its name, None for files stored by other means"""
+        if not name or not name.startswith(f'{self.prefix}/'):
+            return None
+        sha256 = os.path.splitext(os.path.basename(name))[0]
+        if len(sha256) != 64:
+            return None
+        return sha256
+
+
+document_storage = ContentAddressedStorage()
+
+
+def get_document_storage() -> ContentAddressedStorage:
+    """Storage of uploaded verification documents (callable for FileField)"""
+    return document_storage
@@ -0,0 +1,138 @@
+import math
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from apps.core.geo import (
+    KM_PER_DEGREE,
+    cell_size_degrees,
+    covering_geohashes,
+    encode_geohash,
+    haversine_km,
+    resolve_point,
+)
+from apps.core.search import TRIGRAM_THRESHOLD, rank_in_python, word_similarity
+
+
+class GeohashTests(SimpleTestCase):
+    """Geohash encoding and cell coverage"""
+
+    def test_encode_known_points(self):
+        self.assertEqual(encode_geohash(57.64911, 10.40744), 'u4pruydqq')
+        self.assertEqual(encode_geohash(57.64911, 10.40744, precision=5), 'u4pru')
+        self.assertEqual(encode_geohash(0.0, 0.0, precision=4), 's000')
+        self.assertEqual(encode_geohash(-90.0, -180.0, precision=4), '0000')
+
+    def test_prefixes_nest(self):
+        full = encode_geohash(36.754, 3.059)
+        for precision in range(1, len(full)):
+            self.assertEqual(encode_geohash(36.754, 3.059, precision), full[:precision])
+
+    def test_cell_size(self):
+        self.assertEqual(cell_size_degrees(1), (45.0, 45.0))
+        self.assertEqual(cell_size_degrees(2), (5.625, 11.25))
+
+    def points_around(self, latitude, longitude, radius_km, steps=24):
+        """Points inside the circle, on rings up to its edge"""
+        for ring in (0.25, 0.5, 0.99):
+            for step in range(steps):
+                angle = 2 * math.pi * step / steps
+                point_lat = latitude + ring * radius_km / KM_PER_DEGREE * math.cos(angle)
+                point_lon = longitude + ring * radius_km * math.sin(angle) / (
+                    KM_PER_DEGREE * math.cos(math.radians(point_lat))
+                )
+                point_lon = (point_lon + 180.0) % 360.0 - 180.0
+                if haversine_km(latitude, longitude, point_lat, point_lon) <= radius_km:
+                    yield point_lat, point_lon
+
+    def assertCovers(self, latitude, longitude, radius_km):
+        prefixes = covering_geohashes(latitude, longitude, radius_km)
+        self.assertLessEqual(len(prefixes), 9)
+        self.assertEqual(len({len(prefix) for prefix in prefixes}), 1)
+        for point_lat, point_lon in self.points_around(latitude, longitude, radius_km):
+            geohash = encode_geohash(point_lat, point_lon)
+            self.assertTrue(
+                any(geohash.startswith(prefix) for prefix in prefixes),
+                f'{point_lat},{point_lon} ({geohash}) not covered by {prefixes}'
+            )
+        return prefixes
+
+    def test_covering_cells_contain_every_point_within_radius(self):
+        for radius_km in (0.5, 5, 25, 80, 150):
+            self.assertCovers(36.754, 3.059, radius_km)
+
+    def test_covering_across_the_antimeridian_and_near_poles(self):
+        prefixes = self.assertCovers(-16.5, 179.99, 30)
+        self.assertTrue(any(prefix.startswith('r') for prefix in prefixes))
+        self.assertTrue(any(prefix.startswith('2') for prefix in prefixes))
+        self.assertCovers(70.0, 25.0, 40)
+
+    def test_smaller_radius_uses_finer_cells(self):
+        coarse = covering_geohashes(36.754, 3.059, 100)
+        fine = covering_geohashes(36.754, 3.059, 1)
+        self.assertGreater(len(fine[0]), len(coarse[0]))
+
+    def test_default_scan_radius_stays_regional(self):
+        # Country-sized cells would turn the prefilter into a full scan
+        prefixes = covering_geohashes(36.754, 3.059, settings.SKILLS_PROXIMITY_MAX_RADIUS_KM)
+        self.assertEqual({len(prefix) for prefix in prefixes}, {3})
+
+    def test_radius_too_large_for_any_cell_covers_everything(self):
+        self.assertEqual(covering_geohashes(36.754, 3.059, 6000), [''])
+
+
+class DistanceTests(SimpleTestCase):
+    """Great-circle distance and address point resolution"""
+
+    def test_haversine(self):
+        self.assertAlmostEqual(haversine_km(0, 0, 0, 1), 111.19, places=2)
+        self.assertEqual(haversine_km(36.754, 3.059, 36.754, 3.059), 0)
+        # Algiers to Oran
+        self.assertAlmostEqual(haversine_km(36.754, 3.059, 35.697, -0.633), 350, delta=10)
+
+    def test_resolve_point_falls_back_to_wilaya_centroid(self):
+        self.assertEqual(resolve_point('36.5', '2.9', 'Alger'), (36.5, 2.9))
+        self.assertEqual(resolve_point(None, None, 'Oran'), (35.697, -0.633))
+        self.assertIsNone(resolve_point(None, None, 'Atlantis'))
+
+
+class RankInPythonTests(SimpleTestCase):
+    """Fallback ranking used when the database has no full-text search"""
+
+    fields = (('name', 'A'), ('description', 'B'))
+
+    def item(self, name, description=''):
+        return SimpleNamespace(name=name, description=description)
+
+    def names(self, items, query):
+        return [item.name for item in rank_in_python(items, query, self.fields)]
+
+    def test_name_matches_outrank_description_matches(self):
+        items = [
+            self.item('Driving', 'Delivering first aid kits'),
+            self.item('First Aid', 'Emergency care'),
+            self.item('Cooking'),
+        ]
+        self.assertEqual(self.names(items, 'first aid'), ['First Aid', 'Driving'])
+
+    def test_partial_matches_rank_after_full_matches(self):
+        # 'First Responder' lacks 'aid' and only matches on title similarity
+        items = [self.item('First Responder'), self.item('Cooking'), self.item('First Aid')]
+        self.assertEqual(self.names(items, 'first aid'), ['First Aid', 'First Responder'])
+
+    def test_misspelled_title_still_matches(self):
+        items = [self.item('First Aid'), self.item('Translation')]
+        self.assertEqual(self.names(items, 'frist aid'), ['First Aid'])
+
+    def test_ties_are_ordered_by_title(self):
+        items = [self.item('Python Web'), self.item('Python Data'), self.item('Python')]
+        self.assertEqual(self.names(items, 'python'), ['Python', 'Python Data', 'Python Web'])
+
+    def test_blank_query_matches_nothing(self):
+        self.assertEqual(rank_in_python([self.item('First Aid')], '  ', self.fields), [])
+
+    def test_word_similarity(self):
+        self.assertEqual(word_similarity('aid', 'First Aid'), 1.0)
+        self.assertEqual(word_similarity('xyz', 'First Aid'), 0.0)
+        self.assertGreaterEqual(word_similarity('frist', 'First Aid'), TRIGRAM_THRESHOLD)
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.8 on 2026-10-17 04:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("missions", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="mission",
+            index=models.Index(
+                condition=models.Q(("status__in", ["published", "ongoing"])),
+                fields=["start_date", "id"],
+                name="mission_discovery_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="mission",
+            index=models.Index(
+                condition=models.Q(("status__in", ["published", "ongoing"])),
+                fields=["sdg", "start_date", "id"],
+                name="mission_discovery_sdg_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="mission",
+            index=models.Index(
+                condition=models.Q(("status__in", ["published", "ongoing"])),
+                fields=["mission_type", "start_date", "id"],
+                name="mission_discovery_type_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="mission",
+            index=models.Index(
+                condition=models.Q(
+                    ("is_featured", True), ("status__in", ["published", "ongoing"])
+                ),
+                fields=["start_date", "id"],
+                name="mission_discovery_featured_idx",
+            ),
+        ),
+    ]
@@ -59,6 +59,31 @@ class Mission(BaseModel):
         indexes = [
             models.Index(fields=['status', 'start_date']),
             models.Index(fields=['organization', 'status']),
+            # Mission discovery: (start_date, id) keyset order over discoverable
+            # missions, alone and behind its most selective filters
+            models.Index(
+                fields=['start_date', 'id'],
+                condition=models.Q(status__in=[MissionStatus.PUBLISHED, MissionStatus.ONGOING]),
+                name='mission_discovery_idx'
+            ),
+            models.Index(
+                fields=['sdg', 'start_date', 'id'],
+                condition=models.Q(status__in=[MissionStatus.PUBLISHED, MissionStatus.ONGOING]),
+                name='mission_discovery_sdg_idx'
+            ),
+            models.Index(
+                fields=['mission_type', 'start_date', 'id'],
+                condition=models.Q(status__in=[MissionStatus.PUBLISHED, MissionStatus.ONGOING]),
+                name='mission_discovery_type_idx'
+            ),
+            models.Index(
+                fields=['start_date', 'id'],
+                condition=models.Q(
+                    status__in=[MissionStatus.PUBLISHED, MissionStatus.ONGOING],
+                    is_featured=True
+                ),
+                name='mission_discovery_featured_idx'
+            ),
         ]
         constraints = [
             models.CheckConstraint(
@@ -0,0 +1,19 @@
+"""
+apps/missions/serializers/__init__.py
+
+Serializers module initialization
+Exports all serializer classes for easy importing
+"""
+
+# Mission Serializers
+from .mission_serializer import (
+    MissionListSerializer,
+    MissionDetailSerializer,
+    MissionDiscoveryQuerySerializer,
+)
+
+__all__ = [
+    'MissionListSerializer',
+    'MissionDetailSerializer',
+    'MissionDiscoveryQuerySerializer',
+]
@@ -0,0 +1,90 @@
+from rest_framework import serializers
+from ..models import Mission
+from ..services.mission_discovery_service import MissionDiscoveryService
+from apps.core.constants import MissionStatus, MissionType
+
+
+class MissionListSerializer(serializers.ModelSerializer):
+    """Serializer for mission discovery results"""
+    
+    organization_name = serializers.CharField(source='organization.name', read_only=True)
+    sdg_number = serializers.IntegerField(source='sdg.number', read_only=True)
+    sdg_title = serializers.CharField(source='sdg.title', read_only=True)
+    wilaya = serializers.CharField(source='address.wilaya', read_only=True)
+    city = serializers.CharField(source='address.city', read_only=True)
+    mission_type_display = serializers.CharField(
+        source='get_mission_type_display',
+        read_only=True
+    )
+    
+    class Meta:
+        model = Mission
+        fields = [
+            'id',
+            'title',
+            'organization',
+            'organization_name',
+            'mission_type',
+            'mission_type_display',
+            'proficiency_level',
+            'sdg_number',
+            'sdg_title',
+            'wilaya',
+            'city',
+            'start_date',
+            'end_date',
+            'application_deadline',
+            'volunteers_needed',
+            'volunteers_approved',
+            'status',
+            'is_featured',
+            'published_at'
+        ]
+        read_only_fields = fields
+
+
+class MissionDetailSerializer(MissionListSerializer):
+    """Detailed serializer for a discoverable mission"""
+    
+    class Meta(MissionListSerializer.Meta):
+        fields = MissionListSerializer.Meta.fields + [
+            'description',
+            'estimated_total_hours',
+            'metadata',
+            'created_at',
+            'updated_at'
+        ]
+        read_only_fields = fields
+
+
+class MissionDiscoveryQuerySerializer(serializers.Serializer):
+    """Serializer for mission discovery query parameters"""
+    
+    status = serializers.ChoiceField(
+        choices=[
+            (value, label) for value, label in MissionStatus.CHOICES
+            if value in MissionDiscoveryService.DISCOVERABLE_STATUSES
+        ],
+        required=False
+    )
+    mission_type = serializers.ChoiceField(choices=MissionType.CHOICES, required=False)
+    sdg = serializers.IntegerField(required=False, min_value=1, max_value=17)
+    wilaya = serializers.CharField(required=False, max_length=100)
+    start_after = serializers.DateTimeField(required=False)
+    start_before = serializers.DateTimeField(required=False)
+    is_featured = serializers.BooleanField(required=False, allow_null=True, default=None)
+    cursor = serializers.CharField(required=False)
+    limit = serializers.IntegerField(
+        required=False,
+        default=MissionDiscoveryService.DEFAULT_LIMIT,
+        min_value=1,
+        max_value=MissionDiscoveryService.MAX_LIMIT
+    )
+    
+    def validate(self, data):
+        if (
+            data.get('start_after') and data.get('start_before')
+            and data['start_after'] > data['start_before']
+        ):
+            raise serializers.ValidationError("start_after must be before start_before.")
+        return data
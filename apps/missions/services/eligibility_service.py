@@ -0,0 +1,98 @@
+from django.db.models import Case, When, Value, IntegerField, Count, F, Q
+from apps.accounts.models import VolunteerProfile
+from apps.skills.models import MissionSkill, VolunteerSkill
+from apps.core.constants import RequirementLevel, SkillVerificationStatus, ProficiencyLevel
+
+
+class EligibilityService:
+    """
+    Set-based mission eligibility engine
+
+    Evaluates every required-skill rule of a mission (skill held, verification
+    when required, minimum proficiency) in SQL with a GROUP BY / HAVING
+    instead of checking volunteers one by one.
+    """
+
+    DEFAULT_CHUNK_SIZE = 2000
+
+    @staticmethod
+    def proficiency_rank(field_name):
+        """SQL CASE expression mapping a proficiency level field to its rank"""
+        return Case(
+            *[
+                When(**{field_name: level}, then=Value(rank))
+                for level, rank in ProficiencyLevel.ORDER.items()
+            ],
+            default=Value(0),
+            output_field=IntegerField()
+        )
+
+    @staticmethod
+    def eligible_volunteer_ids(mission):
+        """
+        Get a subquery of volunteer IDs meeting every required skill rule
+
+        Returns:
+            values() queryset of volunteer_id, or None if the mission has no
+            required skills (every volunteer is eligible)
+        """
+        required_count = MissionSkill.objects.filter(
+            mission=mission,
+            requirement_level__in=RequirementLevel.REQUIRED_LEVELS
+        ).count()
+
+        if required_count == 0:
+            return None
+
+        # All mission_skills conditions go in one filter() so they share a join
+        return VolunteerSkill.objects.filter(
+            Q(skill__mission_skills__is_verification_required=False) |
+            Q(verification_status=SkillVerificationStatus.VERIFIED),
+            skill__mission_skills__mission=mission,
+            skill__mission_skills__requirement_level__in=RequirementLevel.REQUIRED_LEVELS,
+        ).annotate(
+            volunteer_rank=EligibilityService.proficiency_rank('proficiency_level'),
+            required_rank=EligibilityService.proficiency_rank(
+                'skill__mission_skills__min_proficiency_level'
+            ),
+        ).filter(
+            volunteer_rank__gte=F('required_rank')
+        ).values('volunteer_id').annotate(
+            requirements_met=Count('skill_id', distinct=True)
+        ).filter(
+            requirements_met=required_count
+        ).values('volunteer_id')
+
+    @staticmethod
+    def get_eligible_volunteers(mission):
+        """Get a lazy queryset of active volunteers eligible for a mission"""
+        queryset = VolunteerProfile.objects.filter(user__is_active=True)
+
+        volunteer_ids = EligibilityService.eligible_volunteer_ids(mission)
+        if volunteer_ids is not None:
+            queryset = queryset.filter(id__in=volunteer_ids)
+
+        return queryset.order_by('id')
+
+    @staticmethod
+    def iter_eligible_volunteer_chunks(mission, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Stream eligible volunteers in chunks using keyset pagination on id
+
+        Yields:
+            Lists of at most chunk_size VolunteerProfile objects
+        """
+        queryset = EligibilityService.get_eligible_volunteers(mission)
+        last_id = None
+
+        while True:
+            chunk_queryset = queryset
+            if last_id is not None:
+                chunk_queryset = chunk_queryset.filter(id__gt=last_id)
+
+            chunk = list(chunk_queryset[:chunk_size])
+            if not chunk:
+                break
+
+            yield chunk
+            last_id = chunk[-1].id
@@ -0,0 +1,165 @@
+"""
+Mission Discovery Service
+Public listing of published missions with keyset pagination
+"""
+import base64
+import binascii
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+
+from apps.missions.models import Mission
+from apps.core.constants import MissionStatus
+
+
+class MissionDiscoveryService:
+    """
+    Service for discovering missions.
+
+    Results are ordered by (start_date, id) and paged with a keyset cursor
+    holding the last row's sort key, so every page is an index range scan
+    that starts where the previous one ended, however deep it is. The
+    partial indexes on Mission cover the discoverable statuses with the
+    same ordering, alone and behind the SDG and mission type filters.
+    """
+
+    DISCOVERABLE_STATUSES = [MissionStatus.PUBLISHED, MissionStatus.ONGOING]
+    DEFAULT_LIMIT = 20
+    MAX_LIMIT = 100
+
+    @staticmethod
+    def discover_missions(
+        status: Optional[str] = None,
+        mission_type: Optional[str] = None,
+        sdg: Optional[int] = None,
+        wilaya: Optional[str] = None,
+        start_after: Optional[datetime] = None,
+        start_before: Optional[datetime] = None,
+        is_featured: Optional[bool] = None,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_LIMIT
+    ) -> Dict[str, Any]:
+        """
+        List discoverable missions, soonest first
+
+        Args:
+            status: One of the discoverable statuses (default: all of them)
+            mission_type: Mission type filter
+            sdg: SDG number filter
+            wilaya: Wilaya of the mission address
+            start_after: Earliest start date
+            start_before: Latest start date
+            is_featured: Featured filter
+            cursor: next_cursor of the previous page
+            limit: Page size
+
+        Returns:
+            Dictionary with the page's missions and the cursor of the next
+            page (None on the last page)
+        """
+        if limit < 1 or limit > MissionDiscoveryService.MAX_LIMIT:
+            raise ValidationError(
+                f"Limit must be between 1 and {MissionDiscoveryService.MAX_LIMIT}."
+            )
+
+        queryset = MissionDiscoveryService._filter(
+            Mission.objects.all(),
+            status, mission_type, sdg, wilaya, start_after, start_before, is_featured
+        )
+
+        if cursor:
+            last_start_date, last_id = MissionDiscoveryService.decode_cursor(cursor)
+            # (start_date, id) > (last_start_date, last_id), with the
+            # start_date bound on its own so it can seed the index range
+            queryset = queryset.filter(
+                Q(start_date__gt=last_start_date) | Q(start_date=last_start_date, id__gt=last_id),
+                start_date__gte=last_start_date
+            )
+
+        missions = list(
+            queryset.select_related(
+                'organization', 'sdg', 'address'
+            ).order_by('start_date', 'id')[:limit + 1]
+        )
+
+        next_cursor = None
+        if len(missions) > limit:
+            missions = missions[:limit]
+            next_cursor = MissionDiscoveryService.encode_cursor(missions[-1])
+
+        return {
+            'missions': missions,
+            'next_cursor': next_cursor,
+        }
+
+    @staticmethod
+    def get_discoverable_mission(mission_id: str) -> Mission:
+        """Get one discoverable mission"""
+        try:
+            return Mission.objects.select_related(
+                'organization', 'sdg', 'address'
+            ).get(
+                id=mission_id,
+                status__in=MissionDiscoveryService.DISCOVERABLE_STATUSES
+            )
+        except Mission.DoesNotExist:
+            raise ValidationError("Mission not found.")
+
+    # ============ Cursors ============
+
+    @staticmethod
+    def encode_cursor(mission: Mission) -> str:
+        """Opaque cursor pointing just after a mission"""
+        raw = f'{mission.start_date.isoformat()}|{mission.id}'
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+        """(start_date, id) from a cursor"""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            start_date, mission_id = base64.urlsafe_b64decode(padded).decode().split('|')
+            parsed_start_date = parse_datetime(start_date)
+            if parsed_start_date is None:
+                raise ValueError(start_date)
+            return parsed_start_date, uuid.UUID(mission_id)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValidationError("Invalid cursor.")
+
+    # ============ Helpers ============
+
+    @staticmethod
+    def _filter(
+        queryset: QuerySet,
+        status: Optional[str],
+        mission_type: Optional[str],
+        sdg: Optional[int],
+        wilaya: Optional[str],
+        start_after: Optional[datetime],
+        start_before: Optional[datetime],
+        is_featured: Optional[bool]
+    ) -> QuerySet:
+        if status is not None:
+            if status not in MissionDiscoveryService.DISCOVERABLE_STATUSES:
+                raise ValidationError(f"Invalid status: {status}")
+            queryset = queryset.filter(status=status)
+        else:
+            queryset = queryset.filter(status__in=MissionDiscoveryService.DISCOVERABLE_STATUSES)
+
+        if mission_type is not None:
+            queryset = queryset.filter(mission_type=mission_type)
+        if sdg is not None:
+            queryset = queryset.filter(sdg__number=sdg)
+        if wilaya:
+            queryset = queryset.filter(address__wilaya=wilaya)
+        if start_after is not None:
+            queryset = queryset.filter(start_date__gte=start_after)
+        if start_before is not None:
+            queryset = queryset.filter(start_date__lte=start_before)
+        if is_featured is not None:
+            queryset = queryset.filter(is_featured=is_featured)
+        return queryset
@@ -1,6 +1,7 @@
 from django.utils import timezone
 from django.core.exceptions import ValidationError
-from apps.missions.models import Mission, MissionSkill
+from apps.missions.models import Mission
+from apps.skills.models import MissionSkill
 from apps.core.constants import MissionStatus, RequirementLevel, ProficiencyLevel
 
 class MissionService:
@@ -46,16 +47,11 @@ class MissionService:
     
     @staticmethod
     def get_eligible_volunteers(mission):
-        """Get list of volunteers who meet mission requirements"""
-        from apps.accounts.models import VolunteerProfile
-        from apps.missions.services.participation_service import ParticipationService
-        
-        eligible_volunteers = []
-        all_volunteers = VolunteerProfile.objects.filter(is_active=True)
-        
-        for volunteer in all_volunteers:
-            can_apply, _ = ParticipationService.check_skill_requirements(mission, volunteer)
-            if can_apply:
-                eligible_volunteers.append(volunteer)
-        
-        return eligible_volunteers
\ No newline at end of file
+        """
+        Get volunteers who meet mission requirements
+        Returns a lazy queryset; use EligibilityService.iter_eligible_volunteer_chunks
+        to stream large result sets
+        """
+        from apps.missions.services.eligibility_service import EligibilityService
+        
+        return EligibilityService.get_eligible_volunteers(mission)
@@ -1,65 +1,23 @@
 from django.core.exceptions import ValidationError
 from django.utils import timezone
-from apps.missions.models import Participation, MissionSkill
+from apps.missions.models import Participation
 from apps.accounts.models import VolunteerProfile
-from apps.core.constants import ParticipationStatus, SkillVerificationStatus, RequirementLevel, ProficiencyLevel
+from apps.core.constants import ParticipationStatus
+from .requirement_evaluator import SkillRequirementEvaluator
 
 class ParticipationService:
     
     @staticmethod
-    def check_skill_requirements(mission, volunteer):
+    def check_skill_requirements(mission, volunteer, evaluator=None):
         """
         Check if volunteer meets all mission skill requirements
         Returns: (can_apply: bool, missing_requirements: list)
         """
-        missing_requirements = []
-        
-        # Get required skills for this mission
-        required_skills = MissionSkill.objects.filter(
-            mission=mission,
-            requirement_level__in=[RequirementLevel.REQUIRED, RequirementLevel.CRITICAL]
-        )
-        
-        for mission_skill in required_skills:
-            # Check if volunteer has this skill
-            volunteer_skill = volunteer.volunteer_skills.filter(
-                skill=mission_skill.skill
-            ).first()
-            
-            if not volunteer_skill:
-                missing_requirements.append(f"Missing required skill: {mission_skill.skill.name}")
-                continue
-            
-            # Check verification if required
-            if (mission_skill.is_verification_required and 
-                volunteer_skill.verification_status != SkillVerificationStatus.VERIFIED):
-                missing_requirements.append(f"Skill verification required for: {mission_skill.skill.name}")
-                continue
-            
-            # Check proficiency level using order comparison
-            proficiency_order = {
-                ProficiencyLevel.BEGINNER: 1,
-                ProficiencyLevel.INTERMEDIATE: 2,
-                ProficiencyLevel.ADVANCED: 3,
-                ProficiencyLevel.EXPERT: 4
-            }
-            
-            volunteer_level = volunteer_skill.proficiency_level
-            required_level = mission_skill.min_proficiency_level
-            
-            if proficiency_order[volunteer_level] < proficiency_order[required_level]:
-                missing_requirements.append(
-                    f"Insufficient proficiency in {mission_skill.skill.name}. "
-                    f"Required: {mission_skill.get_min_proficiency_level_display()}, "
-                    f"You have: {volunteer_skill.get_proficiency_level_display()}"
-                )
-                continue
-        
-        can_apply = len(missing_requirements) == 0
-        return can_apply, missing_requirements
+        evaluator = evaluator or SkillRequirementEvaluator(mission, volunteer)
+        return evaluator.check()
     
     @staticmethod
-    def create_participation(mission, volunteer, application_message=""):
+    def create_participation(mission, volunteer, application_message="", evaluator=None):
         """
         Create a new participation after validating requirements
         """
@@ -71,7 +29,9 @@ class ParticipationService:
             raise ValidationError("Application deadline has passed")
         
         # Check skill requirements
-        can_apply, missing_requirements = ParticipationService.check_skill_requirements(mission, volunteer)
+        can_apply, missing_requirements = ParticipationService.check_skill_requirements(
+            mission, volunteer, evaluator=evaluator
+        )
         
         if not can_apply:
             raise ValidationError({
@@ -107,40 +67,10 @@ class ParticipationService:
         return participation
     
     @staticmethod
-    def get_mission_requirements_summary(mission, volunteer):
+    def get_mission_requirements_summary(mission, volunteer, evaluator=None):
         """
         Get detailed requirements summary for a mission
+        Pass the same evaluator to create_participation to avoid reloading skills
         """
-        requirements = MissionSkill.objects.filter(mission=mission)
-        
-        summary = {
-            'mission_title': mission.title,
-            'required_skills': [],
-            'preferred_skills': [],
-            'volunteer_qualifications': [],
-            'missing_requirements': []
-        }
-        
-        can_apply, missing_reqs = ParticipationService.check_skill_requirements(mission, volunteer)
-        summary['can_apply'] = can_apply
-        summary['missing_requirements'] = missing_reqs
-        
-        for req in requirements:
-            volunteer_skill = volunteer.volunteer_skills.filter(skill=req.skill).first()
-            
-            skill_info = {
-                'skill_name': req.skill.name,
-                'requirement_level': req.get_requirement_level_display(),
-                'verification_required': req.is_verification_required,
-                'min_proficiency': req.get_min_proficiency_level_display(),
-                'volunteer_has_skill': volunteer_skill is not None,
-                'volunteer_proficiency': volunteer_skill.get_proficiency_level_display() if volunteer_skill else 'Not known',
-                'is_verified': volunteer_skill.verification_status == SkillVerificationStatus.VERIFIED if volunteer_skill else False
-            }
-            
-            if req.requirement_level in [RequirementLevel.REQUIRED, RequirementLevel.CRITICAL]:
-                summary['required_skills'].append(skill_info)
-            else:
-                summary['preferred_skills'].append(skill_info)
-        
-        return summary
\ No newline at end of file
+        evaluator = evaluator or SkillRequirementEvaluator(mission, volunteer)
+        return evaluator.summary()
@@ -0,0 +1,119 @@
+from apps.skills.models import MissionSkill, VolunteerSkill
+from apps.core.constants import SkillVerificationStatus, RequirementLevel, ProficiencyLevel
+
+
+class SkillRequirementEvaluator:
+    """
+    Evaluate a volunteer against all skill requirements of a mission
+
+    Loads the mission's MissionSkill rows and the volunteer's matching
+    VolunteerSkill rows once (two queries), then evaluates every rule in
+    memory. Reuse one instance for both the eligibility check and the
+    requirements summary.
+    """
+
+    def __init__(self, mission, volunteer):
+        self.mission = mission
+        self.volunteer = volunteer
+
+        self.mission_skills = list(
+            MissionSkill.objects.filter(mission=mission).select_related('skill')
+        )
+
+        skill_ids = [mission_skill.skill_id for mission_skill in self.mission_skills]
+        self.volunteer_skills = {}
+        if skill_ids:
+            self.volunteer_skills = {
+                volunteer_skill.skill_id: volunteer_skill
+                for volunteer_skill in VolunteerSkill.objects.filter(
+                    volunteer=volunteer,
+                    skill_id__in=skill_ids
+                )
+            }
+
+        self._result = None
+
+    @property
+    def required_skills(self):
+        return [
+            mission_skill for mission_skill in self.mission_skills
+            if mission_skill.requirement_level in RequirementLevel.REQUIRED_LEVELS
+        ]
+
+    def check(self):
+        """
+        Check if volunteer meets all mission skill requirements
+        Returns: (can_apply: bool, missing_requirements: list)
+        """
+        if self._result is None:
+            missing_requirements = [
+                message
+                for message in (
+                    self._check_requirement(mission_skill)
+                    for mission_skill in self.required_skills
+                )
+                if message
+            ]
+            self._result = (len(missing_requirements) == 0, missing_requirements)
+
+        return self._result
+
+    def _check_requirement(self, mission_skill):
+        """Return the unmet-requirement message for one mission skill, or None"""
+        volunteer_skill = self.volunteer_skills.get(mission_skill.skill_id)
+
+        if not volunteer_skill:
+            return f"Missing required skill: {mission_skill.skill.name}"
+
+        # Check verification if required
+        if (mission_skill.is_verification_required and
+            volunteer_skill.verification_status != SkillVerificationStatus.VERIFIED):
+            return f"Skill verification required for: {mission_skill.skill.name}"
+
+        # Check proficiency level using order comparison
+        volunteer_level = ProficiencyLevel.ORDER[volunteer_skill.proficiency_level]
+        required_level = ProficiencyLevel.ORDER[mission_skill.min_proficiency_level]
+
+        if volunteer_level < required_level:
+            return (
+                f"Insufficient proficiency in {mission_skill.skill.name}. "
+                f"Required: {mission_skill.get_min_proficiency_level_display()}, "
+                f"You have: {volunteer_skill.get_proficiency_level_display()}"
+            )
+
+        return None
+
+    def summary(self):
+        """
+        Get detailed requirements summary for the mission
+        """
+        can_apply, missing_requirements = self.check()
+
+        summary = {
+            'mission_title': self.mission.title,
+            'required_skills': [],
+            'preferred_skills': [],
+            'volunteer_qualifications': [],
+            'missing_requirements': missing_requirements,
+            'can_apply': can_apply,
+        }
+
+        for mission_skill in self.mission_skills:
+            volunteer_skill = self.volunteer_skills.get(mission_skill.skill_id)
+
+            skill_info = {
+                'skill_name': mission_skill.skill.name,
+                'requirement_level': mission_skill.get_requirement_level_display(),
+                'verification_required': mission_skill.is_verification_required,
+                'min_proficiency': mission_skill.get_min_proficiency_level_display(),
+                'volunteer_has_skill': volunteer_skill is not None,
+                'volunteer_proficiency': volunteer_skill.get_proficiency_level_display() if volunteer_skill else 'Not known',
+                'is_verified': volunteer_skill.verification_status == SkillVerificationStatus.VERIFIED if volunteer_skill else False
+            }
+
+            if mission_skill.requirement_level in RequirementLevel.REQUIRED_LEVELS:
+                summary['required_skills'].append(skill_info)
+            else:
+                summary['preferred_skills'].append(skill_info)
+
+        return summary
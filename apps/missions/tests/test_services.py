@@ -0,0 +1,377 @@
+from datetime import timedelta
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.accounts.models import Address, OrganizationProfile, User, VolunteerProfile
+from apps.core.constants import (
+    MissionStatus,
+    MissionType,
+    OrganizationType,
+    ProficiencyLevel,
+    RequirementLevel,
+    SkillVerificationStatus,
+    UserType,
+)
+from apps.missions.models import Mission
+from apps.missions.services.eligibility_service import EligibilityService
+from apps.missions.services.mission_discovery_service import MissionDiscoveryService
+from apps.missions.services.participation_service import ParticipationService
+from apps.missions.services.requirement_evaluator import SkillRequirementEvaluator
+from apps.skills.models import MissionSkill, Skill, SkillCategory, SustainableDevelopmentGoal, VolunteerSkill
+
+
+def create_mission(title, address, **kwargs):
+    user, _ = User.objects.get_or_create(
+        email='organization@example.com',
+        defaults={'username': 'organization', 'user_type': UserType.ORGANIZATION}
+    )
+    organization, _ = OrganizationProfile.objects.get_or_create(
+        user=user,
+        defaults={
+            'name': 'Croissant Rouge',
+            'description': 'Humanitarian organization running volunteer missions nationwide.',
+            'organization_type': OrganizationType.NGO,
+            'address': address,
+        }
+    )
+    sdg, _ = SustainableDevelopmentGoal.objects.get_or_create(
+        number=3,
+        defaults={'title': 'Goal 3', 'description': 'Goal'}
+    )
+    start_date = timezone.now() + timedelta(days=7)
+    return Mission.objects.create(**{
+        'title': title,
+        'description': 'Mission',
+        'organization': organization,
+        'sdg': sdg,
+        'address': address,
+        'start_date': start_date,
+        'end_date': start_date + timedelta(days=1),
+        'application_deadline': start_date - timedelta(days=1),
+        'estimated_total_hours': 8,
+        'volunteers_needed': 5,
+        'status': MissionStatus.PUBLISHED,
+        **kwargs,
+    })
+
+
+def create_volunteer(name, address, skills=(), is_active=True):
+    """Volunteer holding (skill, proficiency_level, verification_status) triples"""
+    user = User.objects.create(
+        email=f'{name}@example.com',
+        username=name,
+        user_type=UserType.VOLUNTEER,
+        is_active=is_active
+    )
+    volunteer = VolunteerProfile.objects.create(user=user, address=address)
+    for skill, proficiency_level, verification_status in skills:
+        VolunteerSkill.objects.create(
+            volunteer=volunteer,
+            skill=skill,
+            proficiency_level=proficiency_level,
+            verification_status=verification_status
+        )
+    return volunteer
+
+
+class MissionSkillFixtures:
+    """Skills, a mission requiring some of them and volunteers around the rules"""
+
+    @classmethod
+    def setUpTestData(cls):
+        category = SkillCategory.objects.create(name='Relief')
+        cls.first_aid, cls.driving, cls.cooking = [
+            Skill.objects.create(name=name, category=category)
+            for name in ('First Aid', 'Driving', 'Cooking')
+        ]
+        cls.address = Address.objects.create(
+            address_line_1='2 Rue Hassiba Ben Bouali',
+            city='Algiers',
+            wilaya='Alger'
+        )
+        cls.mission = create_mission('Flood relief', cls.address)
+        for skill, requirement_level, min_level, verification in (
+            (cls.first_aid, RequirementLevel.REQUIRED, ProficiencyLevel.INTERMEDIATE, True),
+            (cls.driving, RequirementLevel.CRITICAL, ProficiencyLevel.BEGINNER, False),
+            (cls.cooking, RequirementLevel.NICE_TO_HAVE, ProficiencyLevel.EXPERT, False),
+        ):
+            MissionSkill.objects.create(
+                mission=cls.mission,
+                skill=skill,
+                requirement_level=requirement_level,
+                min_proficiency_level=min_level,
+                is_verification_required=verification
+            )
+
+        verified, pending = SkillVerificationStatus.VERIFIED, SkillVerificationStatus.PENDING
+        advanced, beginner = ProficiencyLevel.ADVANCED, ProficiencyLevel.BEGINNER
+        cls.volunteers = {
+            name: create_volunteer(name, cls.address, skills, is_active=name != 'inactive')
+            for name, skills in (
+                ('qualified', [(cls.first_aid, advanced, verified), (cls.driving, beginner, pending)]),
+                ('missing', [(cls.first_aid, advanced, verified)]),
+                ('too_low', [(cls.first_aid, beginner, verified), (cls.driving, beginner, pending)]),
+                ('unverified', [(cls.first_aid, advanced, pending), (cls.driving, beginner, pending)]),
+                ('weak_optional', [
+                    (cls.first_aid, advanced, verified),
+                    (cls.driving, advanced, verified),
+                    (cls.cooking, beginner, pending),
+                ]),
+                ('inactive', [(cls.first_aid, advanced, verified), (cls.driving, beginner, pending)]),
+                ('no_skills', []),
+            )
+        }
+        cls.names = {volunteer.id: name for name, volunteer in cls.volunteers.items()}
+
+
+class EligibilityServiceTests(MissionSkillFixtures, TestCase):
+    """The grouped eligibility query agrees with the per-volunteer rules"""
+
+    def eligible(self, mission):
+        return {self.names[volunteer.id] for volunteer in EligibilityService.get_eligible_volunteers(mission)}
+
+    def evaluated(self, mission):
+        return {
+            name for name, volunteer in self.volunteers.items()
+            if volunteer.user.is_active and SkillRequirementEvaluator(mission, volunteer).check()[0]
+        }
+
+    def test_required_rules(self):
+        self.assertEqual(self.eligible(self.mission), {'qualified', 'weak_optional'})
+        self.assertEqual(self.eligible(self.mission), self.evaluated(self.mission))
+
+    def test_verification_is_only_checked_when_required(self):
+        MissionSkill.objects.filter(mission=self.mission, skill=self.first_aid).update(
+            is_verification_required=False
+        )
+        self.assertEqual(self.eligible(self.mission), {'qualified', 'unverified', 'weak_optional'})
+        self.assertEqual(self.eligible(self.mission), self.evaluated(self.mission))
+
+    def test_minimum_level_applies_to_critical_skills(self):
+        MissionSkill.objects.filter(mission=self.mission, skill=self.driving).update(
+            min_proficiency_level=ProficiencyLevel.ADVANCED
+        )
+        self.assertEqual(self.eligible(self.mission), {'weak_optional'})
+        self.assertEqual(self.eligible(self.mission), self.evaluated(self.mission))
+
+    def test_optional_skills_never_exclude(self):
+        MissionSkill.objects.filter(mission=self.mission).exclude(skill=self.cooking).update(
+            requirement_level=RequirementLevel.PREFERRED
+        )
+        self.assertIsNone(EligibilityService.eligible_volunteer_ids(self.mission))
+        self.assertEqual(self.eligible(self.mission), set(self.names.values()) - {'inactive'})
+        self.assertEqual(self.eligible(self.mission), self.evaluated(self.mission))
+
+    def test_mission_without_requirements(self):
+        mission = create_mission('Open day', self.address)
+        self.assertIsNone(EligibilityService.eligible_volunteer_ids(mission))
+        self.assertEqual(self.eligible(mission), self.evaluated(mission))
+        self.assertIn('no_skills', self.eligible(mission))
+
+    def test_chunks_stream_every_eligible_volunteer(self):
+        mission = create_mission('Open day', self.address)
+        chunks = list(EligibilityService.iter_eligible_volunteer_chunks(mission, chunk_size=4))
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 2])
+        self.assertEqual(
+            [volunteer.id for chunk in chunks for volunteer in chunk],
+            [volunteer.id for volunteer in EligibilityService.get_eligible_volunteers(mission)]
+        )
+
+
+class SkillRequirementEvaluatorTests(MissionSkillFixtures, TestCase):
+    """Requirement check and summary from one batched load"""
+
+    def evaluate(self, name):
+        return SkillRequirementEvaluator(self.mission, self.volunteers[name])
+
+    def test_all_requirements_met(self):
+        self.assertEqual(self.evaluate('qualified').check(), (True, []))
+
+        summary = self.evaluate('qualified').summary()
+        self.assertTrue(summary['can_apply'])
+        self.assertEqual(
+            [skill['skill_name'] for skill in summary['required_skills']],
+            ['First Aid', 'Driving']
+        )
+        self.assertEqual(summary['preferred_skills'], [{
+            'skill_name': 'Cooking',
+            'requirement_level': 'Nice to Have',
+            'verification_required': False,
+            'min_proficiency': 'Expert',
+            'volunteer_has_skill': False,
+            'volunteer_proficiency': 'Not known',
+            'is_verified': False,
+        }])
+
+    def test_missing_and_unverified_skills(self):
+        self.assertEqual(
+            self.evaluate('missing').check(),
+            (False, ['Missing required skill: Driving'])
+        )
+        self.assertEqual(
+            self.evaluate('unverified').check(),
+            (False, ['Skill verification required for: First Aid'])
+        )
+        self.assertEqual(
+            self.evaluate('no_skills').summary()['missing_requirements'],
+            ['Missing required skill: First Aid', 'Missing required skill: Driving']
+        )
+
+    def test_level_too_low(self):
+        can_apply, missing = self.evaluate('too_low').check()
+        self.assertFalse(can_apply)
+        self.assertEqual(missing, [
+            'Insufficient proficiency in First Aid. Required: Intermediate, You have: Beginner'
+        ])
+
+        first_aid = self.evaluate('too_low').summary()['required_skills'][0]
+        self.assertEqual(
+            (first_aid['volunteer_has_skill'], first_aid['volunteer_proficiency'], first_aid['is_verified']),
+            (True, 'Beginner', True)
+        )
+
+    def test_check_and_summary_share_two_queries(self):
+        with self.assertNumQueries(2):
+            evaluator = self.evaluate('weak_optional')
+            ParticipationService.check_skill_requirements(self.mission, None, evaluator=evaluator)
+            summary = ParticipationService.get_mission_requirements_summary(
+                self.mission, None, evaluator=evaluator
+            )
+        self.assertTrue(summary['can_apply'])
+        self.assertEqual(summary['preferred_skills'][0]['volunteer_proficiency'], 'Beginner')
+
+    def test_mission_without_skills_needs_one_query(self):
+        mission = create_mission('Open day', self.address)
+        with self.assertNumQueries(1):
+            self.assertEqual(SkillRequirementEvaluator(mission, self.volunteers['no_skills']).check(), (True, []))
+
+
+class MissionDiscoveryServiceTests(TestCase):
+    """Keyset-paginated discovery of published and ongoing missions"""
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(
+            email='organization@example.com',
+            username='organization',
+            user_type=UserType.ORGANIZATION
+        )
+        cls.algiers, cls.oran = [
+            Address.objects.create(address_line_1='1 Rue Didouche Mourad', city=wilaya, wilaya=wilaya)
+            for wilaya in ('Alger', 'Oran')
+        ]
+        organization = OrganizationProfile.objects.create(
+            user=user,
+            name='Croissant Rouge',
+            description='Humanitarian organization running volunteer missions nationwide.',
+            organization_type=OrganizationType.NGO,
+            address=cls.algiers
+        )
+        cls.sdgs = {
+            number: SustainableDevelopmentGoal.objects.create(
+                number=number, title=f'Goal {number}', description='Goal'
+            )
+            for number in (3, 4)
+        }
+
+        # Pairs of missions share a start date, so paging has to break ties on id
+        start = timezone.now().replace(microsecond=0) + timedelta(days=7)
+        cls.missions = []
+        for index in range(9):
+            start_date = start + timedelta(days=index // 2)
+            cls.missions.append(Mission.objects.create(
+                title=f'Mission {index}',
+                description='Mission',
+                organization=organization,
+                mission_type=MissionType.VIRTUAL if index % 3 == 0 else MissionType.ONE_TIME,
+                sdg=cls.sdgs[3 if index % 2 else 4],
+                address=cls.oran if index < 3 else cls.algiers,
+                start_date=start_date,
+                end_date=start_date + timedelta(days=1),
+                application_deadline=start_date - timedelta(days=1),
+                estimated_total_hours=8,
+                volunteers_needed=5,
+                status=MissionStatus.ONGOING if index == 4 else MissionStatus.PUBLISHED,
+                is_featured=index in (1, 6)
+            ))
+        cls.draft = Mission.objects.create(
+            title='Draft',
+            description='Mission',
+            organization=organization,
+            sdg=cls.sdgs[3],
+            address=cls.algiers,
+            start_date=start,
+            end_date=start + timedelta(days=1),
+            application_deadline=start - timedelta(days=1),
+            estimated_total_hours=8,
+            volunteers_needed=5
+        )
+        cls.expected_order = [
+            mission.id for mission in sorted(cls.missions, key=lambda mission: (mission.start_date, mission.id))
+        ]
+
+    def page_through(self, limit, **filters):
+        ids, cursor = [], None
+        while True:
+            page = MissionDiscoveryService.discover_missions(cursor=cursor, limit=limit, **filters)
+            ids.extend(mission.id for mission in page['missions'])
+            cursor = page['next_cursor']
+            if cursor is None:
+                return ids
+
+    def test_pages_follow_the_full_order(self):
+        for limit in (1, 2, 4, 9, 20):
+            with self.subTest(limit=limit):
+                self.assertEqual(self.page_through(limit), self.expected_order)
+
+    def test_last_page_has_no_cursor(self):
+        page = MissionDiscoveryService.discover_missions(limit=9)
+        self.assertEqual(len(page['missions']), 9)
+        self.assertIsNone(page['next_cursor'])
+
+    def test_pages_take_one_query(self):
+        cursor = MissionDiscoveryService.discover_missions(limit=3)['next_cursor']
+        with self.assertNumQueries(1):
+            page = MissionDiscoveryService.discover_missions(cursor=cursor, limit=3)
+            [mission.organization.name for mission in page['missions']]
+
+    def test_filters(self):
+        def expected(predicate):
+            return [
+                mission_id for mission_id in self.expected_order
+                if predicate(next(mission for mission in self.missions if mission.id == mission_id))
+            ]
+
+        cases = [
+            ({'status': MissionStatus.ONGOING}, lambda mission: mission.status == MissionStatus.ONGOING),
+            ({'mission_type': MissionType.VIRTUAL}, lambda mission: mission.mission_type == MissionType.VIRTUAL),
+            ({'sdg': 3}, lambda mission: mission.sdg_id == self.sdgs[3].id),
+            ({'wilaya': 'Oran'}, lambda mission: mission.address_id == self.oran.id),
+            ({'is_featured': True}, lambda mission: mission.is_featured),
+            (
+                {'start_after': self.missions[4].start_date},
+                lambda mission: mission.start_date >= self.missions[4].start_date
+            ),
+        ]
+        for filters, predicate in cases:
+            with self.subTest(filters=filters):
+                self.assertEqual(self.page_through(2, **filters), expected(predicate))
+
+    def test_invalid_arguments_are_rejected(self):
+        for arguments in (
+            {'cursor': 'not a cursor'},
+            {'cursor': MissionDiscoveryService.encode_cursor(self.missions[0])[:-4]},
+            {'limit': 0},
+            {'limit': MissionDiscoveryService.MAX_LIMIT + 1},
+            {'status': MissionStatus.DRAFT},
+        ):
+            with self.subTest(arguments=arguments), self.assertRaises(ValidationError):
+                MissionDiscoveryService.discover_missions(**arguments)
+
+    def test_only_discoverable_missions_are_retrieved(self):
+        mission = self.missions[0]
+        self.assertEqual(MissionDiscoveryService.get_discoverable_mission(mission.id), mission)
+        with self.assertRaises(ValidationError):
+            MissionDiscoveryService.get_discoverable_mission(self.draft.id)
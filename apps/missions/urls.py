@@ -1,6 +1,8 @@
 from django.urls import path
 from django.http import JsonResponse
 
+from .views import MissionViewSet
+
 # Placeholder views
 def placeholder_view(request):
     return JsonResponse({"message": "Missions API - Endpoint under construction"})
@@ -9,7 +11,7 @@ app_name = 'missions'
 
 urlpatterns = [
     path('', placeholder_view, name='index'),
-    path('missions/', placeholder_view, name='missions-list'),
-    path('missions/<uuid:pk>/', placeholder_view, name='mission-detail'),
+    path('missions/', MissionViewSet.as_view({'get': 'list'}), name='missions-list'),
+    path('missions/<uuid:pk>/', MissionViewSet.as_view({'get': 'retrieve'}), name='mission-detail'),
     path('participations/', placeholder_view, name='participations-list'),
 ]
\ No newline at end of file
@@ -0,0 +1,12 @@
+"""
+Missions Views Package Initialization
+File: apps/missions/views/__init__.py
+"""
+
+# Import viewsets from their respective modules
+from .mission_views import MissionViewSet
+
+# Export all viewsets
+__all__ = [
+    'MissionViewSet',
+]
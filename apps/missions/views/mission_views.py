@@ -0,0 +1,83 @@
+"""
+Mission ViewSet
+Public discovery of published missions
+"""
+from rest_framework import viewsets, status
+from rest_framework.response import Response
+
+from ..services.mission_discovery_service import MissionDiscoveryService
+from ..serializers import (
+    MissionListSerializer,
+    MissionDetailSerializer,
+    MissionDiscoveryQuerySerializer,
+)
+from apps.core.permissions import get_mission_permissions
+
+
+class MissionViewSet(viewsets.ViewSet):
+    """
+    ViewSet for discovering missions
+    
+    Permissions:
+    - Read operations (list, retrieve): Public access
+    
+    Endpoints:
+    - GET /missions/ - List published and ongoing missions, soonest first
+    - GET /missions/{id}/ - Get a published or ongoing mission
+    """
+    
+    def get_permissions(self):
+        """
+        Set permissions based on action
+        """
+        return get_mission_permissions(self.action)
+    
+    def list(self, request):
+        """
+        List discoverable missions [Public]
+        
+        Query Parameters:
+        - status: published/ongoing (default: both)
+        - mission_type: one_time/recurring/virtual/hybrid/urgent (optional)
+        - sdg: SDG number, 1-17 (optional)
+        - wilaya: Wilaya of the mission address (optional)
+        - start_after/start_before: Start date range, ISO 8601 (optional)
+        - is_featured: true/false (optional)
+        - cursor: next_cursor of the previous page (optional)
+        - limit: Page size (default: 20, max: 100)
+        
+        Pages are keyed on (start_date, id): follow next_cursor until it is
+        null. Deep pages cost the same as the first one.
+        
+        Example:
+        GET /missions/?sdg=4&wilaya=Alger&limit=20
+        """
+        serializer = MissionDiscoveryQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        
+        try:
+            page = MissionDiscoveryService.discover_missions(**serializer.validated_data)
+            
+            return Response({
+                'results': MissionListSerializer(page['missions'], many=True).data,
+                'next_cursor': page['next_cursor'],
+            })
+        except Exception as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+    
+    def retrieve(self, request, pk=None):
+        """
+        Get a discoverable mission [Public]
+        """
+        try:
+            mission = MissionDiscoveryService.get_discoverable_mission(pk)
+            serializer = MissionDetailSerializer(mission)
+            return Response(serializer.data)
+        except Exception as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_404_NOT_FOUND
+            )
@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from apps.skills.services.document_processing_service import DocumentProcessingService
+
+
+class Command(BaseCommand):
+    help = 'Generate checksums, metadata, thumbnails and previews of uploaded verification documents'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DocumentProcessingService.BATCH_SIZE,
+            help='Number of documents claimed at a time'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=5.0,
+            help='Seconds to wait when the queue is empty'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Drain the queue and exit instead of polling'
+        )
+
+    def handle(self, *args, **options):
+        processed = 0
+        while True:
+            batch = DocumentProcessingService.process_pending(limit=options['batch_size'])
+            processed += batch
+            if batch:
+                continue
+            if options['once']:
+                break
+            close_old_connections()
+            time.sleep(options['poll_interval'])
+
+        self.stdout.write(self.style.SUCCESS(f'Processed {processed} documents'))
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from apps.skills.services.skill_category_service import SkillCategoryService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the skill category closure table from parent links'
+
+    def handle(self, *args, **options):
+        stored = SkillCategoryService.rebuild_closure()
+        self.stdout.write(self.style.SUCCESS(f'Stored {stored} category closure rows'))
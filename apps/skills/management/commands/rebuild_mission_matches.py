@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from apps.skills.services.mission_match_service import MissionMatchService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the materialized mission/volunteer skill match table'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--mission',
+            action='append',
+            dest='mission_ids',
+            help='Only rebuild the given mission ID (can be repeated)'
+        )
+
+    def handle(self, *args, **options):
+        stored = MissionMatchService.rebuild_all(options['mission_ids'])
+        self.stdout.write(self.style.SUCCESS(f'Stored {stored} mission match rows'))
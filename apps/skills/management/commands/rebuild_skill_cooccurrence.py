@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from apps.skills.services.skill_cooccurrence_service import SkillCooccurrenceService
+
+
+class Command(BaseCommand):
+    help = 'Recompute the skill co-occurrence lists behind skill suggestions (run periodically)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top-k',
+            type=int,
+            default=SkillCooccurrenceService.TOP_K,
+            help='Number of related skills kept per skill'
+        )
+
+    def handle(self, *args, **options):
+        stored = SkillCooccurrenceService.rebuild(top_k=options['top_k'])
+        self.stdout.write(self.style.SUCCESS(f'Stored {stored} skill co-occurrence pairs'))
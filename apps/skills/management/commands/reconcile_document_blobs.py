@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from apps.skills.services.document_blob_service import DocumentBlobService
+
+
+class Command(BaseCommand):
+    help = 'Recount verification document blob references and repair any drift'
+
+    def handle(self, *args, **options):
+        repaired = DocumentBlobService.reconcile()
+        self.stdout.write(self.style.SUCCESS(f'Repaired reference counts of {repaired} blobs'))
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from apps.skills.services.skill_usage_service import SkillUsageService
+
+
+class Command(BaseCommand):
+    help = 'Recompute the denormalized skill usage counters and repair any drift'
+
+    def handle(self, *args, **options):
+        repaired = SkillUsageService.reconcile()
+        self.stdout.write(self.style.SUCCESS(f'Repaired counters of {repaired} skills'))
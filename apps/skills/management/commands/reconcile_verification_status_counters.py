@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from apps.skills.services.verification_service import VerificationService
+
+
+class Command(BaseCommand):
+    help = 'Recount verification requests per review status and repair any drift (run periodically)'
+
+    def handle(self, *args, **options):
+        repaired = VerificationService.reconcile_status_counters()
+        self.stdout.write(self.style.SUCCESS(f'Repaired {repaired} verification status counters'))
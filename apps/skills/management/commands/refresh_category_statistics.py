@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from apps.skills.services.skill_category_service import SkillCategoryService
+
+
+class Command(BaseCommand):
+    help = 'Recompute the precomputed skill category statistics (run nightly)'
+
+    def handle(self, *args, **options):
+        stored = SkillCategoryService.refresh_statistics_rollup()
+        self.stdout.write(self.style.SUCCESS(f'Stored statistics for {stored} categories'))
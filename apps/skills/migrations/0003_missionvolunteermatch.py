@@ -0,0 +1,88 @@
+# Generated by Django 5.2.8 on 2026-10-17 04:01
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+        ("missions", "0002_initial"),
+        ("skills", "0002_volunteerskill_verification_documents_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MissionVolunteerMatch",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("required_skills_total", models.PositiveIntegerField(default=0)),
+                ("preferred_skills_total", models.PositiveIntegerField(default=0)),
+                ("required_skills_matched", models.PositiveIntegerField(default=0)),
+                ("required_skills_missing", models.PositiveIntegerField(default=0)),
+                ("preferred_skills_matched", models.PositiveIntegerField(default=0)),
+                ("overall_score", models.FloatField(default=0.0)),
+                (
+                    "verified_required_skills_matched",
+                    models.PositiveIntegerField(default=0),
+                ),
+                (
+                    "verified_required_skills_missing",
+                    models.PositiveIntegerField(default=0),
+                ),
+                (
+                    "verified_preferred_skills_matched",
+                    models.PositiveIntegerField(default=0),
+                ),
+                ("verified_overall_score", models.FloatField(default=0.0)),
+                (
+                    "mission",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="volunteer_matches",
+                        to="missions.mission",
+                    ),
+                ),
+                (
+                    "volunteer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="mission_matches",
+                        to="accounts.volunteerprofile",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "mission_volunteer_matches",
+                "indexes": [
+                    models.Index(
+                        fields=["mission", "-overall_score"],
+                        name="mvm_mission_score_idx",
+                    ),
+                    models.Index(
+                        fields=["mission", "-verified_overall_score"],
+                        name="mvm_mission_verified_idx",
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("mission", "volunteer"),
+                        name="unique_mission_volunteer_match",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 5.2.8 on 2026-10-17 04:10
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+def populate_closure(apps, schema_editor):
+    SkillCategory = apps.get_model("skills", "SkillCategory")
+    SkillCategoryClosure = apps.get_model("skills", "SkillCategoryClosure")
+
+    parents = dict(SkillCategory.objects.values_list("id", "parent_category_id"))
+    rows = []
+    for category_id in parents:
+        ancestor_id, depth, seen = category_id, 0, set()
+        while ancestor_id is not None and ancestor_id not in seen:
+            seen.add(ancestor_id)
+            rows.append(
+                SkillCategoryClosure(
+                    ancestor_id=ancestor_id, descendant_id=category_id, depth=depth
+                )
+            )
+            ancestor_id = parents.get(ancestor_id)
+            depth += 1
+    SkillCategoryClosure.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("skills", "0003_missionvolunteermatch"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SkillCategoryClosure",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("depth", models.PositiveIntegerField(default=0)),
+                (
+                    "ancestor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="descendant_links",
+                        to="skills.skillcategory",
+                    ),
+                ),
+                (
+                    "descendant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ancestor_links",
+                        to="skills.skillcategory",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "skill_category_closure",
+                "indexes": [
+                    models.Index(
+                        fields=["descendant", "depth"], name="scc_descendant_depth_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("ancestor", "descendant"),
+                        name="unique_skill_category_closure",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_closure, migrations.RunPython.noop),
+    ]
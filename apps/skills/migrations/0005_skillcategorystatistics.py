@@ -0,0 +1,52 @@
+# Generated by Django 5.2.8 on 2026-10-17 04:12
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("skills", "0004_skillcategoryclosure"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SkillCategoryStatistics",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("total_skills", models.PositiveIntegerField(default=0)),
+                ("total_subcategories", models.PositiveIntegerField(default=0)),
+                ("total_volunteers", models.PositiveIntegerField(default=0)),
+                ("subtree_skills", models.PositiveIntegerField(default=0)),
+                ("subtree_subcategories", models.PositiveIntegerField(default=0)),
+                ("subtree_volunteers", models.PositiveIntegerField(default=0)),
+                ("depth_level", models.PositiveIntegerField(default=1)),
+                ("computed_at", models.DateTimeField()),
+                (
+                    "category",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="statistics",
+                        to="skills.skillcategory",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "Skill category statistics",
+                "db_table": "skill_category_statistics",
+            },
+        ),
+    ]
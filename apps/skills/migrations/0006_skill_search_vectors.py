@@ -0,0 +1,71 @@
+# Generated by Django 5.2.8 on 2026-10-17 04:16
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+def backfill_search_vectors(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    from django.contrib.postgres.search import SearchVector
+
+    vector = SearchVector("name", weight="A", config="simple") + SearchVector(
+        "description", weight="B", config="simple"
+    )
+    for model_name in ("Skill", "SkillCategory"):
+        apps.get_model("skills", model_name).objects.update(search_vector=vector)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("skills", "0005_skillcategorystatistics"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="skill",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="skillcategory",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="skill",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="skills_search_vector_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="skill",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass("name", name="gin_trgm_ops"),
+                name="skills_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="skillcategory",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="skill_categories_search_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="skillcategory",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass("name", name="gin_trgm_ops"),
+                name="skill_categories_name_trgm",
+            ),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+    ]
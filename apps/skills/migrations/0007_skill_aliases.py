@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-17 04:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("skills", "0006_skill_search_vectors"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="skill",
+            name="aliases",
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
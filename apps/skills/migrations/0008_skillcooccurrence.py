@@ -0,0 +1,66 @@
+# Generated by Django 5.2.8 on 2026-10-17 04:19
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("skills", "0007_skill_aliases"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SkillCooccurrence",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("volunteer_count", models.PositiveIntegerField(default=0)),
+                ("score", models.FloatField(default=0)),
+                ("rank", models.PositiveSmallIntegerField(default=0)),
+                ("computed_at", models.DateTimeField()),
+                (
+                    "related_skill",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="skills.skill",
+                    ),
+                ),
+                (
+                    "skill",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="cooccurrences",
+                        to="skills.skill",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "skill_cooccurrences",
+                "indexes": [
+                    models.Index(
+                        fields=["skill", "rank"], name="skill_cooc_skill_rank_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("skill", "related_skill"),
+                        name="unique_skill_cooccurrence",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,101 @@
+# Generated by Django 5.2.8 on 2026-10-17 04:20
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+STATUS_FIELDS = {
+    "pending": "volunteers_pending",
+    "verified": "volunteers_verified",
+    "rejected": "volunteers_rejected",
+    "not_required": "volunteers_not_required",
+}
+LEVEL_FIELDS = {
+    "nice_to_have": "missions_nice_to_have",
+    "preferred": "missions_preferred",
+    "required": "missions_required",
+    "critical": "missions_critical",
+}
+
+
+def populate_counters(apps, schema_editor):
+    Skill = apps.get_model("skills", "Skill")
+    VolunteerSkill = apps.get_model("skills", "VolunteerSkill")
+    MissionSkill = apps.get_model("skills", "MissionSkill")
+    SkillUsageCounter = apps.get_model("skills", "SkillUsageCounter")
+
+    counters = {
+        skill_id: SkillUsageCounter(skill_id=skill_id)
+        for skill_id in Skill.objects.values_list("id", flat=True)
+    }
+    for skill_id, status, count in (
+        VolunteerSkill.objects.values("skill_id", "verification_status")
+        .annotate(count=models.Count("id"))
+        .values_list("skill_id", "verification_status", "count")
+    ):
+        counter = counters[skill_id]
+        counter.volunteer_count += count
+        setattr(counter, STATUS_FIELDS[status], count)
+    for skill_id, level, count in (
+        MissionSkill.objects.values("skill_id", "requirement_level")
+        .annotate(count=models.Count("id"))
+        .values_list("skill_id", "requirement_level", "count")
+    ):
+        counter = counters[skill_id]
+        counter.mission_count += count
+        setattr(counter, LEVEL_FIELDS[level], count)
+    SkillUsageCounter.objects.bulk_create(counters.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("skills", "0008_skillcooccurrence"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SkillUsageCounter",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("volunteer_count", models.PositiveIntegerField(default=0)),
+                ("volunteers_pending", models.PositiveIntegerField(default=0)),
+                ("volunteers_verified", models.PositiveIntegerField(default=0)),
+                ("volunteers_rejected", models.PositiveIntegerField(default=0)),
+                ("volunteers_not_required", models.PositiveIntegerField(default=0)),
+                ("mission_count", models.PositiveIntegerField(default=0)),
+                ("missions_nice_to_have", models.PositiveIntegerField(default=0)),
+                ("missions_preferred", models.PositiveIntegerField(default=0)),
+                ("missions_required", models.PositiveIntegerField(default=0)),
+                ("missions_critical", models.PositiveIntegerField(default=0)),
+                (
+                    "skill",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="usage",
+                        to="skills.skill",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "skill_usage_counters",
+                "indexes": [
+                    models.Index(
+                        fields=["-volunteer_count"], name="skill_usage_volunteers_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
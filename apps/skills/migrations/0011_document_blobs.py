@@ -0,0 +1,69 @@
+# Generated by Django 5.2.8 on 2026-10-17 04:30
+
+import apps.core.storage
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("skills", "0010_verificationrequest_claim"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DocumentBlob",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("name", models.CharField(max_length=255, unique=True)),
+                ("sha256", models.CharField(db_index=True, max_length=64)),
+                ("size", models.PositiveBigIntegerField(default=0)),
+                ("reference_count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "db_table": "document_blobs",
+            },
+        ),
+        migrations.AlterField(
+            model_name="verificationrequest",
+            name="request_documents",
+            field=models.FileField(
+                blank=True,
+                null=True,
+                storage=apps.core.storage.get_document_storage,
+                upload_to="verification_requests/",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="volunteerskill",
+            name="supporting_document",
+            field=models.FileField(
+                blank=True,
+                null=True,
+                storage=apps.core.storage.get_document_storage,
+                upload_to="skill_verifications/",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="volunteerskill",
+            name="verification_documents",
+            field=models.FileField(
+                blank=True,
+                null=True,
+                storage=apps.core.storage.get_document_storage,
+                upload_to="skill_verification_docs/",
+            ),
+        ),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 5.2.8 on 2026-10-17 04:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("skills", "0011_document_blobs"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="documentblob",
+            name="content_type",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AddField(
+            model_name="documentblob",
+            name="metadata",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name="documentblob",
+            name="preview",
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AddField(
+            model_name="documentblob",
+            name="processed_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="documentblob",
+            name="processing_attempts",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="documentblob",
+            name="processing_error",
+            field=models.TextField(blank=True),
+        ),
+        migrations.AddField(
+            model_name="documentblob",
+            name="processing_expires_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="documentblob",
+            name="processing_status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("processing", "Processing"),
+                    ("done", "Done"),
+                    ("failed", "Failed"),
+                ],
+                default="pending",
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="documentblob",
+            name="thumbnail",
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name="documentblob",
+            index=models.Index(
+                fields=["processing_status", "created_at"],
+                name="document_blob_queue_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.8 on 2026-10-17 04:32
+
+import uuid
+from django.db import migrations, models
+
+REVIEW_STATUSES = ["pending", "under_review", "approved", "rejected", "needs_more_info"]
+
+
+def populate_counters(apps, schema_editor):
+    VerificationRequest = apps.get_model("skills", "VerificationRequest")
+    VerificationStatusCounter = apps.get_model("skills", "VerificationStatusCounter")
+
+    counts = dict.fromkeys(REVIEW_STATUSES, 0)
+    counts.update(
+        VerificationRequest.objects.values("review_status")
+        .annotate(count=models.Count("id"))
+        .order_by()
+        .values_list("review_status", "count")
+    )
+    VerificationStatusCounter.objects.bulk_create(
+        [
+            VerificationStatusCounter(review_status=status, count=count)
+            for status, count in counts.items()
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("skills", "0012_document_blob_processing"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VerificationStatusCounter",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "review_status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending Review"),
+                            ("under_review", "Under Review"),
+                            ("approved", "Approved"),
+                            ("rejected", "Rejected"),
+                            ("needs_more_info", "Needs More Information"),
+                        ],
+                        max_length=20,
+                        unique=True,
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "db_table": "verification_status_counters",
+            },
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
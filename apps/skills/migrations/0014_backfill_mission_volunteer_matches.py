@@ -0,0 +1,98 @@
+# Generated by Django 5.2.8 on 2026-10-17 06:10
+
+from django.db import migrations, models
+
+REQUIRED_LEVELS = ["required", "critical"]
+REQUIRED_WEIGHT = 0.7
+PREFERRED_WEIGHT = 0.3
+
+
+def overall_score(required_total, required_matched, preferred_total, preferred_matched):
+    required_score = required_matched / required_total * 100 if required_total else 100
+    preferred_score = (
+        preferred_matched / preferred_total * 100 if preferred_total else 0
+    )
+    return round(
+        required_score * REQUIRED_WEIGHT + preferred_score * PREFERRED_WEIGHT, 2
+    )
+
+
+def populate_matches(apps, schema_editor):
+    MissionSkill = apps.get_model("skills", "MissionSkill")
+    VolunteerSkill = apps.get_model("skills", "VolunteerSkill")
+    MissionVolunteerMatch = apps.get_model("skills", "MissionVolunteerMatch")
+
+    # Start over in case rebuild_mission_matches already filled part of it
+    MissionVolunteerMatch.objects.all().delete()
+
+    required = models.Q(requirement_level__in=REQUIRED_LEVELS)
+    totals = {
+        row["mission_id"]: (row["required_total"], row["preferred_total"])
+        for row in MissionSkill.objects.values("mission_id")
+        .annotate(
+            required_total=models.Count("id", filter=required),
+            preferred_total=models.Count("id", filter=~required),
+        )
+        .order_by()
+    }
+
+    required = models.Q(skill__mission_skills__requirement_level__in=REQUIRED_LEVELS)
+    verified = models.Q(verification_status="verified")
+    rows = (
+        VolunteerSkill.objects.filter(skill__mission_skills__isnull=False)
+        .values("skill__mission_skills__mission_id", "volunteer_id")
+        .annotate(
+            required_matched=models.Count("id", filter=required),
+            preferred_matched=models.Count("id", filter=~required),
+            verified_required_matched=models.Count("id", filter=required & verified),
+            verified_preferred_matched=models.Count("id", filter=~required & verified),
+        )
+        .order_by()
+    )
+
+    matches = []
+    for row in rows.iterator(chunk_size=5000):
+        mission_id = row["skill__mission_skills__mission_id"]
+        required_total, preferred_total = totals.get(mission_id, (0, 0))
+        matches.append(
+            MissionVolunteerMatch(
+                mission_id=mission_id,
+                volunteer_id=row["volunteer_id"],
+                required_skills_total=required_total,
+                preferred_skills_total=preferred_total,
+                required_skills_matched=row["required_matched"],
+                required_skills_missing=required_total - row["required_matched"],
+                preferred_skills_matched=row["preferred_matched"],
+                overall_score=overall_score(
+                    required_total,
+                    row["required_matched"],
+                    preferred_total,
+                    row["preferred_matched"],
+                ),
+                verified_required_skills_matched=row["verified_required_matched"],
+                verified_required_skills_missing=required_total
+                - row["verified_required_matched"],
+                verified_preferred_skills_matched=row["verified_preferred_matched"],
+                verified_overall_score=overall_score(
+                    required_total,
+                    row["verified_required_matched"],
+                    preferred_total,
+                    row["verified_preferred_matched"],
+                ),
+            )
+        )
+        if len(matches) >= 1000:
+            MissionVolunteerMatch.objects.bulk_create(matches)
+            matches = []
+    MissionVolunteerMatch.objects.bulk_create(matches)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("skills", "0013_verificationstatuscounter"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_matches, migrations.RunPython.noop),
+    ]
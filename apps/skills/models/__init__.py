@@ -1,15 +1,29 @@
 ﻿from .skill import Skill
+from .document_blob import DocumentBlob
 from .skill_category import SkillCategory
+from .skill_category_closure import SkillCategoryClosure
+from .skill_category_statistics import SkillCategoryStatistics
+from .skill_cooccurrence import SkillCooccurrence
+from .skill_usage_counter import SkillUsageCounter
 from .volunteer_skill import VolunteerSkill
 from .mission_skill import MissionSkill
 from .sdg import SustainableDevelopmentGoal
 from .verification_request import VerificationRequest
+from .verification_status_counter import VerificationStatusCounter
+from .mission_volunteer_match import MissionVolunteerMatch
 
 __all__ = [
     'Skill',
+    'DocumentBlob',
     'SkillCategory',
+    'SkillCategoryClosure',
+    'SkillCategoryStatistics',
+    'SkillCooccurrence',
+    'SkillUsageCounter',
     'VolunteerSkill',
     'MissionSkill', 
     'SustainableDevelopmentGoal',
     'VerificationRequest',
+    'VerificationStatusCounter',
+    'MissionVolunteerMatch',
 ]
\ No newline at end of file
@@ -0,0 +1,53 @@
+from django.db import models
+from apps.core.models import BaseModel
+
+
+class DocumentBlob(BaseModel):
+    """
+    A content-addressed verification document and how many fields use it.
+
+    One row per stored blob of ContentAddressedStorage. VerificationRequest
+    and VolunteerSkill document fields point at the same blob when the same
+    bytes are uploaded again; the blob file is deleted once no field
+    references it. Maintained from model signals by DocumentBlobService.
+
+    New blobs also queue up for post-processing (checksum check, metadata,
+    thumbnails and previews), done by DocumentProcessingService outside
+    the upload request.
+    """
+
+    class ProcessingStatus(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        PROCESSING = 'processing', 'Processing'
+        DONE = 'done', 'Done'
+        FAILED = 'failed', 'Failed'
+
+    name = models.CharField(max_length=255, unique=True)
+    sha256 = models.CharField(max_length=64, db_index=True)
+    size = models.PositiveBigIntegerField(default=0)
+    reference_count = models.PositiveIntegerField(default=0)
+
+    # Post-processing
+    processing_status = models.CharField(
+        max_length=20,
+        choices=ProcessingStatus.choices,
+        default=ProcessingStatus.PENDING
+    )
+    processing_expires_at = models.DateTimeField(null=True, blank=True)
+    processing_attempts = models.PositiveSmallIntegerField(default=0)
+    processing_error = models.TextField(blank=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    content_type = models.CharField(max_length=100, blank=True)
+    metadata = models.JSONField(default=dict, blank=True)
+    thumbnail = models.CharField(max_length=255, blank=True)
+    preview = models.CharField(max_length=255, blank=True)
+
+    class Meta:
+        db_table = 'document_blobs'
+        indexes = [
+            # Processing queue: oldest waiting blobs first
+            models.Index(fields=['processing_status', 'created_at'], name='document_blob_queue_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.reference_count} references)"
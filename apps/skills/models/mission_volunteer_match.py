@@ -0,0 +1,60 @@
+from django.db import models
+from apps.core.models import BaseModel
+
+
+class MissionVolunteerMatch(BaseModel):
+    """
+    Materialized skill match between a mission and a volunteer.
+
+    One row per (mission, volunteer) pair where the volunteer holds at least
+    one of the mission's skills. Scores are kept both for all skills and for
+    verified skills only, so searches never recompute them per request.
+    Rows are maintained by MissionMatchService from VolunteerSkill and
+    MissionSkill signals.
+    """
+    mission = models.ForeignKey(
+        'missions.Mission',
+        on_delete=models.CASCADE,
+        related_name='volunteer_matches'
+    )
+    volunteer = models.ForeignKey(
+        'accounts.VolunteerProfile',
+        on_delete=models.CASCADE,
+        related_name='mission_matches'
+    )
+
+    required_skills_total = models.PositiveIntegerField(default=0)
+    preferred_skills_total = models.PositiveIntegerField(default=0)
+
+    # Any verification status
+    required_skills_matched = models.PositiveIntegerField(default=0)
+    required_skills_missing = models.PositiveIntegerField(default=0)
+    preferred_skills_matched = models.PositiveIntegerField(default=0)
+    overall_score = models.FloatField(default=0.0)
+
+    # Verified skills only
+    verified_required_skills_matched = models.PositiveIntegerField(default=0)
+    verified_required_skills_missing = models.PositiveIntegerField(default=0)
+    verified_preferred_skills_matched = models.PositiveIntegerField(default=0)
+    verified_overall_score = models.FloatField(default=0.0)
+
+    class Meta:
+        db_table = 'mission_volunteer_matches'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['mission', 'volunteer'],
+                name='unique_mission_volunteer_match'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['mission', '-overall_score'], name='mvm_mission_score_idx'),
+            models.Index(fields=['mission', '-verified_overall_score'], name='mvm_mission_verified_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.mission_id} - {self.volunteer_id} ({self.overall_score})"
+
+    @property
+    def is_fully_qualified(self):
+        """Check if the volunteer has every required skill"""
+        return self.required_skills_missing == 0
@@ -1,5 +1,7 @@
 import uuid
 from django.db import models
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from apps.core.models import BaseModel
 from .skill_category import SkillCategory
 
@@ -15,9 +17,18 @@ class Skill(BaseModel):
     category = models.ForeignKey(SkillCategory, on_delete=models.PROTECT, related_name='skills')
     verification_requirement = models.CharField(max_length=20, choices=VerificationRequirement.choices, default=VerificationRequirement.NONE)
     is_active = models.BooleanField(default=True)
+    # Alternative names matched by autocomplete (e.g. 'JS' for JavaScript)
+    aliases = models.JSONField(default=list, blank=True)
+    # Weighted name/description document, maintained on PostgreSQL only
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         db_table = 'skills'
+        indexes = [
+            # Full-text matches on the stored vector, trigram matches on the name
+            GinIndex(fields=['search_vector'], name='skills_search_vector_gin'),
+            GinIndex(OpClass('name', name='gin_trgm_ops'), name='skills_name_trgm'),
+        ]
 
     def __str__(self):
         return self.name
\ No newline at end of file
@@ -1,15 +1,24 @@
 import uuid
 from django.db import models
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from apps.core.models import BaseModel
 
 class SkillCategory(BaseModel):
     name = models.CharField(max_length=100, unique=True)
     description = models.TextField(blank=True, null=True)
     parent_category = models.ForeignKey('self', on_delete=models.CASCADE, blank=True, null=True, related_name='subcategories')
+    # Weighted name/description document, maintained on PostgreSQL only
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         db_table = 'skill_categories'
         verbose_name_plural = 'Skill categories'
+        indexes = [
+            # Full-text matches on the stored vector, trigram matches on the name
+            GinIndex(fields=['search_vector'], name='skill_categories_search_gin'),
+            GinIndex(OpClass('name', name='gin_trgm_ops'), name='skill_categories_name_trgm'),
+        ]
 
     def __str__(self):
         return self.name
\ No newline at end of file
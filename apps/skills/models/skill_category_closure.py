@@ -0,0 +1,40 @@
+from django.db import models
+from apps.core.models import BaseModel
+from .skill_category import SkillCategory
+
+
+class SkillCategoryClosure(BaseModel):
+    """
+    Closure table of the SkillCategory hierarchy.
+
+    Holds one row per (ancestor, descendant) pair, including each category
+    paired with itself at depth 0, so ancestor paths, subtrees and cycle
+    checks are single indexed lookups instead of one query per level.
+    Rows are maintained by SkillCategoryService from SkillCategory signals.
+    """
+    ancestor = models.ForeignKey(
+        SkillCategory,
+        on_delete=models.CASCADE,
+        related_name='descendant_links'
+    )
+    descendant = models.ForeignKey(
+        SkillCategory,
+        on_delete=models.CASCADE,
+        related_name='ancestor_links'
+    )
+    depth = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = 'skill_category_closure'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['ancestor', 'descendant'],
+                name='unique_skill_category_closure'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['descendant', 'depth'], name='scc_descendant_depth_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.ancestor_id} -> {self.descendant_id} ({self.depth})"
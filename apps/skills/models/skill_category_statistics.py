@@ -0,0 +1,36 @@
+from django.db import models
+from apps.core.models import BaseModel
+from .skill_category import SkillCategory
+
+
+class SkillCategoryStatistics(BaseModel):
+    """
+    Precomputed statistics of a skill category for admin dashboards.
+
+    "total_*" fields count the category itself, "subtree_*" fields roll up
+    the category and all of its descendant subcategories. Refreshed by the
+    refresh_category_statistics management command (run nightly).
+    """
+    category = models.OneToOneField(
+        SkillCategory,
+        on_delete=models.CASCADE,
+        related_name='statistics'
+    )
+
+    total_skills = models.PositiveIntegerField(default=0)
+    total_subcategories = models.PositiveIntegerField(default=0)
+    total_volunteers = models.PositiveIntegerField(default=0)
+
+    subtree_skills = models.PositiveIntegerField(default=0)
+    subtree_subcategories = models.PositiveIntegerField(default=0)
+    subtree_volunteers = models.PositiveIntegerField(default=0)
+
+    depth_level = models.PositiveIntegerField(default=1)
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'skill_category_statistics'
+        verbose_name_plural = 'Skill category statistics'
+
+    def __str__(self):
+        return f"{self.category_id} ({self.computed_at})"
@@ -0,0 +1,43 @@
+from django.db import models
+from apps.core.models import BaseModel
+from .skill import Skill
+
+
+class SkillCooccurrence(BaseModel):
+    """
+    Precomputed "volunteers who have skill also have related_skill" pairs.
+
+    Holds the top-k related skills of each skill from the volunteer skill
+    co-occurrence matrix, ranked by cosine similarity of the skills'
+    volunteer sets. Rebuilt by the rebuild_skill_cooccurrence management
+    command (run periodically).
+    """
+    skill = models.ForeignKey(
+        Skill,
+        on_delete=models.CASCADE,
+        related_name='cooccurrences'
+    )
+    related_skill = models.ForeignKey(
+        Skill,
+        on_delete=models.CASCADE,
+        related_name='+'
+    )
+    volunteer_count = models.PositiveIntegerField(default=0)
+    score = models.FloatField(default=0)
+    rank = models.PositiveSmallIntegerField(default=0)
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'skill_cooccurrences'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['skill', 'related_skill'],
+                name='unique_skill_cooccurrence'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['skill', 'rank'], name='skill_cooc_skill_rank_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.skill_id} -> {self.related_skill_id} ({self.score:.3f})"
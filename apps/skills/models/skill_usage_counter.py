@@ -0,0 +1,41 @@
+from django.db import models
+from apps.core.models import BaseModel
+from .skill import Skill
+
+
+class SkillUsageCounter(BaseModel):
+    """
+    Denormalized usage counts of a skill.
+
+    Volunteers are counted per verification status and missions per
+    requirement level, plus totals. Kept up to date with F-expression
+    updates from VolunteerSkill/MissionSkill signals, in the same
+    transaction as the write, and repaired by the
+    reconcile_skill_usage_counters management command.
+    """
+    skill = models.OneToOneField(
+        Skill,
+        on_delete=models.CASCADE,
+        related_name='usage'
+    )
+
+    volunteer_count = models.PositiveIntegerField(default=0)
+    volunteers_pending = models.PositiveIntegerField(default=0)
+    volunteers_verified = models.PositiveIntegerField(default=0)
+    volunteers_rejected = models.PositiveIntegerField(default=0)
+    volunteers_not_required = models.PositiveIntegerField(default=0)
+
+    mission_count = models.PositiveIntegerField(default=0)
+    missions_nice_to_have = models.PositiveIntegerField(default=0)
+    missions_preferred = models.PositiveIntegerField(default=0)
+    missions_required = models.PositiveIntegerField(default=0)
+    missions_critical = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = 'skill_usage_counters'
+        indexes = [
+            models.Index(fields=['-volunteer_count'], name='skill_usage_volunteers_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.skill_id}: {self.volunteer_count} volunteers, {self.mission_count} missions"
@@ -1,37 +1,55 @@
 import uuid
 from django.db import models
+from django.utils import timezone
 from apps.core.models import BaseModel
+from apps.core.storage import get_document_storage
 from apps.core.constants import SkillVerificationStatus
 from .volunteer_skill import VolunteerSkill
 
 class VerificationRequest(BaseModel):
     """Track verification requests and their status"""
+    REVIEW_STATUS_CHOICES = [
+        ('pending', 'Pending Review'),
+        ('under_review', 'Under Review'),
+        ('approved', 'Approved'),
+        ('rejected', 'Rejected'),
+        ('needs_more_info', 'Needs More Information'),
+    ]
+    
     volunteer_skill = models.ForeignKey(VolunteerSkill, on_delete=models.CASCADE, related_name='verification_requests')
     request_date = models.DateTimeField(auto_now_add=True)
-    request_documents = models.FileField(upload_to='verification_requests/', blank=True, null=True)
+    request_documents = models.FileField(upload_to='verification_requests/', storage=get_document_storage, blank=True, null=True)
     request_links = models.JSONField(default=list, blank=True)
     request_notes = models.TextField(blank=True)
     
     # Admin review fields
     reviewed_by = models.ForeignKey('accounts.User', on_delete=models.SET_NULL, null=True, blank=True, related_name='reviewed_verifications')
     review_date = models.DateTimeField(null=True, blank=True)
-    review_status = models.CharField(max_length=20, choices=[
-        ('pending', 'Pending Review'),
-        ('under_review', 'Under Review'),
-        ('approved', 'Approved'),
-        ('rejected', 'Rejected'),
-        ('needs_more_info', 'Needs More Information'),
-    ], default='pending')
+    review_status = models.CharField(max_length=20, choices=REVIEW_STATUS_CHOICES, default='pending')
     review_notes = models.TextField(blank=True)
     admin_notes = models.TextField(blank=True)  # Internal notes
     
+    # Review queue claim, held until claim_expires_at
+    claimed_by = models.ForeignKey('accounts.User', on_delete=models.SET_NULL, null=True, blank=True, related_name='claimed_verifications')
+    claim_expires_at = models.DateTimeField(null=True, blank=True)
+    
     class Meta:
         db_table = 'verification_requests'
         ordering = ['-request_date']
+        indexes = [
+            # Review queue: open requests oldest first
+            models.Index(fields=['review_status', 'request_date'], name='verif_req_queue_idx'),
+        ]
 
     def __str__(self):
         return f"Verification Request for {self.volunteer_skill}"
     
+    def is_claimed_by_other(self, reviewer_id, now=None):
+        """Whether another reviewer holds an unexpired claim on this request"""
+        if self.claimed_by_id is None or str(self.claimed_by_id) == str(reviewer_id):
+            return False
+        return self.claim_expires_at is not None and self.claim_expires_at > (now or timezone.now())
+    
     @property
     def volunteer(self):
         return self.volunteer_skill.volunteer
@@ -0,0 +1,27 @@
+from django.db import models
+from apps.core.models import BaseModel
+from .verification_request import VerificationRequest
+
+
+class VerificationStatusCounter(BaseModel):
+    """
+    Number of verification requests in each review status.
+
+    One row per status, moved with F-expression updates in the same
+    transaction as every request write (signals, plus the claim, release
+    and bulk review updates), so admin statistics read five rows instead
+    of counting the requests table. Repaired by the
+    reconcile_verification_status_counters management command.
+    """
+    review_status = models.CharField(
+        max_length=20,
+        choices=VerificationRequest.REVIEW_STATUS_CHOICES,
+        unique=True
+    )
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = 'verification_status_counters'
+
+    def __str__(self):
+        return f"{self.review_status}: {self.count}"
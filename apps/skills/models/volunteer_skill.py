@@ -1,6 +1,7 @@
 import uuid
 from django.db import models
 from apps.core.models import BaseModel
+from apps.core.storage import get_document_storage
 from apps.core.constants import SkillVerificationStatus, ProficiencyLevel
 from apps.accounts.models import VolunteerProfile
 from .skill import Skill
@@ -19,11 +20,11 @@ class VolunteerSkill(BaseModel):
     # Verification request fields
     verification_requested = models.BooleanField(default=False)
     verification_request_date = models.DateTimeField(blank=True, null=True)
-    verification_documents = models.FileField(upload_to='skill_verification_docs/', blank=True, null=True)
+    verification_documents = models.FileField(upload_to='skill_verification_docs/', storage=get_document_storage, blank=True, null=True)
     verification_links = models.JSONField(default=list, blank=True)  # Store multiple URLs
     
     # Original fields
-    supporting_document = models.FileField(upload_to='skill_verifications/', blank=True, null=True)
+    supporting_document = models.FileField(upload_to='skill_verifications/', storage=get_document_storage, blank=True, null=True)
     supporting_url = models.URLField(blank=True, null=True)
     
     last_used_date = models.DateField(blank=True, null=True)
@@ -11,7 +11,6 @@ from .skill_category_serializer import (
     SkillCategoryDetailSerializer,
     SkillCategoryCreateSerializer,
     SkillCategoryUpdateSerializer,
-    SkillCategoryTreeSerializer,
     SkillCategoryPathSerializer,
     SkillCategoryStatisticsSerializer,
     SkillCategoryMinimalSerializer,
@@ -25,6 +24,7 @@ from .skill_serializer import (
     SkillUpdateSerializer,
     SkillMinimalSerializer,
     SkillStatisticsSerializer,
+    SkillAutocompleteSerializer,
 )
 
 # Volunteer Skill Serializers
@@ -39,8 +39,12 @@ from .volunteer_skill_serializer import (
     SkillRequirementCheckSerializer,
     VerificationRequestCreateSerializer,
     VerificationRequestReviewSerializer,
+    VerificationRequestBulkReviewSerializer,
+    VerificationRequestClaimSerializer,
+    VerificationRequestReleaseSerializer,
     VerificationRequestMinimalSerializer,
     VerificationRequestSerializer,
+    VerificationRequestStatisticsSerializer,
 )
 
 # Mission Skill Serializers
@@ -59,6 +63,9 @@ from .mission_skill_serializer import (
 from .volunteer_search_serializer import (
     VolunteerSearchResultSerializer,
     VolunteerSkillMatchSerializer,
+    VolunteerProximityMatchSerializer,
+    MissionVolunteerMatchesSerializer,
+    MissionRecommendationSerializer,
 )
 
 __all__ = [
@@ -67,7 +74,6 @@ __all__ = [
     'SkillCategoryDetailSerializer',
     'SkillCategoryCreateSerializer',
     'SkillCategoryUpdateSerializer',
-    'SkillCategoryTreeSerializer',
     'SkillCategoryPathSerializer',
     'SkillCategoryStatisticsSerializer',
     'SkillCategoryMinimalSerializer',
@@ -79,6 +85,7 @@ __all__ = [
     'SkillUpdateSerializer',
     'SkillMinimalSerializer',
     'SkillStatisticsSerializer',
+    'SkillAutocompleteSerializer',
     
     # Volunteer Skill
     'VolunteerSkillListSerializer',
@@ -91,8 +98,12 @@ __all__ = [
     'SkillRequirementCheckSerializer',
     'VerificationRequestCreateSerializer',
     'VerificationRequestReviewSerializer',
+    'VerificationRequestBulkReviewSerializer',
+    'VerificationRequestClaimSerializer',
+    'VerificationRequestReleaseSerializer',
     'VerificationRequestMinimalSerializer',
     'VerificationRequestSerializer',
+    'VerificationRequestStatisticsSerializer',
     
     # Mission Skill
     'MissionSkillListSerializer',
@@ -107,4 +118,7 @@ __all__ = [
     # Volunteer Search
     'VolunteerSearchResultSerializer',
     'VolunteerSkillMatchSerializer',
+    'VolunteerProximityMatchSerializer',
+    'MissionVolunteerMatchesSerializer',
+    'MissionRecommendationSerializer',
 ]
\ No newline at end of file
@@ -1,6 +1,7 @@
 
 from rest_framework import serializers
 from ..models import SkillCategory
+from ..services.skill_category_service import SkillCategoryService
 
 
 class SkillCategoryListSerializer(serializers.ModelSerializer):
@@ -146,27 +147,14 @@ class SkillCategoryUpdateSerializer(serializers.ModelSerializer):
             )
         
         # Check for circular reference
-        current = value
-        while current:
-            if self.instance and current.id == self.instance.id:
-                raise serializers.ValidationError(
-                    "Cannot set parent: would create circular reference."
-                )
-            current = current.parent_category
+        if self.instance and SkillCategoryService.would_create_cycle(self.instance, value):
+            raise serializers.ValidationError(
+                "Cannot set parent: would create circular reference."
+            )
         
         return value
 
 
-class SkillCategoryTreeSerializer(serializers.Serializer):
-    
-    
-    id = serializers.UUIDField()
-    name = serializers.CharField()
-    description = serializers.CharField(allow_null=True)
-    skills_count = serializers.IntegerField()
-    subcategories = serializers.ListField(child=serializers.DictField())
-
-
 class SkillCategoryPathSerializer(serializers.Serializer):
    
     
@@ -182,7 +170,11 @@ class SkillCategoryStatisticsSerializer(serializers.Serializer):
     total_skills = serializers.IntegerField()
     total_subcategories = serializers.IntegerField()
     total_volunteers = serializers.IntegerField()
+    subtree_skills = serializers.IntegerField()
+    subtree_subcategories = serializers.IntegerField()
+    subtree_volunteers = serializers.IntegerField()
     depth_level = serializers.IntegerField()
+    computed_at = serializers.DateTimeField(allow_null=True)
 
 
 class SkillCategoryMinimalSerializer(serializers.ModelSerializer):
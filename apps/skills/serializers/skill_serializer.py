@@ -3,6 +3,12 @@ from rest_framework import serializers
 from ..models import Skill, SkillCategory
 
 
+def _clean_aliases(value):
+    if not isinstance(value, list) or not all(isinstance(alias, str) for alias in value):
+        raise serializers.ValidationError("Aliases must be a list of strings.")
+    return list(dict.fromkeys(alias.strip() for alias in value if alias.strip()))
+
+
 class SkillCategoryMinimalSerializer(serializers.ModelSerializer):
   
     
@@ -31,6 +37,7 @@ class SkillListSerializer(serializers.ModelSerializer):
             'verification_requirement',
             'verification_requirement_display',
             'is_active',
+            'aliases',
             'created_at',
             'updated_at'
         ]
@@ -45,8 +52,8 @@ class SkillDetailSerializer(serializers.ModelSerializer):
         source='get_verification_requirement_display',
         read_only=True
     )
-    volunteer_count = serializers.IntegerField(read_only=True)
-    mission_count = serializers.IntegerField(read_only=True)
+    volunteer_count = serializers.SerializerMethodField()
+    mission_count = serializers.SerializerMethodField()
     
     class Meta:
         model = Skill
@@ -58,6 +65,7 @@ class SkillDetailSerializer(serializers.ModelSerializer):
             'verification_requirement',
             'verification_requirement_display',
             'is_active',
+            'aliases',
             'volunteer_count',
             'mission_count',
             'created_at',
@@ -65,6 +73,16 @@ class SkillDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'volunteer_count', 'mission_count']
 
+    def get_volunteer_count(self, obj):
+        """Volunteers with this skill (0 before the first usage is counted)"""
+        usage = getattr(obj, 'usage', None)
+        return usage.volunteer_count if usage else 0
+
+    def get_mission_count(self, obj):
+        """Missions requiring this skill (0 before the first usage is counted)"""
+        usage = getattr(obj, 'usage', None)
+        return usage.mission_count if usage else 0
+
 
 class SkillCreateSerializer(serializers.ModelSerializer):
    
@@ -76,7 +94,8 @@ class SkillCreateSerializer(serializers.ModelSerializer):
             'description',
             'category',
             'verification_requirement',
-            'is_active'
+            'is_active',
+            'aliases'
         ]
     
     def validate_name(self, value):
@@ -93,6 +112,10 @@ class SkillCreateSerializer(serializers.ModelSerializer):
         if not SkillCategory.objects.filter(id=value.id).exists():
             raise serializers.ValidationError("Category not found.")
         return value
+    
+    def validate_aliases(self, value):
+        """Keep aliases as unique, non-empty strings"""
+        return _clean_aliases(value)
 
 
 class SkillUpdateSerializer(serializers.ModelSerializer):
@@ -105,7 +128,8 @@ class SkillUpdateSerializer(serializers.ModelSerializer):
             'description',
             'category',
             'verification_requirement',
-            'is_active'
+            'is_active',
+            'aliases'
         ]
     
     def validate_name(self, value):
@@ -118,6 +142,10 @@ class SkillUpdateSerializer(serializers.ModelSerializer):
                 f"Skill with name '{name}' already exists."
             )
         return name
+    
+    def validate_aliases(self, value):
+        """Keep aliases as unique, non-empty strings"""
+        return _clean_aliases(value)
 
 
 class SkillMinimalSerializer(serializers.ModelSerializer):
@@ -140,4 +168,15 @@ class SkillStatisticsSerializer(serializers.Serializer):
     total_volunteers = serializers.IntegerField()
     verification_breakdown = serializers.DictField()
     total_missions = serializers.IntegerField()
-    requirement_breakdown = serializers.DictField()
\ No newline at end of file
+    requirement_breakdown = serializers.DictField()
+
+
+class SkillAutocompleteSerializer(serializers.Serializer):
+    
+    
+    id = serializers.UUIDField()
+    name = serializers.CharField()
+    category_id = serializers.UUIDField()
+    category_name = serializers.CharField()
+    volunteer_count = serializers.IntegerField()
+    matched_alias = serializers.BooleanField()
@@ -14,7 +14,6 @@ class MatchedSkillSerializer(serializers.Serializer):
     proficiency_display = serializers.CharField()
     verification_status = serializers.CharField()
     verification_display = serializers.CharField()
-    years_of_experience = serializers.FloatField()
     is_primary = serializers.BooleanField()
 
 
@@ -55,4 +54,30 @@ class VolunteerSkillMatchSerializer(serializers.Serializer):
     total_required_skills = serializers.IntegerField()
     match_percentage = serializers.FloatField()
     matched_skills = MatchedSkillSerializer(many=True)
-    mission_match = MissionMatchSerializer()
\ No newline at end of file
+    mission_match = MissionMatchSerializer()
+
+
+class VolunteerProximityMatchSerializer(VolunteerSkillMatchSerializer):
+    """Serializer for volunteer with mission match score and distance"""
+    distance_km = serializers.FloatField()
+
+
+class MissionVolunteerMatchesSerializer(serializers.Serializer):
+    """Serializer for ranked volunteers of one mission in a batch search"""
+    mission_id = serializers.UUIDField()
+    count = serializers.IntegerField()
+    volunteers = VolunteerSkillMatchSerializer(many=True)
+
+
+class MissionRecommendationSerializer(serializers.Serializer):
+    """Serializer for a mission recommended to a volunteer"""
+    mission_id = serializers.UUIDField()
+    title = serializers.CharField()
+    organization_name = serializers.CharField()
+    mission_type = serializers.CharField()
+    wilaya = serializers.CharField(allow_null=True, allow_blank=True)
+    start_date = serializers.DateTimeField()
+    end_date = serializers.DateTimeField()
+    application_deadline = serializers.DateTimeField()
+    is_featured = serializers.BooleanField()
+    mission_match = MissionMatchSerializer()
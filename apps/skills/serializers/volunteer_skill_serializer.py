@@ -1,6 +1,8 @@
+from django.core.files.storage import default_storage
 from rest_framework import serializers
 from ..models import VolunteerSkill, Skill, VerificationRequest
 from apps.core.constants import SkillVerificationStatus, ProficiencyLevel
+from apps.core.storage import document_storage
 
 
 class SkillMinimalSerializer(serializers.ModelSerializer):
@@ -260,6 +262,55 @@ class VerificationRequestReviewSerializer(serializers.Serializer):
     )
 
 
+class VerificationRequestBulkReviewSerializer(serializers.Serializer):
+    """Serializer for reviewing many verification requests with one decision"""
+    
+    verification_request_ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=1000
+    )
+    review_status = serializers.ChoiceField(
+        choices=[
+            ('approved', 'Approved'),
+            ('rejected', 'Rejected'),
+            ('needs_more_info', 'Needs More Information'),
+            ('under_review', 'Under Review')
+        ]
+    )
+    review_notes = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        max_length=1000
+    )
+    admin_notes = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        max_length=1000
+    )
+
+
+class VerificationRequestClaimSerializer(serializers.Serializer):
+    """Serializer for claiming verification requests from the review queue"""
+    
+    limit = serializers.IntegerField(
+        required=False,
+        default=10,
+        min_value=1,
+        max_value=50
+    )
+
+
+class VerificationRequestReleaseSerializer(serializers.Serializer):
+    """Serializer for releasing claimed verification requests"""
+    
+    verification_request_ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        required=False,
+        allow_empty=False
+    )
+
+
 class VerificationRequestMinimalSerializer(serializers.ModelSerializer):
     """Minimal serializer for verification requests"""
     
@@ -292,6 +343,9 @@ class VerificationRequestSerializer(serializers.ModelSerializer):
     skill_name = serializers.CharField(source='volunteer_skill.skill.name', read_only=True)
     skill_category = serializers.CharField(source='volunteer_skill.skill.category.name', read_only=True)
     reviewed_by_name = serializers.CharField(source='reviewed_by.get_full_name', read_only=True, allow_null=True)
+    request_documents_sha256 = serializers.SerializerMethodField()
+    request_documents_thumbnail = serializers.SerializerMethodField()
+    request_documents_preview = serializers.SerializerMethodField()
     
     class Meta:
         model = VerificationRequest
@@ -304,6 +358,9 @@ class VerificationRequestSerializer(serializers.ModelSerializer):
             'skill_category',
             'request_date',
             'request_documents',
+            'request_documents_sha256',
+            'request_documents_thumbnail',
+            'request_documents_preview',
             'request_links',
             'request_notes',
             'review_status',
@@ -312,10 +369,37 @@ class VerificationRequestSerializer(serializers.ModelSerializer):
             'reviewed_by_name',
             'review_notes',
             'admin_notes',
+            'claimed_by',
+            'claim_expires_at',
             'created_at',
             'updated_at'
         ]
         read_only_fields = fields
+    
+    def get_request_documents_sha256(self, obj):
+        """Content hash of the document; equal hashes mean the same file was resubmitted"""
+        return document_storage.digest_of(obj.request_documents.name)
+    
+    def get_request_documents_thumbnail(self, obj):
+        """Thumbnail URL, once the document is processed (see VerificationService.with_document_previews)"""
+        name = getattr(obj, 'document_thumbnail', None)
+        return default_storage.url(name) if name else None
+    
+    def get_request_documents_preview(self, obj):
+        """Downscaled first-page preview URL, once the document is processed"""
+        name = getattr(obj, 'document_preview', None)
+        return default_storage.url(name) if name else None
+
+
+class VerificationRequestStatisticsSerializer(serializers.Serializer):
+    """Serializer for verification request statistics"""
+    
+    total_requests = serializers.IntegerField()
+    pending_review = serializers.IntegerField()
+    under_review = serializers.IntegerField()
+    approved = serializers.IntegerField()
+    rejected = serializers.IntegerField()
+    needs_more_info = serializers.IntegerField()
 
 
 class VolunteerSkillStatisticsSerializer(serializers.Serializer):
@@ -7,6 +7,12 @@ from .volunteer_skill_service import VolunteerSkillService
 from .mission_skill_service import MissionSkillService
 from .volunteer_search_service import VolunteerSearchService
 from .verification_service import VerificationService
+from .mission_match_service import MissionMatchService
+from .mission_recommendation_service import MissionRecommendationService
+from .skill_cooccurrence_service import SkillCooccurrenceService
+from .skill_usage_service import SkillUsageService
+from .document_blob_service import DocumentBlobService
+from .document_processing_service import DocumentProcessingService
 
 __all__ = [
     'SkillCategoryService',
@@ -15,4 +21,10 @@ __all__ = [
     'MissionSkillService',
     'VolunteerSearchService',
     'VerificationService',
+    'MissionMatchService',
+    'MissionRecommendationService',
+    'SkillCooccurrenceService',
+    'SkillUsageService',
+    'DocumentBlobService',
+    'DocumentProcessingService',
 ]
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""
+Change Log Index
+Base for in-process indexes kept in step across worker processes
+"""
+import threading
+from typing import Any, List, Optional
+
+from django.core.cache import cache
+
+
+class ChangeLogIndex:
+    """
+    Base class for in-process indexes shared by several worker processes.
+
+    Every write is published to a change log in the shared cache: the
+    generation counter is incremented and the change is stored under the
+    new generation. A process that finds the shared generation ahead of
+    its own replays the changes it missed, in order, so a write in one
+    worker costs the others one cache round trip instead of a rebuild.
+    The index is only rebuilt from the database when the changes needed
+    are missing (expired, evicted, or not stored yet by their writer) or
+    when it is more than MAX_REPLAY changes behind.
+
+    Subclasses set GENERATION_CACHE_KEY and implement _load_state(),
+    _set_state() and _apply_changes().
+    """
+
+    GENERATION_CACHE_KEY = None
+    CHANGE_TIMEOUT = 3600
+    MAX_REPLAY = 1000
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._built = False
+        self._generation: Optional[int] = None
+
+    # ============ Subclass hooks ============
+
+    def _load_state(self) -> Any:
+        """Read the whole index from the database"""
+        raise NotImplementedError
+
+    def _set_state(self, state: Any) -> None:
+        """Install a freshly loaded index (called under the lock)"""
+        raise NotImplementedError
+
+    def _apply_changes(self, changes: List[Any]) -> None:
+        """Apply published changes in order (called under the lock)"""
+        raise NotImplementedError
+
+    # ============ Build / Sync ============
+
+    def rebuild(self) -> None:
+        """Rebuild the whole index from the database"""
+        # Read the generation before the scan: a write committed while the
+        # scan runs is then replayed from the log instead of being missed
+        generation = cache.get(self.GENERATION_CACHE_KEY, 0)
+        state = self._load_state()
+
+        with self._lock:
+            self._set_state(state)
+            self._generation = generation
+            self._built = True
+
+    def ensure_built(self) -> None:
+        """Build the index if missing, or replay changes made by other processes"""
+        shared_generation = cache.get(self.GENERATION_CACHE_KEY, 0)
+        if not self._built or not self._catch_up(shared_generation):
+            self.rebuild()
+
+    def _publish(self, change: Any) -> None:
+        """Publish a change to every process, applying it here in log order"""
+        cache.add(self.GENERATION_CACHE_KEY, 0, timeout=None)
+        try:
+            generation = cache.incr(self.GENERATION_CACHE_KEY)
+        except ValueError:
+            # Evicted between add and incr; rebuild on next use
+            self._built = False
+            return
+
+        cache.set(self._change_key(generation), change, timeout=self.CHANGE_TIMEOUT)
+        if self._built and not self._catch_up(generation):
+            self._built = False
+
+    def _catch_up(self, generation: int) -> bool:
+        """
+        Replay logged changes up to a generation
+
+        Returns:
+            False if the index has to be rebuilt instead
+        """
+        with self._lock:
+            if not self._built or self._generation is None:
+                return False
+            behind = generation - self._generation
+            if behind == 0:
+                return True
+            if behind < 0 or behind > self.MAX_REPLAY:
+                # The counter was reset, or too much to replay
+                return False
+
+            keys = [
+                self._change_key(missed)
+                for missed in range(self._generation + 1, generation + 1)
+            ]
+            changes = cache.get_many(keys)
+            if len(changes) != len(keys):
+                return False
+
+            self._apply_changes([changes[key] for key in keys])
+            self._generation = generation
+            return True
+
+    def _change_key(self, generation: int) -> str:
+        return f'{self.GENERATION_CACHE_KEY}:change:{generation}'
@@ -0,0 +1,129 @@
+"""
+Document Blob Service
+Reference counts content-addressed verification documents across fields
+"""
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+from ..models import DocumentBlob, VerificationRequest, VolunteerSkill
+from apps.core.storage import document_storage
+from .document_processing_service import DocumentProcessingService
+
+
+class DocumentBlobService:
+    """Service for document blob reference counts"""
+
+    DOCUMENT_FIELDS = {
+        VolunteerSkill: ('verification_documents', 'supporting_document'),
+        VerificationRequest: ('request_documents',),
+    }
+
+    @staticmethod
+    def document_names(values: Iterable[Optional[str]]) -> List[str]:
+        """Keep the names of content-addressed blobs (skips empty and legacy files)"""
+        return [
+            str(value) for value in values
+            if value and document_storage.digest_of(str(value))
+        ]
+
+    @staticmethod
+    def instance_document_names(instance) -> List[str]:
+        """Blob names referenced by a model instance's document fields"""
+        fields = DocumentBlobService.DOCUMENT_FIELDS[type(instance)]
+        return DocumentBlobService.document_names(
+            getattr(instance, field).name for field in fields
+        )
+
+    @staticmethod
+    def move_references(old_names: Iterable[str], new_names: Iterable[str]) -> None:
+        """
+        Move references from old to new blobs (in the same transaction as the write)
+
+        Blobs left without references are deleted after commit.
+        """
+        deltas = Counter(new_names)
+        deltas.subtract(old_names)
+        for name, delta in deltas.items():
+            if delta > 0:
+                DocumentBlobService._add_references(name, delta)
+            elif delta < 0:
+                DocumentBlobService._release_references(name, -delta)
+
+    @staticmethod
+    def _add_references(name: str, count: int) -> None:
+        updated = DocumentBlob.objects.filter(name=name).update(
+            reference_count=F('reference_count') + count
+        )
+        if not updated:
+            # First reference: create the row, then add so concurrent first
+            # references cannot overwrite each other
+            _, created = DocumentBlob.objects.get_or_create(
+                name=name,
+                defaults={
+                    'sha256': document_storage.digest_of(name),
+                    'size': document_storage.size(name) if document_storage.exists(name) else 0,
+                }
+            )
+            DocumentBlob.objects.filter(name=name).update(
+                reference_count=F('reference_count') + count
+            )
+            if created:
+                # New blobs start out pending post-processing
+                transaction.on_commit(DocumentProcessingService.enqueue)
+
+    @staticmethod
+    def _release_references(name: str, count: int) -> None:
+        DocumentBlob.objects.filter(name=name).update(
+            reference_count=Greatest(F('reference_count') - count, 0)
+        )
+        transaction.on_commit(lambda: DocumentBlobService._delete_if_unreferenced(name))
+
+    @staticmethod
+    def _delete_if_unreferenced(name: str) -> None:
+        unreferenced = DocumentBlob.objects.filter(name=name, reference_count=0)
+        derivatives = unreferenced.values_list('thumbnail', 'preview').first()
+        # Conditional delete: a reference added since the release keeps the blob
+        deleted, _ = unreferenced.delete()
+        if deleted:
+            document_storage.delete(name)
+            DocumentProcessingService.delete_derivatives(derivatives or [])
+
+    # ============ Reconciliation ============
+
+    @staticmethod
+    @transaction.atomic
+    def reconcile() -> int:
+        """
+        Recount every blob's references from the document fields
+
+        Returns:
+            Number of blobs whose stored reference count was wrong
+        """
+        fresh: Dict[str, int] = Counter()
+        for model, fields in DocumentBlobService.DOCUMENT_FIELDS.items():
+            for field in fields:
+                names = model.objects.exclude(
+                    **{f'{field}__isnull': True}
+                ).exclude(
+                    **{field: ''}
+                ).values_list(field, flat=True).iterator(chunk_size=5000)
+                fresh.update(DocumentBlobService.document_names(names))
+
+        stored = dict(DocumentBlob.objects.values_list('name', 'reference_count'))
+        drifted = [name for name in fresh.keys() | stored.keys() if fresh.get(name, 0) != stored.get(name)]
+
+        for name in drifted:
+            count = fresh.get(name, 0)
+            if name in stored:
+                DocumentBlob.objects.filter(name=name).update(reference_count=count)
+            else:
+                DocumentBlobService._add_references(name, count)
+            if not count:
+                transaction.on_commit(
+                    lambda name=name: DocumentBlobService._delete_if_unreferenced(name)
+                )
+        return len(drifted)
@@ -0,0 +1,253 @@
+"""
+Document Processing Service
+Post-processes uploaded verification documents outside the upload request
+"""
+import hashlib
+import io
+import logging
+import mimetypes
+import threading
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from ..models import DocumentBlob
+from apps.core.storage import document_storage
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentProcessingService:
+    """
+    Service for the document post-processing queue.
+
+    The queue is the document_blobs table: every new blob starts out pending.
+    Workers (the process_documents command, or a background thread when
+    SKILLS_DOCUMENT_PROCESSING_IN_PROCESS is set) claim batches with
+    SELECT ... FOR UPDATE SKIP LOCKED under a lease, so a crashed worker's
+    blobs are picked up again once the lease expires. Blobs are shared by
+    identical uploads, so each distinct file is processed once.
+    """
+
+    THUMBNAIL_SIZE = (256, 256)
+    PREVIEW_SIZE = (1024, 1024)
+    DERIVATIVE_PREFIX = 'document_previews'
+    MAX_ATTEMPTS = 3
+    BATCH_SIZE = 10
+    CHUNK_SIZE = 64 * 1024
+
+    # ============ Queue ============
+
+    @staticmethod
+    def claim_blobs(
+        limit: int = BATCH_SIZE,
+        lease_seconds: Optional[int] = None
+    ) -> List[DocumentBlob]:
+        """Claim the oldest blobs waiting for processing (or whose lease lapsed)"""
+        if lease_seconds is None:
+            lease_seconds = getattr(settings, 'SKILLS_DOCUMENT_PROCESSING_LEASE_SECONDS', 300)
+
+        now = timezone.now()
+        with transaction.atomic():
+            claimed_ids = list(
+                DocumentBlob.objects.select_for_update(
+                    skip_locked=True
+                ).filter(
+                    Q(processing_status=DocumentBlob.ProcessingStatus.PENDING)
+                    | Q(
+                        processing_status=DocumentBlob.ProcessingStatus.PROCESSING,
+                        processing_expires_at__lte=now
+                    )
+                ).order_by('created_at', 'id').values_list('id', flat=True)[:limit]
+            )
+            DocumentBlob.objects.filter(id__in=claimed_ids).update(
+                processing_status=DocumentBlob.ProcessingStatus.PROCESSING,
+                processing_expires_at=now + timedelta(seconds=lease_seconds),
+                processing_attempts=F('processing_attempts') + 1,
+                updated_at=now
+            )
+
+        return list(DocumentBlob.objects.filter(id__in=claimed_ids).order_by('created_at', 'id'))
+
+    @staticmethod
+    def process_pending(limit: int = BATCH_SIZE) -> int:
+        """
+        Claim and process one batch of blobs
+
+        Returns:
+            Number of blobs processed (successfully or not)
+        """
+        blobs = DocumentProcessingService.claim_blobs(limit)
+        for blob in blobs:
+            DocumentProcessingService.process_blob(blob)
+        return len(blobs)
+
+    @staticmethod
+    def process_blob(blob: DocumentBlob) -> bool:
+        """
+        Verify the checksum, extract metadata and render previews of a claimed blob
+
+        Returns:
+            True if the blob was processed
+        """
+        try:
+            content_type, metadata, derivatives = DocumentProcessingService._analyze(blob)
+        except Exception as e:
+            logger.warning("Processing document %s failed: %s", blob.name, e)
+            DocumentBlob.objects.filter(
+                id=blob.id,
+                processing_status=DocumentBlob.ProcessingStatus.PROCESSING
+            ).update(
+                processing_status=(
+                    DocumentBlob.ProcessingStatus.FAILED
+                    if blob.processing_attempts >= DocumentProcessingService.MAX_ATTEMPTS
+                    else DocumentBlob.ProcessingStatus.PENDING
+                ),
+                processing_expires_at=None,
+                processing_error=str(e),
+                updated_at=timezone.now()
+            )
+            return False
+
+        now = timezone.now()
+        updated = DocumentBlob.objects.filter(
+            id=blob.id,
+            processing_status=DocumentBlob.ProcessingStatus.PROCESSING
+        ).update(
+            processing_status=DocumentBlob.ProcessingStatus.DONE,
+            processing_expires_at=None,
+            processing_error='',
+            processed_at=now,
+            content_type=content_type,
+            metadata=metadata,
+            thumbnail=derivatives.get('thumbnail', ''),
+            preview=derivatives.get('preview', ''),
+            updated_at=now
+        )
+        if not updated:
+            # The blob was released (and deleted) while being processed
+            DocumentProcessingService.delete_derivatives(derivatives.values())
+        return bool(updated)
+
+    @staticmethod
+    def delete_derivatives(names: Iterable[str]) -> None:
+        """Delete thumbnails/previews of a blob"""
+        for name in names:
+            if name:
+                default_storage.delete(name)
+
+    # ============ In-process queue ============
+
+    _wakeup = threading.Event()
+    _worker: Optional[threading.Thread] = None
+    _worker_lock = threading.Lock()
+
+    @staticmethod
+    def enqueue() -> None:
+        """
+        Signal that new blobs are waiting (call after commit). Only acts
+        when processing runs in-process; otherwise the worker polls.
+        """
+        if not getattr(settings, 'SKILLS_DOCUMENT_PROCESSING_IN_PROCESS', False):
+            return
+
+        cls = DocumentProcessingService
+        with cls._worker_lock:
+            if cls._worker is None or not cls._worker.is_alive():
+                cls._worker = threading.Thread(
+                    target=cls._run_in_process_worker,
+                    name='document-processing',
+                    daemon=True
+                )
+                cls._worker.start()
+        cls._wakeup.set()
+
+    @staticmethod
+    def _run_in_process_worker() -> None:
+        cls = DocumentProcessingService
+        while True:
+            cls._wakeup.wait()
+            cls._wakeup.clear()
+            try:
+                while cls.process_pending():
+                    pass
+            except Exception:
+                logger.exception("In-process document processing failed")
+            finally:
+                close_old_connections()
+
+    # ============ Analysis ============
+
+    @staticmethod
+    def _analyze(blob: DocumentBlob) -> Tuple[str, Dict[str, Any], Dict[str, str]]:
+        """Content type, metadata and stored derivatives of a blob"""
+        digest = hashlib.sha256()
+        size = 0
+        header = b''
+        with document_storage.open(blob.name, 'rb') as document:
+            for chunk in document.chunks(chunk_size=DocumentProcessingService.CHUNK_SIZE):
+                if len(header) < 1024:
+                    header += chunk[:1024 - len(header)]
+                digest.update(chunk)
+                size += len(chunk)
+
+        checksum = digest.hexdigest()
+        if checksum != blob.sha256:
+            raise ValueError(f"Checksum mismatch: stored file hashes to {checksum}.")
+
+        metadata: Dict[str, Any] = {'sha256': checksum, 'size': size}
+        derivatives: Dict[str, str] = {}
+
+        if header.startswith(b'%PDF-'):
+            # Pillow cannot render PDFs; record the version only
+            content_type = 'application/pdf'
+            metadata['pdf_version'] = header[5:8].decode('ascii', 'replace')
+            return content_type, metadata, derivatives
+
+        with document_storage.open(blob.name, 'rb') as document:
+            try:
+                image = Image.open(document)
+            except (Image.UnidentifiedImageError, OSError):
+                content_type = mimetypes.guess_type(blob.name)[0] or 'application/octet-stream'
+                return content_type, metadata, derivatives
+
+            content_type = Image.MIME.get(image.format, f'image/{image.format.lower()}')
+            metadata.update({
+                'format': image.format,
+                'width': image.width,
+                'height': image.height,
+                'mode': image.mode,
+                'frames': getattr(image, 'n_frames', 1),
+            })
+            # First frame is the first page of multi-page TIFFs
+            image.seek(0)
+            # Decode JPEGs at reduced scale when that is enough for the preview
+            image.draft('RGB', DocumentProcessingService.PREVIEW_SIZE)
+            image = ImageOps.exif_transpose(image).convert('RGB')
+
+            for kind, box in (
+                ('preview', DocumentProcessingService.PREVIEW_SIZE),
+                ('thumbnail', DocumentProcessingService.THUMBNAIL_SIZE),
+            ):
+                image.thumbnail(box)
+                derivatives[kind] = DocumentProcessingService._store_derivative(blob, kind, image)
+
+        return content_type, metadata, derivatives
+
+    @staticmethod
+    def _store_derivative(blob: DocumentBlob, kind: str, image: Image.Image) -> str:
+        buffer = io.BytesIO()
+        image.save(buffer, format='JPEG', quality=85, optimize=True)
+
+        blob_path = blob.name[len(document_storage.prefix) + 1:]
+        name = f'{DocumentProcessingService.DERIVATIVE_PREFIX}/{blob_path}.{kind}.jpg'
+        # Derivative names are deterministic; replace what a lapsed attempt left
+        default_storage.delete(name)
+        return default_storage.save(name, ContentFile(buffer.getvalue()))
@@ -0,0 +1,118 @@
+"""
+Published Mission Index
+In-process inverted index from skills to the published missions requiring them
+"""
+from typing import Dict, Iterable, List, Set, Tuple
+
+from ..models import MissionSkill
+from apps.core.constants import MissionStatus, RequirementLevel
+from .change_log_index import ChangeLogIndex
+
+
+class PublishedMissionIndex(ChangeLogIndex):
+    """
+    Inverted index of published missions keyed on MissionSkill.
+
+    Maps each skill ID to the published missions that ask for it and keeps
+    each mission's required/preferred skill sets, so a volunteer's skills
+    can be scored against every open mission without scanning the missions
+    table.
+
+    Built lazily on first use and refreshed per mission from MissionSkill
+    and Mission signals. Each refresh publishes the mission ID to the
+    shared change log; other processes reload just those missions (see
+    ChangeLogIndex).
+    """
+
+    GENERATION_CACHE_KEY = 'skills:published_mission_index:generation'
+
+    def __init__(self):
+        super().__init__()
+        self._missions: Dict[str, Dict[str, Set[str]]] = {}
+        self._by_skill: Dict[str, Set[str]] = {}
+
+    # ============ Build / Sync ============
+
+    def _load_state(self):
+        rows = MissionSkill.objects.filter(
+            mission__status=MissionStatus.PUBLISHED
+        ).values_list('mission_id', 'skill_id', 'requirement_level')
+
+        missions: Dict[str, Dict[str, Set[str]]] = {}
+        by_skill: Dict[str, Set[str]] = {}
+        for mission_id, skill_id, requirement_level in rows:
+            self._add_row(missions, by_skill, str(mission_id), str(skill_id), requirement_level)
+        return missions, by_skill
+
+    def _set_state(self, state) -> None:
+        self._missions, self._by_skill = state
+
+    def _apply_changes(self, changes: List[str]) -> None:
+        """Reload the changed missions' entries in one query"""
+        mission_ids = set(changes)
+        for mission_id in mission_ids:
+            self._remove_mission(mission_id)
+
+        rows = MissionSkill.objects.filter(
+            mission_id__in=mission_ids,
+            mission__status=MissionStatus.PUBLISHED
+        ).values_list('mission_id', 'skill_id', 'requirement_level')
+        for mission_id, skill_id, requirement_level in rows:
+            self._add_row(self._missions, self._by_skill, str(mission_id), str(skill_id), requirement_level)
+
+    def refresh_mission(self, mission_id: str) -> None:
+        """Reload one mission's entry (after its skills or status changed)"""
+        self._publish(str(mission_id))
+
+    def remove_mission(self, mission_id: str) -> None:
+        """Drop a mission from the index"""
+        # A deleted mission has no published rows left to reload
+        self._publish(str(mission_id))
+
+    @staticmethod
+    def _add_row(missions, by_skill, mission_id, skill_id, requirement_level):
+        entry = missions.setdefault(mission_id, {'required': set(), 'preferred': set()})
+        if requirement_level in RequirementLevel.REQUIRED_LEVELS:
+            entry['required'].add(skill_id)
+        else:
+            entry['preferred'].add(skill_id)
+        by_skill.setdefault(skill_id, set()).add(mission_id)
+
+    def _remove_mission(self, mission_id: str) -> None:
+        entry = self._missions.pop(mission_id, None)
+        if not entry:
+            return
+        for skill_id in entry['required'] | entry['preferred']:
+            mission_ids = self._by_skill.get(skill_id)
+            if mission_ids is not None:
+                mission_ids.discard(mission_id)
+                if not mission_ids:
+                    del self._by_skill[skill_id]
+
+    # ============ Lookup ============
+
+    def candidates(self, skill_ids: Iterable[str]) -> List[Tuple[str, Set[str], Set[str]]]:
+        """
+        Get published missions sharing at least one skill with the given set
+
+        Returns:
+            List of (mission_id, required_skill_ids, preferred_skill_ids)
+        """
+        self.ensure_built()
+
+        with self._lock:
+            mission_ids: Set[str] = set()
+            for skill_id in skill_ids:
+                mission_ids |= self._by_skill.get(str(skill_id), set())
+
+            return [
+                (
+                    mission_id,
+                    set(self._missions[mission_id]['required']),
+                    set(self._missions[mission_id]['preferred']),
+                )
+                for mission_id in mission_ids
+            ]
+
+
+published_mission_index = PublishedMissionIndex()
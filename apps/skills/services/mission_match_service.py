@@ -0,0 +1,227 @@
+"""
+Mission Match Service
+Maintains the materialized mission <-> volunteer match score table
+"""
+from django.db import transaction
+from django.db.models import Count, Q
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from ..models import MissionSkill, MissionVolunteerMatch, VolunteerSkill
+from apps.core.constants import RequirementLevel, SkillVerificationStatus
+
+
+class MissionMatchService:
+    """Service for computing and storing mission/volunteer skill match scores"""
+
+    REQUIRED_WEIGHT = 0.7
+    PREFERRED_WEIGHT = 0.3
+    BULK_BATCH_SIZE = 1000
+
+    @staticmethod
+    def calculate_overall_score(
+        required_total: int,
+        required_matched: int,
+        preferred_total: int,
+        preferred_matched: int
+    ) -> float:
+        """
+        Weighted match score: 70% required skills, 30% preferred skills
+
+        Returns:
+            Score between 0 and 100, rounded to 2 decimals
+        """
+        required_score = (
+            required_matched / required_total * 100
+            if required_total else 100
+        )
+        preferred_score = (
+            preferred_matched / preferred_total * 100
+            if preferred_total else 0
+        )
+
+        overall_score = (
+            required_score * MissionMatchService.REQUIRED_WEIGHT +
+            preferred_score * MissionMatchService.PREFERRED_WEIGHT
+        )
+        return round(overall_score, 2)
+
+    @staticmethod
+    def refresh_mission(mission_id: str) -> int:
+        """
+        Recompute every match row of a mission (after a MissionSkill change)
+
+        Returns:
+            Number of match rows stored
+        """
+        return MissionMatchService._refresh(mission_ids=[mission_id])
+
+    @staticmethod
+    def refresh_volunteer_skill(volunteer_id: str, skill_id: str) -> int:
+        """
+        Recompute a volunteer's match rows for missions using one skill
+        (after a VolunteerSkill change)
+
+        Returns:
+            Number of match rows stored
+        """
+        return MissionMatchService.refresh_volunteer_skills(volunteer_id, [skill_id])
+
+    @staticmethod
+    def refresh_volunteer_skills(volunteer_id: str, skill_ids: Iterable[str]) -> int:
+        """
+        Recompute a volunteer's match rows for missions using any of the
+        given skills (after a bulk VolunteerSkill change)
+
+        Returns:
+            Number of match rows stored
+        """
+        mission_ids = list(
+            MissionSkill.objects.filter(
+                skill_id__in=list(skill_ids)
+            ).values_list('mission_id', flat=True).distinct()
+        )
+        if not mission_ids:
+            return 0
+
+        return MissionMatchService._refresh(
+            mission_ids=mission_ids,
+            volunteer_ids=[volunteer_id]
+        )
+
+    @staticmethod
+    def refresh_volunteers_skills(
+        volunteer_ids: Iterable[str],
+        skill_ids: Iterable[str]
+    ) -> int:
+        """
+        Recompute the match rows of several volunteers for missions using
+        any of the given skills, in one pass (after a set-based
+        VolunteerSkill update across volunteers)
+
+        Returns:
+            Number of match rows stored
+        """
+        volunteer_ids = list(volunteer_ids)
+        if not volunteer_ids:
+            return 0
+
+        mission_ids = list(
+            MissionSkill.objects.filter(
+                skill_id__in=list(skill_ids)
+            ).values_list('mission_id', flat=True).distinct()
+        )
+        if not mission_ids:
+            return 0
+
+        return MissionMatchService._refresh(
+            mission_ids=mission_ids,
+            volunteer_ids=volunteer_ids
+        )
+
+    @staticmethod
+    def rebuild_all(mission_ids: Optional[Iterable[str]] = None) -> int:
+        """
+        Rebuild the match table for the given missions (default: all missions
+        that have skills)
+
+        Returns:
+            Number of match rows stored
+        """
+        if mission_ids is None:
+            mission_ids = MissionSkill.objects.values_list(
+                'mission_id', flat=True
+            ).distinct()
+
+        stored = 0
+        for mission_id in mission_ids:
+            stored += MissionMatchService.refresh_mission(mission_id)
+        return stored
+
+    @staticmethod
+    @transaction.atomic
+    def _refresh(mission_ids: List[str], volunteer_ids: Optional[List[str]] = None) -> int:
+        """Replace match rows for the given missions (and optional volunteers)"""
+        totals = MissionMatchService._get_mission_totals(mission_ids)
+        pair_counts = MissionMatchService._get_pair_counts(mission_ids, volunteer_ids)
+
+        stale_rows = MissionVolunteerMatch.objects.filter(mission_id__in=mission_ids)
+        if volunteer_ids is not None:
+            stale_rows = stale_rows.filter(volunteer_id__in=volunteer_ids)
+        stale_rows.delete()
+
+        matches = []
+        for (mission_id, pair_volunteer_id), counts in pair_counts.items():
+            required_total, preferred_total = totals.get(mission_id, (0, 0))
+            matches.append(MissionVolunteerMatch(
+                mission_id=mission_id,
+                volunteer_id=pair_volunteer_id,
+                required_skills_total=required_total,
+                preferred_skills_total=preferred_total,
+                required_skills_matched=counts['required_matched'],
+                required_skills_missing=required_total - counts['required_matched'],
+                preferred_skills_matched=counts['preferred_matched'],
+                overall_score=MissionMatchService.calculate_overall_score(
+                    required_total, counts['required_matched'],
+                    preferred_total, counts['preferred_matched']
+                ),
+                verified_required_skills_matched=counts['verified_required_matched'],
+                verified_required_skills_missing=required_total - counts['verified_required_matched'],
+                verified_preferred_skills_matched=counts['verified_preferred_matched'],
+                verified_overall_score=MissionMatchService.calculate_overall_score(
+                    required_total, counts['verified_required_matched'],
+                    preferred_total, counts['verified_preferred_matched']
+                ),
+            ))
+
+        MissionVolunteerMatch.objects.bulk_create(
+            matches,
+            batch_size=MissionMatchService.BULK_BATCH_SIZE
+        )
+        return len(matches)
+
+    @staticmethod
+    def _get_mission_totals(mission_ids: List[str]) -> Dict[Any, Tuple[int, int]]:
+        """Count required and preferred skills per mission in one query"""
+        rows = MissionSkill.objects.filter(
+            mission_id__in=mission_ids
+        ).values('mission_id').annotate(
+            required_total=Count(
+                'id', filter=Q(requirement_level__in=RequirementLevel.REQUIRED_LEVELS)
+            ),
+            preferred_total=Count(
+                'id', filter=~Q(requirement_level__in=RequirementLevel.REQUIRED_LEVELS)
+            ),
+        )
+        return {
+            row['mission_id']: (row['required_total'], row['preferred_total'])
+            for row in rows
+        }
+
+    @staticmethod
+    def _get_pair_counts(
+        mission_ids: List[str],
+        volunteer_ids: Optional[List[str]] = None
+    ) -> Dict[Tuple[Any, Any], Dict[str, int]]:
+        """Count matched skills per (mission, volunteer) pair in one grouped query"""
+        required = Q(skill__mission_skills__requirement_level__in=RequirementLevel.REQUIRED_LEVELS)
+        verified = Q(verification_status=SkillVerificationStatus.VERIFIED)
+
+        queryset = VolunteerSkill.objects.filter(
+            skill__mission_skills__mission_id__in=mission_ids
+        )
+        if volunteer_ids is not None:
+            queryset = queryset.filter(volunteer_id__in=volunteer_ids)
+
+        rows = queryset.values(
+            'skill__mission_skills__mission_id',
+            'volunteer_id'
+        ).annotate(
+            required_matched=Count('id', filter=required),
+            preferred_matched=Count('id', filter=~required),
+            verified_required_matched=Count('id', filter=required & verified),
+            verified_preferred_matched=Count('id', filter=~required & verified),
+        ).order_by()
+
+        return {
+            (row['skill__mission_skills__mission_id'], row['volunteer_id']): row
+            for row in rows
+        }
@@ -0,0 +1,120 @@
+"""
+Mission Recommendation Service
+Ranks published missions for a volunteer based on their skills
+"""
+from django.utils import timezone
+from typing import List, Dict, Any
+from ..models import VolunteerSkill
+from apps.core.constants import SkillVerificationStatus
+from .mission_index import published_mission_index
+from .mission_match_service import MissionMatchService
+
+
+class MissionRecommendationService:
+    """Service for recommending missions to volunteers (reverse matching)"""
+
+    PAGE_SIZE = 50
+
+    @staticmethod
+    def recommend_missions_for_volunteer(
+        volunteer_id: str,
+        verified_only: bool = False,
+        require_all_skills: bool = False,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Get top-k published missions matching a volunteer's skills
+
+        Args:
+            volunteer_id: Volunteer profile ID
+            verified_only: Only count the volunteer's verified skills
+            require_all_skills: Only return missions whose required skills are all held
+            limit: Maximum number of missions
+
+        Returns:
+            List of mission data with match information, best match first
+        """
+        from apps.missions.models import Mission, Participation
+
+        volunteer_skills = VolunteerSkill.objects.filter(volunteer_id=volunteer_id)
+        if verified_only:
+            volunteer_skills = volunteer_skills.filter(
+                verification_status=SkillVerificationStatus.VERIFIED
+            )
+        skill_ids = {str(skill_id) for skill_id in volunteer_skills.values_list('skill_id', flat=True)}
+
+        if not skill_ids:
+            return []
+
+        applied_mission_ids = {
+            str(mission_id) for mission_id in Participation.objects.filter(
+                volunteer_id=volunteer_id
+            ).values_list('mission_id', flat=True)
+        }
+
+        scored = []
+        for mission_id, required_ids, preferred_ids in published_mission_index.candidates(skill_ids):
+            if mission_id in applied_mission_ids:
+                continue
+
+            required_matched = len(required_ids & skill_ids)
+            preferred_matched = len(preferred_ids & skill_ids)
+            required_missing = len(required_ids) - required_matched
+
+            if require_all_skills and required_missing:
+                continue
+
+            scored.append({
+                'mission_id': mission_id,
+                'overall_score': MissionMatchService.calculate_overall_score(
+                    len(required_ids), required_matched,
+                    len(preferred_ids), preferred_matched
+                ),
+                'required_skills_matched': required_matched,
+                'required_skills_total': len(required_ids),
+                'required_skills_missing': required_missing,
+                'preferred_skills_matched': preferred_matched,
+                'preferred_skills_total': len(preferred_ids),
+                'is_fully_qualified': required_missing == 0,
+            })
+
+        scored.sort(key=lambda match: (-match['overall_score'], match['mission_id']))
+
+        # Walk the ranking in pages so missions closed for applications
+        # are skipped without loading every candidate mission
+        recommendations = []
+        page_size = max(limit * 2, MissionRecommendationService.PAGE_SIZE)
+        for start in range(0, len(scored), page_size):
+            page = scored[start:start + page_size]
+            missions = {
+                str(mission.id): mission
+                for mission in Mission.objects.filter(
+                    id__in=[match['mission_id'] for match in page],
+                    application_deadline__gt=timezone.now()
+                ).select_related('organization', 'address')
+            }
+
+            for match in page:
+                mission = missions.get(match['mission_id'])
+                if mission is None:
+                    continue
+
+                recommendations.append({
+                    'mission_id': match['mission_id'],
+                    'title': mission.title,
+                    'organization_name': mission.organization.name,
+                    'mission_type': mission.mission_type,
+                    'wilaya': mission.address.wilaya,
+                    'start_date': mission.start_date,
+                    'end_date': mission.end_date,
+                    'application_deadline': mission.application_deadline,
+                    'is_featured': mission.is_featured,
+                    'mission_match': {
+                        key: value for key, value in match.items()
+                        if key != 'mission_id'
+                    },
+                })
+                if len(recommendations) >= limit:
+                    return recommendations
+
+        return recommendations
@@ -269,24 +269,30 @@ class MissionSkillService:
         limit: int = 5
     ) -> List[Skill]:
         
-        from django.db.models import Count
+        from django.db.models import F
+        from .skill_cooccurrence_service import SkillCooccurrenceService
         
-        # Get current mission skills
-        current_skills = MissionSkill.objects.filter(
+        # Get current mission skills and their categories
+        current_skills = list(MissionSkill.objects.filter(
             mission_id=mission_id
-        ).select_related('skill__category')
+        ).values_list('skill_id', 'skill__category_id'))
 
-        current_skill_ids = set(ms.skill_id for ms in current_skills)
-        category_ids = set(ms.skill.category_id for ms in current_skills)
+        current_skill_ids = set(skill_id for skill_id, _ in current_skills)
+        category_ids = set(category_id for _, category_id in current_skills)
 
-        # Suggest popular skills from same categories
+        # Skills volunteers with the mission's skills also tend to have
+        suggestions = SkillCooccurrenceService.suggest_related_skills(current_skill_ids, limit)
+        if len(suggestions) >= limit:
+            return suggestions
+
+        # Top up with popular skills from same categories
         suggested_skills = Skill.objects.filter(
             category_id__in=category_ids,
             is_active=True
         ).exclude(
-            id__in=current_skill_ids
-        ).annotate(
-            mission_count=Count('mission_skills')
-        ).order_by('-mission_count')[:limit]
+            id__in=current_skill_ids | {skill.id for skill in suggestions}
+        ).order_by(
+            F('usage__mission_count').desc(nulls_last=True)
+        )[:limit - len(suggestions)]
 
-        return list(suggested_skills)
\ No newline at end of file
+        return suggestions + list(suggested_skills)
\ No newline at end of file
@@ -0,0 +1,168 @@
+"""
+Skill Autocomplete Index
+In-process sorted-array prefix index over active skill names and aliases
+"""
+import bisect
+import heapq
+import threading
+import time
+import unicodedata
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.functions import Coalesce
+
+from ..models import Skill
+
+
+class SkillAutocompleteIndex:
+    """
+    Prefix index for skill autocomplete.
+
+    Every word-start suffix of each active skill's name and aliases is
+    normalized (casefolded, accents stripped) and kept in one sorted list,
+    so the entries matching a prefix are a contiguous range found with two
+    bisects. Matches are ranked by the skill's maintained volunteer count
+    (as for popular skills), with name matches ahead of alias matches.
+
+    Built lazily from one query. Skill and category writes bump a shared
+    generation counter; other processes compare against it at most every
+    GENERATION_CHECK_SECONDS, so a lookup normally touches neither the
+    database nor the cache. Popularity is refreshed by rebuilding after
+    SKILLS_AUTOCOMPLETE_REFRESH_SECONDS.
+    """
+
+    GENERATION_CACHE_KEY = 'skills:autocomplete_index:generation'
+    GENERATION_CHECK_SECONDS = 1.0
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._built = False
+        self._generation = None
+        self._built_at = 0.0
+        self._checked_at = 0.0
+        self._terms: List[str] = []
+        self._entries: List[Tuple[int, bool]] = []
+        self._skills: List[Dict[str, Any]] = []
+
+    # ============ Build / Sync ============
+
+    def rebuild(self) -> None:
+        """Rebuild the whole index from active skills"""
+        rows = Skill.objects.filter(is_active=True).annotate(
+            volunteer_count=Coalesce('usage__volunteer_count', 0)
+        ).values_list('id', 'name', 'aliases', 'category_id', 'category__name', 'volunteer_count')
+
+        skills: List[Dict[str, Any]] = []
+        pairs: List[Tuple[str, int, bool]] = []
+        for skill_id, name, aliases, category_id, category_name, volunteer_count in rows:
+            slot = len(skills)
+            skills.append({
+                'id': str(skill_id),
+                'name': name,
+                'category_id': str(category_id),
+                'category_name': category_name,
+                'volunteer_count': volunteer_count,
+            })
+            for term in self._word_suffixes(name):
+                pairs.append((term, slot, True))
+            for alias in aliases or []:
+                for term in self._word_suffixes(alias):
+                    pairs.append((term, slot, False))
+
+        pairs.sort()
+        now = time.monotonic()
+        with self._lock:
+            self._terms = [term for term, _, _ in pairs]
+            self._entries = [(slot, is_name) for _, slot, is_name in pairs]
+            self._skills = skills
+            self._generation = cache.get(self.GENERATION_CACHE_KEY, 0)
+            self._built_at = now
+            self._checked_at = now
+            self._built = True
+
+    def ensure_built(self) -> None:
+        """Build the index if missing, outdated or changed by another process"""
+        now = time.monotonic()
+        refresh_seconds = getattr(settings, 'SKILLS_AUTOCOMPLETE_REFRESH_SECONDS', 300)
+        if not self._built or now - self._built_at >= refresh_seconds:
+            self.rebuild()
+            return
+
+        if now - self._checked_at >= self.GENERATION_CHECK_SECONDS:
+            self._checked_at = now
+            if cache.get(self.GENERATION_CACHE_KEY, 0) != self._generation:
+                self.rebuild()
+
+    def invalidate(self) -> None:
+        """Drop the local copy and tell other processes to rebuild theirs"""
+        with self._lock:
+            self._built = False
+        cache.add(self.GENERATION_CACHE_KEY, 0, timeout=None)
+        try:
+            cache.incr(self.GENERATION_CACHE_KEY)
+        except ValueError:
+            pass
+
+    # ============ Lookup ============
+
+    def complete(self, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Find active skills with a name or alias word starting with a prefix
+
+        Args:
+            prefix: Text typed so far
+            limit: Maximum number of suggestions
+
+        Returns:
+            List of skill data, name matches first, then by popularity
+        """
+        prefix = self._normalize(prefix)
+        if not prefix or limit <= 0:
+            return []
+
+        self.ensure_built()
+
+        with self._lock:
+            terms, entries, skills = self._terms, self._entries, self._skills
+
+        start = bisect.bisect_left(terms, prefix)
+        end = bisect.bisect_left(terms, prefix + '\U0010ffff', lo=start)
+
+        # Best match kind per skill: a name match beats an alias match
+        matched: Dict[int, bool] = {}
+        for slot, is_name in entries[start:end]:
+            matched[slot] = matched.get(slot, False) or is_name
+
+        best = heapq.nsmallest(
+            limit,
+            matched.items(),
+            key=lambda item: (
+                not item[1],
+                -skills[item[0]]['volunteer_count'],
+                skills[item[0]]['name']
+            )
+        )
+        return [
+            {**skills[slot], 'matched_alias': not is_name}
+            for slot, is_name in best
+        ]
+
+    # ============ Helpers ============
+
+    @staticmethod
+    def _normalize(text: Optional[str]) -> str:
+        """Casefold, strip accents and collapse whitespace"""
+        decomposed = unicodedata.normalize('NFKD', text or '')
+        stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+        return ' '.join(stripped.casefold().split())
+
+    @classmethod
+    def _word_suffixes(cls, text: str) -> List[str]:
+        """'Web Design' -> ['web design', 'design'] so any word can start a match"""
+        words = cls._normalize(text).split(' ')
+        return [' '.join(words[index:]) for index in range(len(words)) if words[index]]
+
+
+skill_autocomplete_index = SkillAutocompleteIndex()
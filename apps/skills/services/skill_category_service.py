@@ -1,12 +1,22 @@
 
+import json
+import time
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
 from django.core.exceptions import ValidationError
 from typing import List, Optional, Dict, Any
-from ..models import SkillCategory
+from apps.core.cache import bump_versions
+from apps.core.search import fulltext_search, is_postgres, rank_in_python, weighted_vector
+from ..models import SkillCategory, SkillCategoryClosure, SkillCategoryStatistics
 
 
 class SkillCategoryService:
 
+    TREE_CACHE_KEY = 'skills:category_tree:snapshot'
+    TREE_VERSION_CACHE_KEY = 'skills:category_tree:version'
+    SEARCH_FIELDS = (('name', 'A'), ('description', 'B'))
 
     @staticmethod
     def get_all_categories(include_inactive: bool = False) -> List[SkillCategory]:
@@ -42,34 +52,101 @@ class SkillCategoryService:
     @staticmethod
     def get_category_tree() -> List[Dict[str, Any]]:
 
-        root_categories = SkillCategoryService.get_root_categories()
+        # Every category with its skill count in one grouped query,
+        # then linked to its parent in memory
+        rows = list(
+            SkillCategory.objects.annotate(
+                skills_count=Count('skills')
+            ).order_by('name').values(
+                'id', 'name', 'description', 'parent_category_id', 'skills_count'
+            )
+        )
         
-        def build_tree(category):
-            """Recursively build category tree"""
-            return {
-                'id': str(category.id),
-                'name': category.name,
-                'description': category.description,
-                'skills_count': category.skills.count(),
-                'subcategories': [
-                    build_tree(sub) 
-                    for sub in category.subcategories.all()
-                ]
+        nodes = {
+            row['id']: {
+                'id': str(row['id']),
+                'name': row['name'],
+                'description': row['description'],
+                'skills_count': row['skills_count'],
+                'subcategories': []
             }
+            for row in rows
+        }
+        
+        tree = []
+        for row in rows:
+            parent = nodes.get(row['parent_category_id'])
+            if parent is None:
+                tree.append(nodes[row['id']])
+            else:
+                parent['subcategories'].append(nodes[row['id']])
         
-        return [build_tree(cat) for cat in root_categories]
+        return tree
+
+    @staticmethod
+    def get_category_tree_version() -> int:
+        """Current version of the category tree (seeded from the clock)"""
+        version = cache.get(SkillCategoryService.TREE_VERSION_CACHE_KEY)
+        if version is None:
+            cache.add(SkillCategoryService.TREE_VERSION_CACHE_KEY, time.time_ns(), timeout=None)
+            version = cache.get(SkillCategoryService.TREE_VERSION_CACHE_KEY)
+        return version
+
+    @staticmethod
+    def get_category_tree_snapshot() -> Dict[str, Any]:
+        """
+        Category tree serialized as one JSON blob, with the tree version
+        it was built from. Rebuilt on the first read after a change.
+        """
+        cached = cache.get_many([
+            SkillCategoryService.TREE_CACHE_KEY,
+            SkillCategoryService.TREE_VERSION_CACHE_KEY
+        ])
+        snapshot = cached.get(SkillCategoryService.TREE_CACHE_KEY)
+        version = cached.get(SkillCategoryService.TREE_VERSION_CACHE_KEY)
+        if snapshot is not None and version is not None and snapshot['version'] == version:
+            return snapshot
+        
+        # Read the version before building, so a concurrent change
+        # leaves this snapshot already outdated
+        if version is None:
+            version = SkillCategoryService.get_category_tree_version()
+        snapshot = {
+            'version': version,
+            'body': json.dumps(SkillCategoryService.get_category_tree()).encode(),
+        }
+        cache.set(SkillCategoryService.TREE_CACHE_KEY, snapshot, timeout=None)
+        return snapshot
+
+    @staticmethod
+    def invalidate_category_tree() -> None:
+        """Bump the tree version so the next read rebuilds the snapshot"""
+        bump_versions(SkillCategoryService.TREE_VERSION_CACHE_KEY)
 
     @staticmethod
     def get_category_path(category: SkillCategory) -> List[SkillCategory]:
  
-        path = [category]
-        current = category.parent_category
+        # Ancestors (root first) down to the category itself
+        return list(
+            SkillCategory.objects.filter(
+                descendant_links__descendant=category
+            ).order_by('-descendant_links__depth')
+        )
+
+    @staticmethod
+    def get_descendant_ids(category_id: str, include_self: bool = True):
         
-        while current:
-            path.insert(0, current)
-            current = current.parent_category
+        links = SkillCategoryClosure.objects.filter(ancestor_id=category_id)
+        if not include_self:
+            links = links.filter(depth__gt=0)
+        return links.values_list('descendant_id', flat=True)
+
+    @staticmethod
+    def get_descendants(category_id: str):
         
-        return path
+        return SkillCategory.objects.filter(
+            id__in=SkillCategoryService.get_descendant_ids(category_id, include_self=False)
+        )
 
     @staticmethod
     @transaction.atomic
@@ -141,7 +218,7 @@ class SkillCategoryService:
                     parent = SkillCategory.objects.get(id=parent_category_id)
                     
                     # Prevent circular reference
-                    if SkillCategoryService._would_create_cycle(category, parent):
+                    if SkillCategoryService.would_create_cycle(category, parent):
                         raise ValidationError(
                             "Cannot set parent: would create circular reference."
                         )
@@ -154,15 +231,109 @@ class SkillCategoryService:
         return category
 
     @staticmethod
-    def _would_create_cycle(category: SkillCategory, new_parent: SkillCategory) -> bool:
+    def would_create_cycle(category: SkillCategory, new_parent: SkillCategory) -> bool:
+        """Whether moving a category under new_parent would make it its own ancestor"""
+        # The new parent may not be the category itself or one of its descendants
+        return SkillCategoryClosure.objects.filter(
+            ancestor_id=category.id,
+            descendant_id=new_parent.id
+        ).exists()
+
+    # ============ Closure table maintenance ============
+
+    @staticmethod
+    def add_to_closure(category: SkillCategory) -> None:
+        """Link a new category to itself and to every ancestor of its parent"""
+        links = [
+            SkillCategoryClosure(ancestor_id=category.id, descendant_id=category.id, depth=0)
+        ]
+        if category.parent_category_id:
+            links.extend(
+                SkillCategoryClosure(
+                    ancestor_id=ancestor_id,
+                    descendant_id=category.id,
+                    depth=depth + 1
+                )
+                for ancestor_id, depth in SkillCategoryClosure.objects.filter(
+                    descendant_id=category.parent_category_id
+                ).values_list('ancestor_id', 'depth')
+            )
+        SkillCategoryClosure.objects.bulk_create(links)
+
+    @staticmethod
+    def move_in_closure(category: SkillCategory) -> None:
+        """Re-link a category's subtree under its (changed) parent"""
+        subtree = list(
+            SkillCategoryClosure.objects.filter(
+                ancestor_id=category.id
+            ).values_list('descendant_id', 'depth')
+        )
+        subtree_ids = [descendant_id for descendant_id, _ in subtree]
+        
+        # Cut the subtree loose from its old ancestors
+        SkillCategoryClosure.objects.filter(
+            descendant_id__in=subtree_ids
+        ).exclude(
+            ancestor_id__in=subtree_ids
+        ).delete()
+        
+        if not category.parent_category_id:
+            return
+        
+        ancestors = SkillCategoryClosure.objects.filter(
+            descendant_id=category.parent_category_id
+        ).values_list('ancestor_id', 'depth')
+        SkillCategoryClosure.objects.bulk_create([
+            SkillCategoryClosure(
+                ancestor_id=ancestor_id,
+                descendant_id=descendant_id,
+                depth=ancestor_depth + descendant_depth + 1
+            )
+            for ancestor_id, ancestor_depth in ancestors
+            for descendant_id, descendant_depth in subtree
+        ])
+
+    @staticmethod
+    def collapse_in_closure(category: SkillCategory) -> None:
+        """
+        Shorten paths running through a category whose children were
+        reassigned to its parent (its own rows go with it on delete)
+        """
+        SkillCategoryClosure.objects.filter(
+            ancestor_id__in=list(
+                SkillCategoryClosure.objects.filter(
+                    descendant_id=category.id, depth__gt=0
+                ).values_list('ancestor_id', flat=True)
+            ),
+            descendant_id__in=list(
+                SkillCategoryClosure.objects.filter(
+                    ancestor_id=category.id, depth__gt=0
+                ).values_list('descendant_id', flat=True)
+            )
+        ).update(depth=F('depth') - 1)
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild_closure() -> int:
+        """Recompute the whole closure table from parent links"""
+        parents = dict(SkillCategory.objects.values_list('id', 'parent_category_id'))
         
-      
-        current = new_parent
-        while current:
-            if current.id == category.id:
-                return True
-            current = current.parent_category
-        return False
+        links = []
+        for category_id in parents:
+            ancestor_id, depth, seen = category_id, 0, set()
+            while ancestor_id is not None and ancestor_id not in seen:
+                seen.add(ancestor_id)
+                links.append(SkillCategoryClosure(
+                    ancestor_id=ancestor_id,
+                    descendant_id=category_id,
+                    depth=depth
+                ))
+                ancestor_id = parents.get(ancestor_id)
+                depth += 1
+        
+        SkillCategoryClosure.objects.all().delete()
+        SkillCategoryClosure.objects.bulk_create(links, batch_size=1000)
+        return len(links)
 
     @staticmethod
     @transaction.atomic
@@ -187,6 +358,7 @@ class SkillCategoryService:
             category.subcategories.update(
                 parent_category=category.parent_category
             )
+            SkillCategoryService.collapse_in_closure(category)
             
             # Reassign skills to parent category (if exists)
             if category.parent_category:
@@ -223,39 +395,120 @@ class SkillCategoryService:
         if not query:
             return []
 
-        return SkillCategory.objects.filter(
-            name__icontains=query
-        ) | SkillCategory.objects.filter(
-            description__icontains=query
-        ).distinct().order_by('name')
+        queryset = SkillCategory.objects.select_related('parent_category')
+
+        if is_postgres():
+            return list(fulltext_search(queryset, query))
+        return rank_in_python(queryset, query, SkillCategoryService.SEARCH_FIELDS)
+
+    @staticmethod
+    def refresh_search_vector(category_id: str) -> None:
+        """
+        Recompute a category's stored search document (PostgreSQL only)
+        """
+        if is_postgres():
+            SkillCategory.objects.filter(id=category_id).update(
+                search_vector=weighted_vector(SkillCategoryService.SEARCH_FIELDS)
+            )
 
     @staticmethod
-    def get_category_statistics(category_id: str) -> Dict[str, Any]:
+    def get_category_statistics(category_id: str, precomputed: bool = False) -> Dict[str, Any]:
        
         try:
-            category = SkillCategory.objects.prefetch_related(
-                'subcategories',
-                'skills',
-                'skills__volunteer_skills'
+            category = SkillCategory.objects.annotate(
+                depth_level=Count('ancestor_links')
             ).get(id=category_id)
         except SkillCategory.DoesNotExist:
             raise ValidationError("Category not found.")
 
-        # Calculate statistics
-        total_skills = category.skills.count()
-        total_subcategories = category.subcategories.count()
-        
-        # Count volunteers with skills in this category
-        volunteers_count = sum(
-            skill.volunteer_skills.values('volunteer').distinct().count()
-            for skill in category.skills.all()
-        )
+        if precomputed:
+            rollup = SkillCategoryStatistics.objects.filter(category_id=category.id).first()
+            if rollup is not None:
+                return {
+                    'category_id': str(category.id),
+                    'category_name': category.name,
+                    'total_skills': rollup.total_skills,
+                    'total_subcategories': rollup.total_subcategories,
+                    'total_volunteers': rollup.total_volunteers,
+                    'subtree_skills': rollup.subtree_skills,
+                    'subtree_subcategories': rollup.subtree_subcategories,
+                    'subtree_volunteers': rollup.subtree_volunteers,
+                    'depth_level': category.depth_level,
+                    'computed_at': rollup.computed_at,
+                }
+
+        # Own and rolled-up counts over the category's subtree in one aggregate
+        stats = SkillCategoryClosure.objects.filter(
+            ancestor_id=category.id
+        ).aggregate(**SkillCategoryService._statistics_aggregates())
 
         return {
             'category_id': str(category.id),
             'category_name': category.name,
-            'total_skills': total_skills,
-            'total_subcategories': total_subcategories,
-            'total_volunteers': volunteers_count,
-            'depth_level': len(SkillCategoryService.get_category_path(category))
-        }
\ No newline at end of file
+            **stats,
+            'depth_level': category.depth_level,
+            'computed_at': None,
+        }
+
+    @staticmethod
+    @transaction.atomic
+    def refresh_statistics_rollup() -> int:
+        """
+        Recompute the precomputed statistics of every category
+        (one grouped query over the closure table)
+        
+        Returns:
+            Number of categories stored
+        """
+        computed_at = timezone.now()
+        depths = dict(
+            SkillCategoryClosure.objects.values('descendant_id').annotate(
+                depth_level=Count('id')
+            ).values_list('descendant_id', 'depth_level')
+        )
+        rows = SkillCategoryClosure.objects.values('ancestor_id').annotate(
+            **SkillCategoryService._statistics_aggregates()
+        ).order_by()
+
+        rollups = []
+        for row in rows:
+            category_id = row.pop('ancestor_id')
+            rollups.append(SkillCategoryStatistics(
+                category_id=category_id,
+                depth_level=depths.get(category_id, 1),
+                computed_at=computed_at,
+                **row
+            ))
+
+        SkillCategoryStatistics.objects.exclude(
+            category_id__in=[rollup.category_id for rollup in rollups]
+        ).delete()
+        SkillCategoryStatistics.objects.bulk_create(
+            rollups,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['category'],
+            update_fields=[
+                'total_skills', 'total_subcategories', 'total_volunteers',
+                'subtree_skills', 'subtree_subcategories', 'subtree_volunteers',
+                'depth_level', 'computed_at',
+            ]
+        )
+        return len(rollups)
+
+    @staticmethod
+    def _statistics_aggregates() -> Dict[str, Count]:
+        """COUNT(DISTINCT) expressions over closure rows below an ancestor"""
+        own = Q(depth=0)
+        return {
+            'total_skills': Count('descendant__skills', filter=own, distinct=True),
+            'total_subcategories': Count('descendant', filter=Q(depth=1), distinct=True),
+            'total_volunteers': Count(
+                'descendant__skills__volunteer_skills__volunteer', filter=own, distinct=True
+            ),
+            'subtree_skills': Count('descendant__skills', distinct=True),
+            'subtree_subcategories': Count('descendant', filter=Q(depth__gt=0), distinct=True),
+            'subtree_volunteers': Count(
+                'descendant__skills__volunteer_skills__volunteer', distinct=True
+            ),
+        }
@@ -0,0 +1,123 @@
+"""
+Skill Co-occurrence Service
+Builds the "volunteers who have X also have Y" model behind skill suggestions
+"""
+import heapq
+import math
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from ..models import Skill, SkillCooccurrence, VolunteerSkill
+
+
+class SkillCooccurrenceService:
+    """Service for the precomputed skill co-occurrence top-k lists"""
+
+    TOP_K = 20
+    CHUNK_SIZE = 5000
+
+    @staticmethod
+    def rebuild(top_k: int = TOP_K) -> int:
+        """
+        Recompute every skill's top-k co-occurring skills from volunteer_skills
+
+        Pairs are counted per volunteer in one streamed pass over the rows;
+        related skills tied on score rank by volunteer count, then by ID.
+
+        Returns:
+            Number of stored pairs
+        """
+        rows = VolunteerSkill.objects.values_list(
+            'volunteer_id', 'skill_id'
+        ).iterator(chunk_size=SkillCooccurrenceService.CHUNK_SIZE)
+
+        top_pairs = SkillCooccurrenceService._top_pairs(rows, top_k)
+
+        computed_at = timezone.now()
+        pairs = [
+            SkillCooccurrence(
+                skill_id=skill_id,
+                related_skill_id=related_id,
+                volunteer_count=count,
+                score=score,
+                rank=rank,
+                computed_at=computed_at
+            )
+            for skill_id, related in top_pairs.items()
+            for rank, (related_id, count, score) in enumerate(related, start=1)
+        ]
+
+        with transaction.atomic():
+            SkillCooccurrence.objects.all().delete()
+            SkillCooccurrence.objects.bulk_create(pairs, batch_size=1000)
+        return len(pairs)
+
+    @staticmethod
+    def suggest_related_skills(
+        skill_ids: Iterable[str],
+        limit: int = 5
+    ) -> List[Skill]:
+        """
+        Suggest active skills most often held together with the given skills
+
+        Scores of each candidate are summed over the given skills' top-k
+        lists; the given skills themselves are never suggested.
+        """
+        skill_ids = list(skill_ids)
+        if not skill_ids or limit <= 0:
+            return []
+
+        ranked_ids = list(
+            SkillCooccurrence.objects.filter(
+                skill_id__in=skill_ids,
+                related_skill__is_active=True
+            ).exclude(
+                related_skill_id__in=skill_ids
+            ).values('related_skill_id').annotate(
+                total_score=Sum('score')
+            ).order_by('-total_score', 'related_skill_id').values_list(
+                'related_skill_id', flat=True
+            )[:limit]
+        )
+
+        skills = Skill.objects.in_bulk(ranked_ids)
+        return [skills[skill_id] for skill_id in ranked_ids if skill_id in skills]
+
+    # ============ Pair counting ============
+
+    @staticmethod
+    def _top_pairs(
+        rows: Iterable[Tuple[str, str]],
+        top_k: int
+    ) -> Dict[str, List[Tuple[str, int, float]]]:
+        """Each skill's top-k related skills as (related_id, count, cosine score)"""
+        skills_by_volunteer: Dict[str, Set[str]] = defaultdict(set)
+        for volunteer_id, skill_id in rows:
+            skills_by_volunteer[volunteer_id].add(skill_id)
+
+        frequencies: Dict[str, int] = defaultdict(int)
+        counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        for skills in skills_by_volunteer.values():
+            for skill_id in skills:
+                frequencies[skill_id] += 1
+                related_counts = counts[skill_id]
+                for related_id in skills:
+                    if related_id != skill_id:
+                        related_counts[related_id] += 1
+
+        top_pairs: Dict[str, List[Tuple[str, int, float]]] = {}
+        for skill_id, related_counts in counts.items():
+            if not related_counts:
+                continue
+            scored = (
+                (related_id, count, count / math.sqrt(frequencies[skill_id] * frequencies[related_id]))
+                for related_id, count in related_counts.items()
+            )
+            top_pairs[skill_id] = heapq.nsmallest(
+                top_k, scored, key=lambda pair: (-pair[2], -pair[1], str(pair[0]))
+            )
+        return top_pairs
@@ -0,0 +1,267 @@
+"""
+Volunteer Skill Index
+In-process bitmap index mapping skills to the volunteers who hold them
+"""
+import heapq
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+
+from ..models import VolunteerSkill
+from .change_log_index import ChangeLogIndex
+
+# (volunteer_id, skill_id, verification_status, proficiency_level);
+# status and level are None for a removal
+Row = Tuple[str, str, Optional[str], Optional[str]]
+
+
+class VolunteerSkillIndex(ChangeLogIndex):
+    """
+    Bitmap index of volunteer skills.
+
+    Every volunteer gets a dense integer slot and every skill keeps one
+    bitmap per (verification_status, proficiency_level) bucket, stored as
+    a Python int. "all" searches become bitmap ANDs and "any" searches
+    bitmap ORs, so no JOIN over volunteer_skills is needed to find
+    candidates.
+
+    Bitmaps are as wide as the highest slot in use, so slots stay dense:
+    a volunteer's slot is freed with their last skill and the lowest free
+    slot is handed out next, and a rebuild renumbers slots from zero.
+
+    The index is built lazily from the database on first use and kept in
+    sync through VolunteerSkill save/delete signals. Each write publishes
+    the new (volunteer, skill, status, level) rows to the shared change
+    log, and other worker processes replay them (see ChangeLogIndex).
+    """
+
+    GENERATION_CACHE_KEY = 'skills:volunteer_skill_index:generation'
+    REBUILD_CHUNK_SIZE = 5000
+
+    def __init__(self):
+        super().__init__()
+        self._slots: Dict[str, int] = {}
+        self._volunteer_ids: List[Optional[str]] = []
+        self._skill_counts: List[int] = []
+        self._free_slots: List[int] = []
+        self._bitmaps: Dict[str, Dict[Tuple[str, str], int]] = {}
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Check whether the index is switched on in settings"""
+        return getattr(settings, 'SKILLS_VOLUNTEER_INDEX_ENABLED', False)
+
+    # ============ Build / Sync ============
+
+    def _load_state(self):
+        rows = VolunteerSkill.objects.values_list(
+            'volunteer_id',
+            'skill_id',
+            'verification_status',
+            'proficiency_level'
+        ).iterator(chunk_size=self.REBUILD_CHUNK_SIZE)
+
+        slots: Dict[str, int] = {}
+        volunteer_ids: List[Optional[str]] = []
+        skill_counts: List[int] = []
+        bitmaps: Dict[str, Dict[Tuple[str, str], int]] = {}
+
+        for volunteer_id, skill_id, verification_status, proficiency_level in rows:
+            volunteer_id = str(volunteer_id)
+            slot = slots.get(volunteer_id)
+            if slot is None:
+                slot = len(volunteer_ids)
+                slots[volunteer_id] = slot
+                volunteer_ids.append(volunteer_id)
+                skill_counts.append(0)
+            skill_counts[slot] += 1
+
+            buckets = bitmaps.setdefault(str(skill_id), {})
+            key = (verification_status, proficiency_level)
+            buckets[key] = buckets.get(key, 0) | (1 << slot)
+
+        return slots, volunteer_ids, skill_counts, bitmaps
+
+    def _set_state(self, state) -> None:
+        self._slots, self._volunteer_ids, self._skill_counts, self._bitmaps = state
+        self._free_slots = []
+
+    def _apply_changes(self, changes: List[List[Row]]) -> None:
+        for rows in changes:
+            for volunteer_id, skill_id, verification_status, proficiency_level in rows:
+                if verification_status is None:
+                    slot = self._slots.get(volunteer_id)
+                    if slot is not None and self._clear_slot(skill_id, slot)[1]:
+                        self._release_skill(volunteer_id, slot)
+                    continue
+
+                slot = self._get_or_create_slot(volunteer_id)
+                buckets, present = self._clear_slot(skill_id, slot)
+                if not present:
+                    self._skill_counts[slot] += 1
+                key = (verification_status, proficiency_level)
+                buckets[key] = buckets.get(key, 0) | (1 << slot)
+
+    def update(self, volunteer_skill: VolunteerSkill) -> None:
+        """Insert or move a volunteer skill to its current bucket"""
+        self.update_many([volunteer_skill])
+
+    def update_many(self, volunteer_skills: Iterable[VolunteerSkill]) -> None:
+        """Insert or move many volunteer skills as one change"""
+        self._publish([
+            (
+                str(volunteer_skill.volunteer_id),
+                str(volunteer_skill.skill_id),
+                volunteer_skill.verification_status,
+                volunteer_skill.proficiency_level,
+            )
+            for volunteer_skill in volunteer_skills
+        ])
+
+    def remove(self, volunteer_skill: VolunteerSkill) -> None:
+        """Remove a volunteer skill from the index"""
+        self._publish([
+            (str(volunteer_skill.volunteer_id), str(volunteer_skill.skill_id), None, None)
+        ])
+
+    def _get_or_create_slot(self, volunteer_id: str) -> int:
+        slot = self._slots.get(volunteer_id)
+        if slot is not None:
+            return slot
+
+        if self._free_slots:
+            # Reuse the lowest free slot so bitmaps stay as narrow as possible
+            slot = heapq.heappop(self._free_slots)
+            self._volunteer_ids[slot] = volunteer_id
+        else:
+            slot = len(self._volunteer_ids)
+            self._volunteer_ids.append(volunteer_id)
+            self._skill_counts.append(0)
+        self._slots[volunteer_id] = slot
+        return slot
+
+    def _release_skill(self, volunteer_id: str, slot: int) -> None:
+        """Count one skill less for a volunteer, freeing the slot with the last one"""
+        self._skill_counts[slot] -= 1
+        if self._skill_counts[slot] > 0:
+            return
+        del self._slots[volunteer_id]
+        self._volunteer_ids[slot] = None
+        heapq.heappush(self._free_slots, slot)
+
+    def _clear_slot(self, skill_id: str, slot: int) -> Tuple[Dict[Tuple[str, str], int], bool]:
+        """
+        Clear a volunteer's bit in every bucket of a skill
+
+        Returns:
+            The skill's buckets, and whether the bit was set anywhere
+        """
+        buckets = self._bitmaps.setdefault(skill_id, {})
+        bit = 1 << slot
+        present = False
+        for key in list(buckets):
+            if buckets[key] & bit:
+                present = True
+                buckets[key] &= ~bit
+                if not buckets[key]:
+                    del buckets[key]
+        return buckets, present
+
+    # ============ Search ============
+
+    def search(
+        self,
+        skill_ids: List[str],
+        verification_statuses: Optional[Iterable[str]] = None,
+        proficiency_levels: Optional[Iterable[str]] = None,
+        match_type: str = 'all',
+        limit: int = 50
+    ) -> List[Tuple[str, int]]:
+        """
+        Find volunteers holding the given skills
+
+        Args:
+            skill_ids: List of skill IDs to search for
+            verification_statuses: Allowed verification statuses (None = any)
+            proficiency_levels: Allowed proficiency levels (None = any)
+            match_type: 'all' (must have all skills) or 'any' (can have any skill)
+            limit: Maximum number of results
+
+        Returns:
+            List of (volunteer_id, matched_skill_count) ordered by match count
+        """
+        self.ensure_built()
+
+        statuses = set(verification_statuses) if verification_statuses is not None else None
+        levels = set(proficiency_levels) if proficiency_levels is not None else None
+        unique_skill_ids = list(dict.fromkeys(str(sid) for sid in skill_ids))
+
+        with self._lock:
+            masks = [
+                self._skill_mask(skill_id, statuses, levels)
+                for skill_id in unique_skill_ids
+            ]
+            volunteer_ids = self._volunteer_ids
+
+        if not masks:
+            return []
+
+        if match_type == 'all':
+            combined = masks[0]
+            for mask in masks[1:]:
+                combined &= mask
+            return [
+                (volunteer_ids[slot], len(masks))
+                for slot in self._iter_bits(combined, limit)
+            ]
+
+        # at_least[k] holds volunteers matching at least k + 1 of the skills
+        at_least: List[int] = []
+        for mask in masks:
+            at_least.append(0)
+            for k in range(len(at_least) - 1, 0, -1):
+                at_least[k] |= at_least[k - 1] & mask
+            at_least[0] |= mask
+
+        results: List[Tuple[str, int]] = []
+        higher = 0
+        for k in range(len(at_least) - 1, -1, -1):
+            exact = at_least[k] & ~higher
+            higher = at_least[k]
+            for slot in self._iter_bits(exact, limit - len(results)):
+                results.append((volunteer_ids[slot], k + 1))
+            if len(results) >= limit:
+                break
+
+        return results
+
+    def _skill_mask(
+        self,
+        skill_id: str,
+        statuses: Optional[set],
+        levels: Optional[set]
+    ) -> int:
+        mask = 0
+        for (status, level), bitmap in self._bitmaps.get(skill_id, {}).items():
+            if statuses is not None and status not in statuses:
+                continue
+            if levels is not None and level not in levels:
+                continue
+            mask |= bitmap
+        return mask
+
+    @staticmethod
+    def _iter_bits(mask: int, limit: int) -> Iterator[int]:
+        """Yield positions of set bits in ascending order, at most `limit`"""
+        if mask <= 0 or limit <= 0:
+            return
+        bits = bin(mask)[:1:-1]
+        position = bits.find('1')
+        count = 0
+        while position != -1 and count < limit:
+            yield position
+            count += 1
+            position = bits.find('1', position + 1)
+
+
+volunteer_skill_index = VolunteerSkillIndex()
@@ -1,13 +1,18 @@
 
 from django.db import transaction
-from django.db.models import Count, Q
+from django.db.models import F
+from django.db.models.functions import Coalesce
 from django.core.exceptions import ValidationError
 from typing import List, Optional, Dict, Any
-from ..models import Skill, SkillCategory
+from apps.core.search import fulltext_search, is_postgres, rank_in_python, weighted_vector
+from ..models import Skill, SkillCategory, SkillUsageCounter
+from .skill_autocomplete_index import skill_autocomplete_index
+from .skill_usage_service import SkillUsageService
 
 
 class SkillService:
    
+    SEARCH_FIELDS = (('name', 'A'), ('description', 'B'))
 
     @staticmethod
     def get_all_skills(
@@ -54,8 +59,8 @@ class SkillService:
         return Skill.objects.filter(
             is_active=True
         ).annotate(
-            volunteer_count=Count('volunteer_skills')
-        ).order_by('-volunteer_count')[:limit]
+            volunteer_count=Coalesce('usage__volunteer_count', 0)
+        ).order_by(F('usage__volunteer_count').desc(nulls_last=True))[:limit]
 
     @staticmethod
     @transaction.atomic
@@ -64,7 +69,8 @@ class SkillService:
         category_id: str,
         description: Optional[str] = None,
         verification_requirement: str = Skill.VerificationRequirement.NONE,
-        is_active: bool = True
+        is_active: bool = True,
+        aliases: Optional[List[str]] = None
     ) -> Skill:
         
         # Validate name
@@ -93,7 +99,8 @@ class SkillService:
             category=category,
             description=description,
             verification_requirement=verification_requirement,
-            is_active=is_active
+            is_active=is_active,
+            aliases=aliases or []
         )
 
         return skill
@@ -106,7 +113,8 @@ class SkillService:
         category_id: Optional[str] = None,
         description: Optional[str] = None,
         verification_requirement: Optional[str] = None,
-        is_active: Optional[bool] = None
+        is_active: Optional[bool] = None,
+        aliases: Optional[List[str]] = None
     ) -> Skill:
       
         try:
@@ -150,6 +158,10 @@ class SkillService:
         if is_active is not None:
             skill.is_active = is_active
 
+        # Update aliases if provided
+        if aliases is not None:
+            skill.aliases = aliases
+
         skill.save()
         return skill
 
@@ -182,15 +194,19 @@ class SkillService:
     def delete_skill(skill_id: str, force: bool = False) -> Dict[str, Any]:
         
         try:
-            skill = Skill.objects.prefetch_related(
-                'volunteer_skills',
-                'mission_skills'
-            ).get(id=skill_id)
+            skill = Skill.objects.select_related('usage').get(id=skill_id)
         except Skill.DoesNotExist:
             raise ValidationError("Skill not found.")
 
-        volunteer_count = skill.volunteer_skills.count()
-        mission_count = skill.mission_skills.count()
+        # Whether the skill is in use comes from the rows themselves, so a
+        # drifted counter cannot let a plain delete cascade; the counters
+        # only supply the numbers, counted exactly if they say 0
+        usage = SkillService._get_usage(skill)
+        volunteer_count = mission_count = 0
+        if skill.volunteer_skills.exists():
+            volunteer_count = usage.volunteer_count or skill.volunteer_skills.count()
+        if skill.mission_skills.exists():
+            mission_count = usage.mission_count or skill.mission_skills.count()
 
         if not force and (volunteer_count > 0 or mission_count > 0):
             raise ValidationError(
@@ -215,45 +231,55 @@ class SkillService:
         if not query:
             return []
 
-        queryset = Skill.objects.filter(
-            Q(name__icontains=query) | Q(description__icontains=query),
-            is_active=True
-        )
+        queryset = Skill.objects.filter(is_active=True).select_related('category')
 
         if category_id:
             queryset = queryset.filter(category_id=category_id)
 
-        return queryset.select_related('category').order_by('name')
+        # Ranked full-text + trigram search on PostgreSQL; elsewhere rank the
+        # (small) skill catalogue in Python with the same rules
+        if is_postgres():
+            return list(fulltext_search(queryset, query))
+        return rank_in_python(queryset, query, SkillService.SEARCH_FIELDS)
+
+    @staticmethod
+    def autocomplete_skills(prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Suggest active skills for a typed prefix from the in-process index
+        """
+        return skill_autocomplete_index.complete(prefix, limit)
+
+    @staticmethod
+    def refresh_search_vector(skill_id: str) -> None:
+        """
+        Recompute a skill's stored search document (PostgreSQL only)
+        """
+        if is_postgres():
+            Skill.objects.filter(id=skill_id).update(
+                search_vector=weighted_vector(SkillService.SEARCH_FIELDS)
+            )
 
     @staticmethod
     def get_skill_statistics(skill_id: str) -> Dict[str, Any]:
   
         try:
-            skill = Skill.objects.prefetch_related(
-                'volunteer_skills',
-                'mission_skills'
-            ).get(id=skill_id)
+            skill = Skill.objects.select_related('category', 'usage').get(id=skill_id)
         except Skill.DoesNotExist:
             raise ValidationError("Skill not found.")
 
-        # Count volunteers by verification status
-        volunteer_stats = skill.volunteer_skills.values(
-            'verification_status'
-        ).annotate(count=Count('id'))
+        # Counts come from the maintained usage counters
+        usage = SkillService._get_usage(skill)
 
         verification_breakdown = {
-            stat['verification_status']: stat['count']
-            for stat in volunteer_stats
+            status: getattr(usage, field)
+            for status, field in SkillUsageService.VOLUNTEER_STATUS_FIELDS.items()
+            if getattr(usage, field)
         }
 
-        # Count missions by requirement level
-        mission_stats = skill.mission_skills.values(
-            'requirement_level'
-        ).annotate(count=Count('id'))
-
         requirement_breakdown = {
-            stat['requirement_level']: stat['count']
-            for stat in mission_stats
+            level: getattr(usage, field)
+            for level, field in SkillUsageService.MISSION_LEVEL_FIELDS.items()
+            if getattr(usage, field)
         }
 
         return {
@@ -262,12 +288,20 @@ class SkillService:
             'category': skill.category.name,
             'is_active': skill.is_active,
             'verification_requirement': skill.get_verification_requirement_display(),
-            'total_volunteers': skill.volunteer_skills.count(),
+            'total_volunteers': usage.volunteer_count,
             'verification_breakdown': verification_breakdown,
-            'total_missions': skill.mission_skills.count(),
+            'total_missions': usage.mission_count,
             'requirement_breakdown': requirement_breakdown
         }
 
+    @staticmethod
+    def _get_usage(skill: Skill) -> SkillUsageCounter:
+        """A skill's usage counters (all zero if it was never used)"""
+        try:
+            return skill.usage
+        except SkillUsageCounter.DoesNotExist:
+            return SkillUsageCounter(skill=skill)
+
     @staticmethod
     def get_skills_by_category(category_id: str, active_only: bool = True) -> List[Skill]:
      
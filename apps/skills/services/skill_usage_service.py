@@ -0,0 +1,222 @@
+"""
+Skill Usage Service
+Maintains the denormalized per-skill volunteer and mission counters
+"""
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+
+from ..models import MissionSkill, Skill, SkillUsageCounter, VolunteerSkill
+from apps.core.constants import RequirementLevel, SkillVerificationStatus
+
+
+class SkillUsageService:
+    """Service for skill usage counters"""
+
+    VOLUNTEER_STATUS_FIELDS = {
+        SkillVerificationStatus.PENDING: 'volunteers_pending',
+        SkillVerificationStatus.VERIFIED: 'volunteers_verified',
+        SkillVerificationStatus.REJECTED: 'volunteers_rejected',
+        SkillVerificationStatus.NOT_REQUIRED: 'volunteers_not_required',
+    }
+    MISSION_LEVEL_FIELDS = {
+        RequirementLevel.NICE_TO_HAVE: 'missions_nice_to_have',
+        RequirementLevel.PREFERRED: 'missions_preferred',
+        RequirementLevel.REQUIRED: 'missions_required',
+        RequirementLevel.CRITICAL: 'missions_critical',
+    }
+    COUNTER_FIELDS = [
+        'volunteer_count', *VOLUNTEER_STATUS_FIELDS.values(),
+        'mission_count', *MISSION_LEVEL_FIELDS.values(),
+    ]
+
+    # ============ Write path ============
+
+    @staticmethod
+    def move_volunteer_skill(
+        old: Optional[tuple],
+        new: Optional[tuple]
+    ) -> None:
+        """
+        Move one volunteer skill between counters
+
+        Args:
+            old: (skill_id, verification_status) before the write, None if created
+            new: (skill_id, verification_status) after the write, None if deleted
+        """
+        SkillUsageService._move(
+            old, new, 'volunteer_count', SkillUsageService.VOLUNTEER_STATUS_FIELDS
+        )
+
+    @staticmethod
+    def move_mission_skill(
+        old: Optional[tuple],
+        new: Optional[tuple]
+    ) -> None:
+        """
+        Move one mission skill between counters
+
+        Args:
+            old: (skill_id, requirement_level) before the write, None if created
+            new: (skill_id, requirement_level) after the write, None if deleted
+        """
+        SkillUsageService._move(
+            old, new, 'mission_count', SkillUsageService.MISSION_LEVEL_FIELDS
+        )
+
+    @staticmethod
+    def add_volunteer_skills(skill_statuses: Iterable[tuple]) -> None:
+        """
+        Count many new volunteer skills at once (for bulk writes that skip
+        signals), with one UPDATE per verification status
+
+        Args:
+            skill_statuses: (skill_id, verification_status) of each new row
+        """
+        SkillUsageService.move_volunteer_skills((None, new) for new in skill_statuses)
+
+    @staticmethod
+    def move_volunteer_skills(moves: Iterable[tuple]) -> None:
+        """
+        Move many volunteer skills between counters at once (for bulk writes
+        that skip signals), with one UPDATE per distinct set of deltas
+
+        Args:
+            moves: (old, new) pairs as taken by move_volunteer_skill
+        """
+        deltas: Dict[str, Dict[str, int]] = defaultdict(Counter)
+        for old, new in moves:
+            SkillUsageService._add_deltas(
+                deltas, old, new, 'volunteer_count', SkillUsageService.VOLUNTEER_STATUS_FIELDS
+            )
+
+        groups: Dict[tuple, List[str]] = defaultdict(list)
+        for skill_id, skill_deltas in deltas.items():
+            key = tuple(sorted((field, delta) for field, delta in skill_deltas.items() if delta))
+            if key:
+                groups[key].append(skill_id)
+        if not groups:
+            return
+
+        SkillUsageCounter.objects.bulk_create(
+            [
+                SkillUsageCounter(skill_id=skill_id)
+                for key, skill_ids in groups.items()
+                if any(delta > 0 for _, delta in key)
+                for skill_id in skill_ids
+            ],
+            ignore_conflicts=True
+        )
+        for key, skill_ids in groups.items():
+            SkillUsageCounter.objects.filter(skill_id__in=skill_ids).update(
+                **SkillUsageService._updates(dict(key))
+            )
+
+    @staticmethod
+    def _move(old, new, total_field: str, bucket_fields: Dict[str, str]) -> None:
+        if old == new:
+            return
+
+        deltas: Dict[str, Dict[str, int]] = defaultdict(Counter)
+        SkillUsageService._add_deltas(deltas, old, new, total_field, bucket_fields)
+
+        for skill_id, skill_deltas in deltas.items():
+            SkillUsageService._apply(skill_id, skill_deltas)
+
+    @staticmethod
+    def _add_deltas(
+        deltas: Dict[str, Dict[str, int]],
+        old: Optional[tuple],
+        new: Optional[tuple],
+        total_field: str,
+        bucket_fields: Dict[str, str]
+    ) -> None:
+        """Accumulate the per-skill counter deltas of moving old to new"""
+        for entry, delta in ((old, -1), (new, 1)):
+            if entry is None:
+                continue
+            skill_id, bucket = entry
+            skill_deltas = deltas[str(skill_id)]
+            skill_deltas[total_field] += delta
+            skill_deltas[bucket_fields[bucket]] += delta
+
+    @staticmethod
+    def _updates(deltas: Dict[str, int]) -> Dict[str, Any]:
+        """F-expression updates adding deltas to counters"""
+        # Never drive a drifted counter below zero; reconcile() repairs it
+        return {
+            field: F(field) + delta if delta > 0 else Greatest(F(field) + delta, 0)
+            for field, delta in deltas.items()
+        }
+
+    @staticmethod
+    def _apply(skill_id: str, deltas: Dict[str, int]) -> None:
+        """Add deltas to a skill's counters with one atomic UPDATE"""
+        deltas = {field: delta for field, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        updates = SkillUsageService._updates(deltas)
+        updated = SkillUsageCounter.objects.filter(skill_id=skill_id).update(**updates)
+        if not updated and any(delta > 0 for delta in deltas.values()):
+            # First use of this skill: create its row, then apply the deltas
+            # so concurrent first writes cannot overwrite each other. Pure
+            # decrements never create rows (the skill may be mid-delete).
+            SkillUsageCounter.objects.get_or_create(skill_id=skill_id)
+            SkillUsageCounter.objects.filter(skill_id=skill_id).update(**updates)
+
+    # ============ Reconciliation ============
+
+    @staticmethod
+    @transaction.atomic
+    def reconcile() -> int:
+        """
+        Recompute every skill's counters from volunteer_skills and mission_skills
+
+        Returns:
+            Number of skills whose stored counters were wrong
+        """
+        fresh = {
+            skill_id: dict.fromkeys(SkillUsageService.COUNTER_FIELDS, 0)
+            for skill_id in Skill.objects.values_list('id', flat=True)
+        }
+
+        volunteer_rows = VolunteerSkill.objects.values(
+            'skill_id', 'verification_status'
+        ).annotate(count=Count('id')).order_by()
+        for row in volunteer_rows:
+            counters = fresh[row['skill_id']]
+            counters['volunteer_count'] += row['count']
+            counters[SkillUsageService.VOLUNTEER_STATUS_FIELDS[row['verification_status']]] += row['count']
+
+        mission_rows = MissionSkill.objects.values(
+            'skill_id', 'requirement_level'
+        ).annotate(count=Count('id')).order_by()
+        for row in mission_rows:
+            counters = fresh[row['skill_id']]
+            counters['mission_count'] += row['count']
+            counters[SkillUsageService.MISSION_LEVEL_FIELDS[row['requirement_level']]] += row['count']
+
+        stored = {
+            row.pop('skill_id'): row
+            for row in SkillUsageCounter.objects.values('skill_id', *SkillUsageService.COUNTER_FIELDS)
+        }
+        # A missing row reads as all zeros, so unused skills need no row
+        zeros = dict.fromkeys(SkillUsageService.COUNTER_FIELDS, 0)
+        drifted = [
+            SkillUsageCounter(skill_id=skill_id, **counters)
+            for skill_id, counters in fresh.items()
+            if stored.get(skill_id, zeros) != counters
+        ]
+
+        SkillUsageCounter.objects.bulk_create(
+            drifted,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['skill'],
+            update_fields=SkillUsageService.COUNTER_FIELDS
+        )
+        return len(drifted)
@@ -1,14 +1,24 @@
+from collections import Counter
+from datetime import timedelta
+from django.conf import settings
 from django.db import transaction, models
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Greatest
 from django.core.exceptions import ValidationError, PermissionDenied
 from django.utils import timezone
-from typing import List, Optional, Dict, Any
-from ..models import VolunteerSkill, VerificationRequest
+from typing import Iterable, List, Optional, Dict, Any, Tuple
+from ..models import DocumentBlob, VolunteerSkill, VerificationRequest, VerificationStatusCounter
 from apps.core.constants import SkillVerificationStatus
+from .volunteer_skill_service import VolunteerSkillService
 
 
 class VerificationService:
     """Service for managing verification requests"""
     
+    # Requests the review queue hands out; needs_more_info waits on the volunteer
+    QUEUE_STATUSES = ['pending', 'under_review']
+    MAX_CLAIM_SIZE = 50
+    
     @staticmethod
     @transaction.atomic
     def request_verification(
@@ -45,21 +55,35 @@ class VerificationService:
         volunteer_skill.verification_requested = True
         volunteer_skill.verification_request_date = timezone.now()
         if documents:
-            volunteer_skill.verification_documents = documents
+            # Point at the blob stored for the request instead of storing it again
+            volunteer_skill.verification_documents = verification_request.request_documents.name
         if links:
             volunteer_skill.verification_links = links
         volunteer_skill.save()
         
         return verification_request
     
+    @staticmethod
+    def with_document_previews(queryset):
+        """
+        Annotate requests with their document's thumbnail and preview names
+        (document_thumbnail, document_preview), so listing them needs no
+        per-row blob lookups
+        """
+        blobs = DocumentBlob.objects.filter(name=OuterRef('request_documents'))
+        return queryset.annotate(
+            document_thumbnail=Subquery(blobs.values('thumbnail')[:1]),
+            document_preview=Subquery(blobs.values('preview')[:1])
+        )
+    
     @staticmethod
     def get_verification_requests_for_skill(
         volunteer_skill_id: str
     ) -> List[VerificationRequest]:
         """Get all verification requests for a volunteer skill"""
-        return VerificationRequest.objects.filter(
+        return VerificationService.with_document_previews(VerificationRequest.objects.filter(
             volunteer_skill_id=volunteer_skill_id
-        ).select_related(
+        )).select_related(
             'volunteer_skill',
             'volunteer_skill__volunteer__user',
             'volunteer_skill__skill',
@@ -70,9 +94,9 @@ class VerificationService:
     @staticmethod
     def get_pending_verification_requests() -> List[VerificationRequest]:
         """Get all pending verification requests"""
-        return VerificationRequest.objects.filter(
+        return VerificationService.with_document_previews(VerificationRequest.objects.filter(
             review_status__in=['pending', 'under_review', 'needs_more_info']
-        ).select_related(
+        )).select_related(
             'volunteer_skill',
             'volunteer_skill__volunteer__user',
             'volunteer_skill__skill',
@@ -80,6 +104,104 @@ class VerificationService:
             'reviewed_by'
         ).order_by('-request_date')
     
+    @staticmethod
+    def claim_verification_requests(
+        reviewer_id: str,
+        limit: int = 10,
+        lease_seconds: Optional[int] = None
+    ) -> List[VerificationRequest]:
+        """
+        Claim the oldest open verification requests for a reviewer
+        
+        Rows are picked with SELECT ... FOR UPDATE SKIP LOCKED, so reviewers
+        claiming at the same time get disjoint batches instead of waiting on
+        each other. A claim lasts lease_seconds and then lapses on its own;
+        claiming again renews the reviewer's unexpired claims.
+        
+        Args:
+            reviewer_id: Reviewing admin's user ID
+            limit: Maximum number of requests to hand out
+            lease_seconds: Claim duration (defaults to
+                SKILLS_VERIFICATION_CLAIM_SECONDS)
+        
+        Returns:
+            Claimed requests, oldest first
+        """
+        if limit < 1 or limit > VerificationService.MAX_CLAIM_SIZE:
+            raise ValidationError(
+                f"Limit must be between 1 and {VerificationService.MAX_CLAIM_SIZE}."
+            )
+        if lease_seconds is None:
+            lease_seconds = getattr(settings, 'SKILLS_VERIFICATION_CLAIM_SECONDS', 900)
+        
+        now = timezone.now()
+        with transaction.atomic():
+            claimed = list(
+                VerificationRequest.objects.select_for_update(
+                    skip_locked=True
+                ).filter(
+                    Q(claim_expires_at__isnull=True)
+                    | Q(claim_expires_at__lte=now)
+                    | Q(claimed_by_id=reviewer_id),
+                    review_status__in=VerificationService.QUEUE_STATUSES
+                ).order_by('request_date', 'id').values_list('id', 'review_status')[:limit]
+            )
+            claimed_ids = [request_id for request_id, _ in claimed]
+            VerificationRequest.objects.filter(id__in=claimed_ids).update(
+                claimed_by_id=reviewer_id,
+                claim_expires_at=now + timedelta(seconds=lease_seconds),
+                review_status='under_review',
+                updated_at=now
+            )
+            VerificationService.move_status_counts(
+                (review_status, 'under_review') for _, review_status in claimed
+            )
+        
+        return list(
+            VerificationService.with_document_previews(VerificationRequest.objects.filter(
+                id__in=claimed_ids
+            )).select_related(
+                'volunteer_skill',
+                'volunteer_skill__volunteer__user',
+                'volunteer_skill__skill',
+                'volunteer_skill__skill__category',
+                'reviewed_by'
+            ).order_by('request_date', 'id')
+        )
+    
+    @staticmethod
+    def release_verification_requests(
+        reviewer_id: str,
+        verification_request_ids: Optional[Iterable[str]] = None
+    ) -> int:
+        """
+        Hand a reviewer's unreviewed claims back to the queue
+        
+        Args:
+            reviewer_id: Reviewing admin's user ID
+            verification_request_ids: Requests to release (all of the
+                reviewer's claims if omitted)
+        
+        Returns:
+            Number of released requests
+        """
+        claims = VerificationRequest.objects.filter(
+            claimed_by_id=reviewer_id,
+            review_status='under_review'
+        )
+        if verification_request_ids is not None:
+            claims = claims.filter(id__in=list(verification_request_ids))
+        
+        with transaction.atomic():
+            released = claims.update(
+                claimed_by=None,
+                claim_expires_at=None,
+                review_status='pending',
+                updated_at=timezone.now()
+            )
+            VerificationService.move_status_counts([('under_review', 'pending')] * released)
+        return released
+    
     @staticmethod
     @transaction.atomic
     def review_verification_request(
@@ -91,19 +213,28 @@ class VerificationService:
     ) -> VerificationRequest:
         """Review a verification request (admin action)"""
         try:
-            verification_request = VerificationRequest.objects.select_related(
+            verification_request = VerificationRequest.objects.select_for_update(
+                of=('self',)
+            ).select_related(
                 'volunteer_skill',
                 'volunteer_skill__skill'
             ).get(id=verification_request_id)
         except VerificationRequest.DoesNotExist:
             raise ValidationError("Verification request not found.")
         
+        if verification_request.is_claimed_by_other(reviewer_id):
+            raise ValidationError(
+                "This verification request is claimed by another reviewer."
+            )
+        
         # Update verification request
         verification_request.reviewed_by_id = reviewer_id
         verification_request.review_date = timezone.now()
         verification_request.review_status = review_status
         verification_request.review_notes = review_notes or ''
         verification_request.admin_notes = admin_notes or ''
+        verification_request.claimed_by = None
+        verification_request.claim_expires_at = None
         verification_request.save()
         
         # Update volunteer skill based on review status
@@ -128,33 +259,152 @@ class VerificationService:
         
         return verification_request
     
+    @staticmethod
+    @transaction.atomic
+    def bulk_review_verification_requests(
+        verification_request_ids: List[str],
+        reviewer_id: str,
+        review_status: str,
+        review_notes: Optional[str] = None,
+        admin_notes: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Apply one review decision to many verification requests (admin action)
+        
+        Same outcome as review_verification_request per request, written with
+        one UPDATE for the requests and one for their volunteer skills.
+        
+        Returns:
+            Dictionary with per-request results
+        """
+        requested_ids = list(dict.fromkeys(str(request_id) for request_id in verification_request_ids))
+        now = timezone.now()
+        
+        verification_requests = {
+            str(verification_request.id): verification_request
+            for verification_request in VerificationRequest.objects.select_for_update(
+                of=('self', 'volunteer_skill')
+            ).select_related(
+                'volunteer_skill'
+            ).only(
+                'review_status',
+                'claimed_by',
+                'claim_expires_at',
+                'volunteer_skill__volunteer',
+                'volunteer_skill__skill',
+                'volunteer_skill__verification_status',
+                'volunteer_skill__proficiency_level',
+            ).filter(id__in=requested_ids)
+        }
+        
+        reviewed = []
+        failed = []
+        for request_id in requested_ids:
+            verification_request = verification_requests.get(request_id)
+            if verification_request is None:
+                failed.append({
+                    'verification_request_id': request_id,
+                    'error': 'Verification request not found.'
+                })
+            elif verification_request.is_claimed_by_other(reviewer_id, now):
+                failed.append({
+                    'verification_request_id': request_id,
+                    'error': 'This verification request is claimed by another reviewer.'
+                })
+            else:
+                reviewed.append(verification_request)
+        
+        if reviewed:
+            VerificationRequest.objects.filter(
+                id__in=[verification_request.id for verification_request in reviewed]
+            ).update(
+                reviewed_by_id=reviewer_id,
+                review_date=now,
+                review_status=review_status,
+                review_notes=review_notes or '',
+                admin_notes=admin_notes or '',
+                claimed_by=None,
+                claim_expires_at=None,
+                updated_at=now
+            )
+            VerificationService.move_status_counts(
+                (verification_request.review_status, review_status)
+                for verification_request in reviewed
+            )
+            VerificationService._bulk_update_volunteer_skills(
+                reviewed, reviewer_id, review_status, review_notes, now
+            )
+        
+        return {
+            'total_attempted': len(requested_ids),
+            'successfully_reviewed': len(reviewed),
+            'failed': len(failed),
+            'reviewed_requests': [
+                str(verification_request.id) for verification_request in reviewed
+            ],
+            'failed_requests': failed
+        }
+    
+    @staticmethod
+    def _bulk_update_volunteer_skills(
+        verification_requests: List[VerificationRequest],
+        reviewer_id: str,
+        review_status: str,
+        review_notes: Optional[str],
+        now
+    ) -> None:
+        """Volunteer skill changes of review_verification_request, as one UPDATE"""
+        if review_status == 'approved':
+            updates = {
+                'verification_status': SkillVerificationStatus.VERIFIED,
+                'verified_by_id': reviewer_id,
+                'verification_date': now,
+                'verification_notes': f"Approved via verification request: {review_notes}",
+                'verification_requested': False,
+            }
+        elif review_status == 'rejected':
+            updates = {
+                'verification_notes': f"Verification request rejected: {review_notes}",
+                'verification_requested': False,
+            }
+        elif review_status == 'needs_more_info':
+            updates = {
+                'verification_notes': f"Needs more information: {review_notes}",
+            }
+        else:
+            updates = {}
+        
+        # Several requests may share a volunteer skill; update it once
+        volunteer_skills = {
+            str(verification_request.volunteer_skill_id): verification_request.volunteer_skill
+            for verification_request in verification_requests
+        }
+        VolunteerSkill.objects.filter(id__in=list(volunteer_skills)).update(updated_at=now, **updates)
+        
+        previous_statuses = {
+            volunteer_skill_id: volunteer_skill.verification_status
+            for volunteer_skill_id, volunteer_skill in volunteer_skills.items()
+        }
+        for volunteer_skill in volunteer_skills.values():
+            volunteer_skill.verification_status = updates.get(
+                'verification_status', volunteer_skill.verification_status
+            )
+        VolunteerSkillService.after_bulk_update(list(volunteer_skills.values()), previous_statuses)
+    
     @staticmethod
     def get_verification_request_stats() -> Dict[str, Any]:
-        """Get statistics about verification requests"""
-        total = VerificationRequest.objects.count()
-        pending = VerificationRequest.objects.filter(
-            review_status='pending'
-        ).count()
-        under_review = VerificationRequest.objects.filter(
-            review_status='under_review'
-        ).count()
-        approved = VerificationRequest.objects.filter(
-            review_status='approved'
-        ).count()
-        rejected = VerificationRequest.objects.filter(
-            review_status='rejected'
-        ).count()
-        needs_more_info = VerificationRequest.objects.filter(
-            review_status='needs_more_info'
-        ).count()
+        """Get statistics about verification requests (from the status counters)"""
+        counts = VerificationService._status_counts(
+            VerificationStatusCounter.objects.values_list('review_status', 'count')
+        )
         
         return {
-            'total_requests': total,
-            'pending_review': pending,
-            'under_review': under_review,
-            'approved': approved,
-            'rejected': rejected,
-            'needs_more_info': needs_more_info,
+            'total_requests': sum(counts.values()),
+            'pending_review': counts['pending'],
+            'under_review': counts['under_review'],
+            'approved': counts['approved'],
+            'rejected': counts['rejected'],
+            'needs_more_info': counts['needs_more_info'],
         }
     
     @staticmethod
@@ -162,11 +412,86 @@ class VerificationService:
         volunteer_id: str
     ) -> List[VerificationRequest]:
         """Get all verification requests for a volunteer"""
-        return VerificationRequest.objects.filter(
+        return VerificationService.with_document_previews(VerificationRequest.objects.filter(
             volunteer_skill__volunteer_id=volunteer_id
-        ).select_related(
+        )).select_related(
             'volunteer_skill',
             'volunteer_skill__skill',
             'volunteer_skill__skill__category',
             'reviewed_by'
-        ).order_by('-request_date')
\ No newline at end of file
+        ).order_by('-request_date')
+    
+    # ============ Status counters ============
+    
+    @staticmethod
+    def move_status_counts(changes: Iterable[Tuple[Optional[str], Optional[str]]]) -> None:
+        """
+        Move requests between review status counters (in the same
+        transaction as the write), with one UPDATE per changed status
+        
+        Args:
+            changes: (old_status, new_status) per request, None when created/deleted
+        """
+        deltas = Counter()
+        for old_status, new_status in changes:
+            if old_status == new_status:
+                continue
+            if old_status is not None:
+                deltas[old_status] -= 1
+            if new_status is not None:
+                deltas[new_status] += 1
+        
+        for review_status, delta in deltas.items():
+            if not delta:
+                continue
+            # Never drive a drifted counter below zero; reconciliation repairs it
+            count = F('count') + delta if delta > 0 else Greatest(F('count') + delta, 0)
+            updated = VerificationStatusCounter.objects.filter(
+                review_status=review_status
+            ).update(count=count)
+            if not updated and delta > 0:
+                VerificationStatusCounter.objects.get_or_create(review_status=review_status)
+                VerificationStatusCounter.objects.filter(
+                    review_status=review_status
+                ).update(count=count)
+    
+    @staticmethod
+    @transaction.atomic
+    def reconcile_status_counters() -> int:
+        """
+        Recount verification requests per review status
+        
+        The counter rows are locked first, so writes made meanwhile are
+        either counted or applied on top of the fresh counts, never lost.
+        
+        Returns:
+            Number of statuses whose stored count was wrong
+        """
+        stored = dict(
+            VerificationStatusCounter.objects.select_for_update().values_list('review_status', 'count')
+        )
+        fresh = VerificationService._status_counts(
+            VerificationRequest.objects.values('review_status').annotate(
+                count=Count('id')
+            ).order_by().values_list('review_status', 'count')
+        )
+        drifted = [
+            VerificationStatusCounter(review_status=review_status, count=count)
+            for review_status, count in fresh.items()
+            if stored.get(review_status) != count
+        ]
+        
+        VerificationStatusCounter.objects.bulk_create(
+            drifted,
+            update_conflicts=True,
+            unique_fields=['review_status'],
+            update_fields=['count']
+        )
+        return len(drifted)
+    
+    @staticmethod
+    def _status_counts(rows: Iterable[Tuple[str, int]]) -> Dict[str, int]:
+        """Counts per review status, zero for statuses without rows"""
+        counts = {review_status: 0 for review_status, _ in VerificationRequest.REVIEW_STATUS_CHOICES}
+        counts.update(rows)
+        return counts
\ No newline at end of file
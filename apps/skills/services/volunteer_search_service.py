@@ -2,16 +2,33 @@
 Volunteer Search Service
 Business logic for searching volunteers by skills
 """
-from django.db.models import Q, Count, Prefetch
-from typing import List, Dict, Any, Optional, Set
+import hashlib
+import heapq
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q, Count, F, Max, Window
+from django.db.models.functions import RowNumber
+from typing import List, Dict, Any, Callable, Iterable, Optional, Tuple
 from apps.accounts.models import VolunteerProfile
-from ..models import VolunteerSkill, MissionSkill, Skill
+from ..models import VolunteerSkill, MissionSkill, MissionVolunteerMatch, Skill, SkillCategoryClosure
+from apps.core.cache import bump_versions, get_versioned
 from apps.core.constants import SkillVerificationStatus, ProficiencyLevel
+from apps.core.geo import covering_geohashes, haversine_km, resolve_point
+from .skill_index import volunteer_skill_index
+from .skill_category_service import SkillCategoryService
 
 
 class VolunteerSearchService:
     """Service for searching volunteers by skills"""
     
+    SEARCH_CACHE_PREFIX = 'skills:volunteer_search_ranking'
+    SKILL_VERSION_PREFIX = 'skills:skill_version'
+    CATEGORY_VERSION_PREFIX = 'skills:category_version'
+    TRAVEL_REACH_CACHE_KEY = 'skills:volunteer_travel_reach'
+    TRAVEL_VERSION_CACHE_KEY = 'skills:volunteer_travel_version'
+    # Travel radius assumed for volunteers who are not willing to travel
+    LOCAL_RADIUS_KM = 10
+    
     @staticmethod
     def search_volunteers_by_skills(
         skill_ids: List[str],
@@ -33,177 +50,364 @@ class VolunteerSearchService:
         Returns:
             List of volunteer data with matched skills
         """
-        # Build base query for volunteer skills
-        skill_query = Q(volunteer_skills__skill_id__in=skill_ids)
+        skill_ids = sorted({str(skill_id) for skill_id in skill_ids})
         
-        if verified_only:
-            skill_query &= Q(volunteer_skills__verification_status=SkillVerificationStatus.VERIFIED)
+        def search():
+            if volunteer_skill_index.is_enabled():
+                volunteer_ids = VolunteerSearchService._search_with_index(
+                    skill_ids=skill_ids,
+                    verified_only=verified_only,
+                    min_proficiency_level=min_proficiency_level,
+                    match_type=match_type,
+                    limit=limit
+                )
+            else:
+                volunteer_ids = VolunteerSearchService._search_with_query(
+                    skill_ids=skill_ids,
+                    verified_only=verified_only,
+                    min_proficiency_level=min_proficiency_level,
+                    match_type=match_type,
+                    limit=limit
+                )
+            return [str(volunteer_id) for volunteer_id in volunteer_ids]
         
-        if min_proficiency_level:
-            # Get proficiency levels greater than or equal to minimum
-            proficiency_levels = VolunteerSearchService._get_proficiency_levels_gte(min_proficiency_level)
-            skill_query &= Q(volunteer_skills__proficiency_level__in=proficiency_levels)
+        volunteer_ids = VolunteerSearchService._cached_search(
+            cache_key=VolunteerSearchService._search_cache_key(
+                'skills', ','.join(skill_ids), verified_only, min_proficiency_level, match_type, limit
+            ),
+            version_keys=[VolunteerSearchService._skill_version_key(skill_id) for skill_id in skill_ids],
+            search=search
+        )
+        return VolunteerSearchService._build_volunteer_results(volunteer_ids, skill_ids)
+    
+    @staticmethod
+    def invalidate_skill_searches(*skill_ids: str) -> None:
+        """
+        Invalidate every cached search involving the given skills by bumping
+        their versions and the versions of their categories and all ancestor
+        categories (called after VolunteerSkill writes)
+        """
+        keys = [VolunteerSearchService._skill_version_key(skill_id) for skill_id in skill_ids]
+        keys.extend(
+            VolunteerSearchService._category_version_key(category_id)
+            for category_id in SkillCategoryClosure.objects.filter(
+                descendant__skills__id__in=skill_ids
+            ).values_list('ancestor_id', flat=True).distinct()
+        )
+        bump_versions(*keys)
+    
+    @staticmethod
+    def find_volunteers_for_mission(
+        mission_id: str,
+        require_all_skills: bool = True,
+        verified_only: bool = True,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        Find volunteers that match mission skill requirements
         
-        # Get volunteers with annotations
-        volunteers_queryset = VolunteerProfile.objects.filter(
-            skill_query
-        ).prefetch_related(
-            Prefetch(
-                'volunteer_skills',
-                queryset=VolunteerSkill.objects.filter(
-                    skill_id__in=skill_ids
-                ).select_related('skill', 'skill__category')
-            )
-        ).annotate(
-            matched_skill_count=Count('volunteer_skills', filter=Q(volunteer_skills__skill_id__in=skill_ids))
-        ).distinct()
+        Args:
+            mission_id: Mission ID
+            require_all_skills: Only return volunteers with ALL required skills
+            verified_only: Only consider verified skills
+            limit: Maximum number of results
+            
+        Returns:
+            List of volunteers with skill match information
+        """
+        all_skill_ids = [
+            str(skill_id) for skill_id in MissionSkill.objects.filter(
+                mission_id=mission_id
+            ).values_list('skill_id', flat=True)
+        ]
         
-        # Filter based on match type
-        if match_type == 'all':
-            # Must have ALL skills
-            volunteers_queryset = volunteers_queryset.filter(
-                matched_skill_count=len(skill_ids)
-            )
+        if not all_skill_ids:
+            return []
         
-        # Order by number of matched skills (descending)
-        volunteers_queryset = volunteers_queryset.order_by('-matched_skill_count')[:limit]
+        # Read precomputed scores from the materialized match table
+        matches, fields = VolunteerSearchService._mission_match_queryset(
+            [mission_id], require_all_skills, verified_only
+        )
+        score_field = fields['score']
+        required_matched_field = fields['required_matched']
+        required_missing_field = fields['required_missing']
+        preferred_matched_field = fields['preferred_matched']
         
-        # Build results
-        results = []
-        for volunteer in volunteers_queryset:
-            # Get matched skills for this volunteer
-            matched_skills = volunteer.volunteer_skills.filter(skill_id__in=skill_ids)
-            
-            skills_data = []
-            for vs in matched_skills:
-                skills_data.append({
-                    'skill_id': str(vs.skill_id),
-                    'skill_name': vs.skill.name,
-                    'category': vs.skill.category.name,
-                    'proficiency_level': vs.proficiency_level,
-                    'proficiency_display': vs.get_proficiency_level_display(),
-                    'verification_status': vs.verification_status,
-                    'verification_display': vs.get_verification_status_display(),
-                    'years_of_experience': float(vs.years_of_experience),
-                    'is_primary': vs.is_primary,
-                })
-            
-            results.append({
-                'volunteer_id': str(volunteer.id),
-                'volunteer_name': f"{volunteer.user.first_name} {volunteer.user.last_name}",
-                'email': volunteer.user.email,
-                'phone_number': volunteer.phone_number,
-                'wilaya': volunteer.wilaya,
-                'availability': volunteer.availability,
-                'matched_skills_count': len(skills_data),
-                'total_required_skills': len(skill_ids),
-                'match_percentage': (len(skills_data) / len(skill_ids) * 100) if skill_ids else 0,
-                'matched_skills': skills_data,
+        matches = list(matches.order_by(f'-{score_field}', 'volunteer_id')[:limit])
+        if not matches:
+            return []
+        
+        volunteer_results = {
+            volunteer_data['volunteer_id']: volunteer_data
+            for volunteer_data in VolunteerSearchService._build_volunteer_results(
+                [str(match.volunteer_id) for match in matches],
+                all_skill_ids
+            )
+        }
+        
+        # Attach mission-specific matching info
+        enhanced_results = []
+        for match in matches:
+            volunteer_data = volunteer_results.get(str(match.volunteer_id))
+            if volunteer_data is None:
+                continue
+            enhanced_results.append({
+                **volunteer_data,
+                'mission_match': {
+                    'overall_score': getattr(match, score_field),
+                    'required_skills_matched': getattr(match, required_matched_field),
+                    'required_skills_total': match.required_skills_total,
+                    'required_skills_missing': getattr(match, required_missing_field),
+                    'preferred_skills_matched': getattr(match, preferred_matched_field),
+                    'preferred_skills_total': match.preferred_skills_total,
+                    'is_fully_qualified': getattr(match, required_missing_field) == 0,
+                }
             })
         
-        return results
+        return enhanced_results
     
     @staticmethod
-    def find_volunteers_for_mission(
+    def find_volunteers_near_mission(
         mission_id: str,
         require_all_skills: bool = True,
         verified_only: bool = True,
+        max_distance_km: Optional[float] = None,
         limit: int = 50
     ) -> List[Dict[str, Any]]:
         """
-        Find volunteers that match mission skill requirements
+        Find volunteers that match a mission and can reach its location
+        
+        Candidates come from the geohash cells around the mission, then each
+        one is kept only if the great-circle distance is within their own
+        travel radius (max_travel_distance_km, or LOCAL_RADIUS_KM when not
+        willing to travel). Addresses without coordinates use their wilaya
+        centroid.
         
         Args:
             mission_id: Mission ID
             require_all_skills: Only return volunteers with ALL required skills
             verified_only: Only consider verified skills
+            max_distance_km: Optional cap on the distance from the mission
             limit: Maximum number of results
             
         Returns:
-            List of volunteers with skill match information
+            List of volunteers with skill match information and distance,
+            best match first, nearest first among equal scores
         """
-        # Get required and preferred skills for mission
-        mission_skills = MissionSkill.objects.filter(
-            mission_id=mission_id
-        ).select_related('skill')
-        
-        required_skill_ids = [
-            str(ms.skill_id) for ms in mission_skills 
-            if ms.is_required_skill  # Uses model property
-        ]
+        from apps.missions.models import Mission
         
-        preferred_skill_ids = [
-            str(ms.skill_id) for ms in mission_skills 
-            if not ms.is_required_skill
-        ]
+        mission = Mission.objects.select_related('address').filter(id=mission_id).first()
+        if mission is None:
+            raise ValidationError("Mission not found.")
         
-        all_skill_ids = required_skill_ids + preferred_skill_ids
+        origin = resolve_point(
+            mission.address.latitude, mission.address.longitude, mission.address.wilaya
+        )
+        if origin is None:
+            raise ValidationError("Mission location is unknown.")
         
+        all_skill_ids = [
+            str(skill_id) for skill_id in MissionSkill.objects.filter(
+                mission_id=mission_id
+            ).values_list('skill_id', flat=True)
+        ]
         if not all_skill_ids:
             return []
         
-        # Search volunteers with required skills
-        search_skill_ids = required_skill_ids if required_skill_ids else all_skill_ids
-        match_type = 'all' if require_all_skills else 'any'
+        # Widest radius any volunteer could accept bounds the cells to scan,
+        # capped so one far-travelling volunteer cannot widen every search
+        # to the whole table
+        search_radius = min(
+            max(VolunteerSearchService.get_travel_reach(), VolunteerSearchService.LOCAL_RADIUS_KM),
+            getattr(settings, 'SKILLS_PROXIMITY_MAX_RADIUS_KM', 50)
+        )
+        if max_distance_km is not None:
+            search_radius = min(search_radius, max_distance_km)
+        
+        area = Q()
+        for prefix in covering_geohashes(origin[0], origin[1], search_radius):
+            area |= Q(volunteer__address__geohash__startswith=prefix)
         
-        volunteers = VolunteerSearchService.search_volunteers_by_skills(
-            skill_ids=search_skill_ids,
-            verified_only=verified_only,
-            match_type=match_type,
-            limit=limit
+        matches, fields = VolunteerSearchService._mission_match_queryset(
+            [mission_id], require_all_skills, verified_only
+        )
+        rows = matches.filter(area).values(
+            'volunteer_id',
+            'required_skills_total',
+            'preferred_skills_total',
+            'volunteer__willing_to_travel',
+            'volunteer__max_travel_distance_km',
+            'volunteer__address__latitude',
+            'volunteer__address__longitude',
+            'volunteer__address__wilaya',
+            *fields.values(),
         )
         
-        # Enhance results with mission-specific matching info
-        enhanced_results = []
-        for volunteer_data in volunteers:
-            volunteer_skill_ids = set(s['skill_id'] for s in volunteer_data['matched_skills'])
-            
-            # Calculate required skills match
-            required_skills_matched = set(required_skill_ids) & volunteer_skill_ids
-            required_skills_missing = set(required_skill_ids) - volunteer_skill_ids
-            
-            # Calculate preferred skills match
-            preferred_skills_matched = set(preferred_skill_ids) & volunteer_skill_ids
-            
-            # Calculate overall match score
-            required_weight = 0.7
-            preferred_weight = 0.3
-            
-            required_score = (
-                len(required_skills_matched) / len(required_skill_ids) * 100 
-                if required_skill_ids else 100
-            )
-            preferred_score = (
-                len(preferred_skills_matched) / len(preferred_skill_ids) * 100 
-                if preferred_skill_ids else 0
+        in_range = []
+        for row in rows:
+            point = resolve_point(
+                row['volunteer__address__latitude'],
+                row['volunteer__address__longitude'],
+                row['volunteer__address__wilaya']
             )
+            if point is None:
+                continue
             
-            overall_score = (required_score * required_weight) + (preferred_score * preferred_weight)
+            distance = haversine_km(origin[0], origin[1], point[0], point[1])
+            travel_radius = (
+                row['volunteer__max_travel_distance_km']
+                if row['volunteer__willing_to_travel']
+                else VolunteerSearchService.LOCAL_RADIUS_KM
+            )
+            if distance > min(travel_radius, search_radius):
+                continue
             
-            enhanced_results.append({
+            in_range.append((row, distance))
+        
+        nearest = heapq.nsmallest(
+            limit,
+            in_range,
+            key=lambda item: (-item[0][fields['score']], item[1], str(item[0]['volunteer_id']))
+        )
+        if not nearest:
+            return []
+        
+        volunteer_results = {
+            volunteer_data['volunteer_id']: volunteer_data
+            for volunteer_data in VolunteerSearchService._build_volunteer_results(
+                [str(row['volunteer_id']) for row, _ in nearest],
+                all_skill_ids
+            )
+        }
+        
+        results = []
+        for row, distance in nearest:
+            volunteer_data = volunteer_results.get(str(row['volunteer_id']))
+            if volunteer_data is None:
+                continue
+            results.append({
                 **volunteer_data,
-                'mission_match': {
-                    'overall_score': round(overall_score, 2),
-                    'required_skills_matched': len(required_skills_matched),
-                    'required_skills_total': len(required_skill_ids),
-                    'required_skills_missing': len(required_skills_missing),
-                    'preferred_skills_matched': len(preferred_skills_matched),
-                    'preferred_skills_total': len(preferred_skill_ids),
-                    'is_fully_qualified': len(required_skills_missing) == 0,
-                }
+                'distance_km': round(distance, 1),
+                'mission_match': VolunteerSearchService._mission_match_info(row, fields)
             })
         
-        # Sort by overall match score
-        enhanced_results.sort(key=lambda x: x['mission_match']['overall_score'], reverse=True)
+        return results
+    
+    @staticmethod
+    def get_travel_reach() -> int:
+        """
+        Widest travel distance any volunteer accepts, in kilometres (cached
+        until a volunteer's travel settings change)
+        """
+        return get_versioned(
+            VolunteerSearchService.TRAVEL_REACH_CACHE_KEY,
+            [VolunteerSearchService.TRAVEL_VERSION_CACHE_KEY],
+            lambda: VolunteerProfile.objects.filter(
+                willing_to_travel=True
+            ).aggregate(reach=Max('max_travel_distance_km'))['reach'] or 0
+        )
+    
+    @staticmethod
+    def invalidate_travel_reach() -> None:
+        """Outdate the cached travel reach (after volunteer profile writes)"""
+        bump_versions(VolunteerSearchService.TRAVEL_VERSION_CACHE_KEY)
+    
+    @staticmethod
+    def find_volunteers_for_missions(
+        mission_ids: List[str],
+        require_all_skills: bool = True,
+        verified_only: bool = True,
+        limit: int = 50
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Find matching volunteers for many missions in one pass
         
-        return enhanced_results
+        Reads the precomputed scores from the match table, keeping each
+        mission's top `limit` rows with a ROW_NUMBER() window partitioned by
+        mission, so the cost follows the number of results rather than the
+        number of volunteers holding the missions' skills.
+        
+        Args:
+            mission_ids: List of mission IDs
+            require_all_skills: Only return volunteers with ALL required skills
+            verified_only: Only consider verified skills
+            limit: Maximum number of results per mission
+            
+        Returns:
+            Dict of mission ID -> ranked list of volunteers with match information
+        """
+        mission_ids = [str(mission_id) for mission_id in dict.fromkeys(mission_ids)]
+        results: Dict[str, List[Dict[str, Any]]] = {mission_id: [] for mission_id in mission_ids}
+        
+        skill_ids_by_mission: Dict[str, List[str]] = {}
+        for mission_id, skill_id in MissionSkill.objects.filter(
+            mission_id__in=mission_ids
+        ).values_list('mission_id', 'skill_id'):
+            skill_ids_by_mission.setdefault(str(mission_id), []).append(str(skill_id))
+        
+        if not skill_ids_by_mission:
+            return results
+        
+        matches, fields = VolunteerSearchService._mission_match_queryset(
+            mission_ids, require_all_skills, verified_only
+        )
+        rows = list(
+            matches.annotate(
+                rank=Window(
+                    RowNumber(),
+                    partition_by=[F('mission_id')],
+                    order_by=[F(fields['score']).desc(), F('volunteer_id').asc()]
+                )
+            ).filter(
+                rank__lte=limit
+            ).values(
+                'mission_id',
+                'volunteer_id',
+                'required_skills_total',
+                'preferred_skills_total',
+                *fields.values(),
+            ).order_by('mission_id', 'rank')
+        )
+        if not rows:
+            return results
+        
+        # Load details for every selected volunteer at once
+        projection = VolunteerSearchService._project_volunteers(
+            {str(row['volunteer_id']) for row in rows},
+            {skill_id for skill_ids in skill_ids_by_mission.values() for skill_id in skill_ids}
+        )
+        
+        rows_by_mission: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            rows_by_mission.setdefault(str(row['mission_id']), []).append(row)
+        
+        for mission_id, mission_rows in rows_by_mission.items():
+            volunteer_results = {
+                volunteer_data['volunteer_id']: volunteer_data
+                for volunteer_data in VolunteerSearchService._build_volunteer_results(
+                    [str(row['volunteer_id']) for row in mission_rows],
+                    skill_ids_by_mission[mission_id],
+                    projection=projection
+                )
+            }
+            results[mission_id] = [
+                {
+                    **volunteer_results[str(row['volunteer_id'])],
+                    'mission_match': VolunteerSearchService._mission_match_info(row, fields),
+                }
+                for row in mission_rows
+                if str(row['volunteer_id']) in volunteer_results
+            ]
+        
+        return results
     
     @staticmethod
     def search_volunteers_by_category(
         category_id: str,
         verified_only: bool = True,
         min_proficiency_level: Optional[str] = None,
-        limit: int = 50
+        limit: int = 50,
+        include_subcategories: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Search volunteers who have skills in a specific category
@@ -213,29 +417,334 @@ class VolunteerSearchService:
             verified_only: Only include verified skills
             min_proficiency_level: Minimum proficiency level
             limit: Maximum number of results
+            include_subcategories: Also match skills of all descendant categories
             
         Returns:
             List of volunteers with skills in the category
         """
-        # Get all skills in this category
-        skills_in_category = Skill.objects.filter(
-            category_id=category_id,
+        if include_subcategories:
+            category_ids = SkillCategoryClosure.objects.filter(
+                ancestor_id=category_id
+            ).values('descendant_id')
+        else:
+            category_ids = [category_id]
+        
+        # Skills of the category (subtree) stay a subquery all the way
+        # into the search and projection queries
+        skills = Skill.objects.filter(
+            category_id__in=category_ids,
             is_active=True
-        ).values_list('id', flat=True)
+        ).values('id')
         
-        skill_ids = [str(sid) for sid in skills_in_category]
+        def search():
+            if volunteer_skill_index.is_enabled():
+                # The bitmap index needs explicit skill IDs
+                skill_ids = [str(skill_id) for skill_id in skills.values_list('id', flat=True)]
+                if not skill_ids:
+                    return {'volunteer_ids': [], 'total_skills': 0}
+                volunteer_ids = VolunteerSearchService._search_with_index(
+                    skill_ids=skill_ids,
+                    verified_only=verified_only,
+                    min_proficiency_level=min_proficiency_level,
+                    match_type='any',
+                    limit=limit
+                )
+                return {
+                    'volunteer_ids': [str(volunteer_id) for volunteer_id in volunteer_ids],
+                    'total_skills': len(skill_ids),
+                }
+            
+            total_skills = skills.count()
+            if not total_skills:
+                return {'volunteer_ids': [], 'total_skills': 0}
+            volunteer_ids = VolunteerSearchService._search_with_query(
+                skill_ids=skills,
+                verified_only=verified_only,
+                min_proficiency_level=min_proficiency_level,
+                match_type='any',
+                limit=limit
+            )
+            return {
+                'volunteer_ids': [str(volunteer_id) for volunteer_id in volunteer_ids],
+                'total_skills': total_skills,
+            }
         
-        if not skill_ids:
+        # Category versions cover volunteer skill writes below the category;
+        # the category tree version covers skills or categories moving
+        ranking = VolunteerSearchService._cached_search(
+            cache_key=VolunteerSearchService._search_cache_key(
+                'category', category_id, include_subcategories,
+                verified_only, min_proficiency_level, limit
+            ),
+            version_keys=[
+                VolunteerSearchService._category_version_key(category_id),
+                SkillCategoryService.TREE_VERSION_CACHE_KEY,
+            ],
+            search=search
+        )
+        if not ranking['volunteer_ids']:
             return []
+        return VolunteerSearchService._build_volunteer_results(
+            ranking['volunteer_ids'], skills, total_skills=ranking['total_skills']
+        )
+    
+    @staticmethod
+    def _mission_match_queryset(
+        mission_ids: List[str],
+        require_all_skills: bool,
+        verified_only: bool
+    ) -> Tuple[Any, Dict[str, str]]:
+        """
+        Match-table rows of missions with at least one matched skill
+        
+        Returns:
+            (queryset, match field names for the chosen verification mode)
+        """
+        prefix = 'verified_' if verified_only else ''
+        fields = {
+            'score': f'{prefix}overall_score',
+            'required_matched': f'{prefix}required_skills_matched',
+            'required_missing': f'{prefix}required_skills_missing',
+            'preferred_matched': f'{prefix}preferred_skills_matched',
+        }
+        
+        matches = MissionVolunteerMatch.objects.filter(
+            mission_id__in=mission_ids
+        ).filter(
+            Q(**{f"{fields['required_matched']}__gt": 0}) |
+            Q(**{f"{fields['preferred_matched']}__gt": 0})
+        )
+        
+        if require_all_skills:
+            matches = matches.filter(**{fields['required_missing']: 0})
+        
+        return matches, fields
+    
+    @staticmethod
+    def _mission_match_info(row: Dict[str, Any], fields: Dict[str, str]) -> Dict[str, Any]:
+        """Mission match summary of a match-table values() row"""
+        return {
+            'overall_score': row[fields['score']],
+            'required_skills_matched': row[fields['required_matched']],
+            'required_skills_total': row['required_skills_total'],
+            'required_skills_missing': row[fields['required_missing']],
+            'preferred_skills_matched': row[fields['preferred_matched']],
+            'preferred_skills_total': row['preferred_skills_total'],
+            'is_fully_qualified': row[fields['required_missing']] == 0,
+        }
+    
+    @staticmethod
+    def _cached_search(
+        cache_key: str,
+        version_keys: List[str],
+        search: Callable[[], Any]
+    ) -> Any:
+        """
+        Serve a search ranking from the cache while none of its versions changed
+
+        Only the ranked volunteer IDs are cached. Profile and skill fields
+        are projected fresh on every call, so profile edits show at once
+        without versioning them.
+        """
+        return get_versioned(
+            cache_key,
+            version_keys,
+            search,
+            timeout=getattr(settings, 'SKILLS_SEARCH_CACHE_TIMEOUT', 300)
+        )
+    
+    @staticmethod
+    def _search_cache_key(*criteria) -> str:
+        """Build a cache key from normalized search criteria"""
+        normalized = '|'.join('' if value is None else str(value) for value in criteria)
+        digest = hashlib.sha1(normalized.encode()).hexdigest()
+        return f'{VolunteerSearchService.SEARCH_CACHE_PREFIX}:{digest}'
+    
+    @staticmethod
+    def _skill_version_key(skill_id: str) -> str:
+        return f'{VolunteerSearchService.SKILL_VERSION_PREFIX}:{skill_id}'
+    
+    @staticmethod
+    def _category_version_key(category_id: str) -> str:
+        return f'{VolunteerSearchService.CATEGORY_VERSION_PREFIX}:{category_id}'
+    
+    @staticmethod
+    def _build_volunteer_results(
+        volunteer_ids: List[str],
+        skill_ids: Iterable[str],
+        projection: Optional[Tuple[Dict[str, Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]] = None,
+        total_skills: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Build search result dicts for volunteers, in the given order
+        
+        Args:
+            volunteer_ids: Ranked volunteer IDs
+            skill_ids: Skill IDs the volunteers were matched on (list or subquery)
+            projection: Rows from _project_volunteers, if already loaded for a
+                wider skill set
+            total_skills: Number of searched skills, when skill_ids is a subquery
+            
+        Returns:
+            List of volunteer data with matched skills (unknown IDs are skipped)
+        """
+        volunteer_ids = [str(volunteer_id) for volunteer_id in volunteer_ids]
+        if total_skills is None:
+            total_skills = len(skill_ids)
+        
+        if projection is None:
+            projection = VolunteerSearchService._project_volunteers(volunteer_ids, skill_ids)
+            skill_id_set = None
+        else:
+            skill_id_set = {str(skill_id) for skill_id in skill_ids}
+        profiles, skills_by_volunteer = projection
         
-        # Search volunteers with any of these skills
-        return VolunteerSearchService.search_volunteers_by_skills(
+        results = []
+        for volunteer_id in volunteer_ids:
+            profile = profiles.get(volunteer_id)
+            if profile is None:
+                continue
+            
+            skills_data = [
+                skill_data for skill_data in skills_by_volunteer.get(volunteer_id, [])
+                if skill_id_set is None or skill_data['skill_id'] in skill_id_set
+            ]
+            
+            results.append({
+                'volunteer_id': volunteer_id,
+                'volunteer_name': f"{profile['user__first_name']} {profile['user__last_name']}",
+                'email': profile['user__email'],
+                'phone_number': profile['user__phone_number'],
+                'wilaya': profile['address__wilaya'],
+                'availability': profile['availability'],
+                'matched_skills_count': len(skills_data),
+                'total_required_skills': total_skills,
+                'match_percentage': (len(skills_data) / total_skills * 100) if total_skills else 0,
+                'matched_skills': skills_data,
+            })
+        
+        return results
+    
+    @staticmethod
+    def _project_volunteers(
+        volunteer_ids: Iterable[str],
+        skill_ids: Iterable[str]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+        """
+        Load result fields for volunteers and their matched skills as plain rows
+        (two queries, whatever the number of volunteers)
+        
+        Returns:
+            (profile row by volunteer ID, matched skill dicts by volunteer ID)
+        """
+        volunteer_ids = list(volunteer_ids)
+        if not volunteer_ids:
+            return {}, {}
+        
+        profiles = {
+            str(row['id']): row
+            for row in VolunteerProfile.objects.filter(id__in=volunteer_ids).values(
+                'id',
+                'availability',
+                'user__first_name',
+                'user__last_name',
+                'user__email',
+                'user__phone_number',
+                'address__wilaya',
+            )
+        }
+        
+        proficiency_display = dict(ProficiencyLevel.CHOICES)
+        verification_display = dict(SkillVerificationStatus.CHOICES)
+        
+        skills_by_volunteer: Dict[str, List[Dict[str, Any]]] = {}
+        skill_rows = VolunteerSkill.objects.filter(
+            volunteer_id__in=volunteer_ids,
+            skill_id__in=skill_ids
+        ).values(
+            'volunteer_id',
+            'skill_id',
+            'skill__name',
+            'skill__category__name',
+            'proficiency_level',
+            'verification_status',
+            'is_primary',
+        )
+        for row in skill_rows:
+            skills_by_volunteer.setdefault(str(row['volunteer_id']), []).append({
+                'skill_id': str(row['skill_id']),
+                'skill_name': row['skill__name'],
+                'category': row['skill__category__name'],
+                'proficiency_level': row['proficiency_level'],
+                'proficiency_display': proficiency_display.get(row['proficiency_level'], row['proficiency_level']),
+                'verification_status': row['verification_status'],
+                'verification_display': verification_display.get(row['verification_status'], row['verification_status']),
+                'is_primary': row['is_primary'],
+            })
+        
+        return profiles, skills_by_volunteer
+    
+    @staticmethod
+    def _search_with_query(
+        skill_ids: Iterable[str],
+        verified_only: bool,
+        min_proficiency_level: Optional[str],
+        match_type: str,
+        limit: int
+    ) -> List[str]:
+        """Find matching volunteer IDs with a JOIN + COUNT over volunteer_skills"""
+        # Build base query for volunteer skills
+        skill_query = Q(volunteer_skills__skill_id__in=skill_ids)
+        
+        if verified_only:
+            skill_query &= Q(volunteer_skills__verification_status=SkillVerificationStatus.VERIFIED)
+        
+        if min_proficiency_level:
+            # Get proficiency levels greater than or equal to minimum
+            proficiency_levels = VolunteerSearchService._get_proficiency_levels_gte(min_proficiency_level)
+            skill_query &= Q(volunteer_skills__proficiency_level__in=proficiency_levels)
+        
+        # Get volunteers with annotations
+        volunteers_queryset = VolunteerProfile.objects.filter(
+            skill_query
+        ).annotate(
+            matched_skill_count=Count('volunteer_skills', filter=Q(volunteer_skills__skill_id__in=skill_ids))
+        ).distinct()
+        
+        # Filter based on match type
+        if match_type == 'all':
+            # Must have ALL skills
+            volunteers_queryset = volunteers_queryset.filter(
+                matched_skill_count=len(skill_ids)
+            )
+        
+        # Order by number of matched skills (descending)
+        return [
+            str(volunteer_id) for volunteer_id in volunteers_queryset.order_by(
+                '-matched_skill_count'
+            ).values_list('id', flat=True)[:limit]
+        ]
+    
+    @staticmethod
+    def _search_with_index(
+        skill_ids: List[str],
+        verified_only: bool,
+        min_proficiency_level: Optional[str],
+        match_type: str,
+        limit: int
+    ) -> List[str]:
+        """Find matching volunteer IDs with bitmap operations on the skill index"""
+        hits = volunteer_skill_index.search(
             skill_ids=skill_ids,
-            verified_only=verified_only,
-            min_proficiency_level=min_proficiency_level,
-            match_type='any',
+            verification_statuses=[SkillVerificationStatus.VERIFIED] if verified_only else None,
+            proficiency_levels=(
+                VolunteerSearchService._get_proficiency_levels_gte(min_proficiency_level)
+                if min_proficiency_level else None
+            ),
+            match_type=match_type,
             limit=limit
         )
+        return [volunteer_id for volunteer_id, _ in hits]
     
     @staticmethod
     def _get_proficiency_levels_gte(min_level: str) -> List[str]:
@@ -248,16 +757,9 @@ class VolunteerSearchService:
         Returns:
             List of proficiency level codes
         """
-        level_order = {
-            ProficiencyLevel.BEGINNER: 1,
-            ProficiencyLevel.INTERMEDIATE: 2,
-            ProficiencyLevel.ADVANCED: 3,
-            ProficiencyLevel.EXPERT: 4,
-        }
-        
-        min_value = level_order.get(min_level, 1)
+        min_value = ProficiencyLevel.ORDER.get(min_level, 1)
         
         return [
-            level for level, value in level_order.items()
+            level for level, value in ProficiencyLevel.ORDER.items()
             if value >= min_value
         ]
\ No newline at end of file
@@ -1,14 +1,27 @@
+import uuid
+from django.conf import settings
 from django.db import transaction, models
+from django.db.models import Count, Max, Q
 from django.core.exceptions import ValidationError, PermissionDenied
 from django.utils import timezone
 from typing import List, Optional, Dict, Any, Set
 from ..models import VolunteerSkill, Skill, VerificationRequest
+from apps.core.cache import bump_versions, get_versioned
 from apps.core.constants import SkillVerificationStatus, ProficiencyLevel
+from .mission_match_service import MissionMatchService
+from .skill_category_service import SkillCategoryService
+from .skill_index import volunteer_skill_index
+from .skill_usage_service import SkillUsageService
+from .volunteer_search_service import VolunteerSearchService
 
 
 class VolunteerSkillService:
     """Service for managing volunteer skills"""
     
+    BULK_BATCH_SIZE = 1000
+    STATISTICS_CACHE_PREFIX = 'skills:volunteer_statistics'
+    STATISTICS_VERSION_PREFIX = 'skills:volunteer_statistics_version'
+    
     @staticmethod
     def get_volunteer_skills(
         volunteer_id: str,
@@ -281,46 +294,65 @@ class VolunteerSkillService:
 
     @staticmethod
     def get_volunteer_skill_statistics(volunteer_id: str) -> Dict[str, Any]:
-        """Get statistics about a volunteer's skills"""
-        skills = VolunteerSkill.objects.filter(
-            volunteer_id=volunteer_id
-        ).select_related('skill', 'skill__category')
+        """
+        Get statistics about a volunteer's skills
+
+        Cached per volunteer; the volunteer's skill writes and skill or
+        category renames (category tree version) outdate the entry.
+        """
+        return get_versioned(
+            f'{VolunteerSkillService.STATISTICS_CACHE_PREFIX}:{volunteer_id}',
+            [
+                VolunteerSkillService._statistics_version_key(volunteer_id),
+                SkillCategoryService.TREE_VERSION_CACHE_KEY,
+            ],
+            lambda: VolunteerSkillService._compute_volunteer_skill_statistics(volunteer_id),
+            timeout=getattr(settings, 'SKILLS_VOLUNTEER_STATISTICS_CACHE_TIMEOUT', 3600)
+        )
 
-        total_skills = skills.count()
-        verified = skills.filter(
-            verification_status=SkillVerificationStatus.VERIFIED
-        ).count()
-        pending = skills.filter(
-            verification_status=SkillVerificationStatus.PENDING
-        ).count()
-        pending_verification_requests = skills.filter(
-            verification_requested=True
-        ).count()
-
-        # Proficiency distribution
-        proficiency_counts = {}
-        for skill in skills:
-            level = skill.get_proficiency_level_display()
-            proficiency_counts[level] = proficiency_counts.get(level, 0) + 1
+    @staticmethod
+    def invalidate_volunteer_statistics(volunteer_id: str) -> None:
+        """Outdate a volunteer's cached skill statistics (after VolunteerSkill writes)"""
+        bump_versions(VolunteerSkillService._statistics_version_key(volunteer_id))
 
-        # Category distribution
-        category_counts = {}
-        for skill in skills:
-            category = skill.skill.category.name
-            category_counts[category] = category_counts.get(category, 0) + 1
+    @staticmethod
+    def _statistics_version_key(volunteer_id: str) -> str:
+        return f'{VolunteerSkillService.STATISTICS_VERSION_PREFIX}:{volunteer_id}'
+
+    @staticmethod
+    def _compute_volunteer_skill_statistics(volunteer_id: str) -> Dict[str, Any]:
+        """Volunteer skill statistics from one conditional aggregate and one grouped query"""
+        skills = VolunteerSkill.objects.filter(volunteer_id=volunteer_id)
+
+        totals = skills.aggregate(
+            total_skills=Count('id'),
+            verified=Count('id', filter=Q(verification_status=SkillVerificationStatus.VERIFIED)),
+            pending=Count('id', filter=Q(verification_status=SkillVerificationStatus.PENDING)),
+            pending_verification_requests=Count('id', filter=Q(verification_requested=True)),
+            primary_skill=Max('skill__name', filter=Q(is_primary=True)),
+        )
 
-        # Primary skill
-        primary_skill = skills.filter(is_primary=True).first()
+        # Proficiency and category distributions from one grouped query
+        level_names = dict(ProficiencyLevel.CHOICES)
+        proficiency_counts = {}
+        category_counts = {}
+        rows = skills.values_list(
+            'proficiency_level', 'skill__category__name'
+        ).annotate(count=Count('id')).order_by()
+        for proficiency_level, category, count in rows:
+            level = level_names.get(proficiency_level, proficiency_level)
+            proficiency_counts[level] = proficiency_counts.get(level, 0) + count
+            category_counts[category] = category_counts.get(category, 0) + count
 
         return {
             'volunteer_id': volunteer_id,
-            'total_skills': total_skills,
-            'verified_skills': verified,
-            'pending_verification': pending,
-            'pending_verification_requests': pending_verification_requests,
+            'total_skills': totals['total_skills'],
+            'verified_skills': totals['verified'],
+            'pending_verification': totals['pending'],
+            'pending_verification_requests': totals['pending_verification_requests'],
             'proficiency_distribution': proficiency_counts,
             'category_distribution': category_counts,
-            'primary_skill': primary_skill.skill.name if primary_skill else None,
+            'primary_skill': totals['primary_skill'],
         }
 
     @staticmethod
@@ -328,60 +360,226 @@ class VolunteerSkillService:
         volunteer_id: str,
         limit: int = 5
     ) -> List[Skill]:
-        """Suggest skills for a volunteer based on their current skills"""
-        from django.db.models import Count
+        """
+        Suggest skills for a volunteer based on their current skills
+        ("volunteers who have X also have Y", from the precomputed
+        co-occurrence lists)
+        """
+        from django.db.models import F
+        from .skill_cooccurrence_service import SkillCooccurrenceService
         
-        # Get volunteer's current skill categories
-        current_skills = VolunteerSkill.objects.filter(
+        # Get volunteer's current skills and their categories
+        current_skills = list(VolunteerSkill.objects.filter(
             volunteer_id=volunteer_id
-        ).select_related('skill__category')
+        ).values_list('skill_id', 'skill__category_id'))
 
-        current_skill_ids = set(vs.skill_id for vs in current_skills)
-        category_ids = set(vs.skill.category_id for vs in current_skills)
+        current_skill_ids = set(skill_id for skill_id, _ in current_skills)
+        category_ids = set(category_id for _, category_id in current_skills)
 
-        # Suggest skills from same categories that volunteer doesn't have
+        suggestions = SkillCooccurrenceService.suggest_related_skills(current_skill_ids, limit)
+        if len(suggestions) >= limit:
+            return suggestions
+
+        # Not enough co-occurrence data yet: top up with popular skills
+        # from the same categories that volunteer doesn't have
         suggested_skills = Skill.objects.filter(
             category_id__in=category_ids,
             is_active=True
         ).exclude(
-            id__in=current_skill_ids
-        ).annotate(
-            popularity=Count('volunteer_skills')
-        ).order_by('-popularity')[:limit]
+            id__in=current_skill_ids | {skill.id for skill in suggestions}
+        ).order_by(
+            F('usage__volunteer_count').desc(nulls_last=True)
+        )[:limit - len(suggestions)]
 
-        return list(suggested_skills)
+        return suggestions + list(suggested_skills)
 
     @staticmethod
+    @transaction.atomic
     def bulk_import_skills(
         volunteer_id: str,
         skills_data: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
-        """Bulk import skills for a volunteer"""
-        created = []
+        """
+        Bulk import skills for a volunteer
+
+        The whole batch is validated against preloaded skills and the
+        volunteer's existing skills, then written with one bulk_create.
+        Items that fail validation are reported and skipped.
+        """
+        from apps.accounts.models import VolunteerProfile
+
+        if not VolunteerProfile.objects.filter(id=volunteer_id).exists():
+            raise ValidationError("Volunteer not found.")
+
+        requested_ids = set()
+        for skill_data in skills_data:
+            try:
+                requested_ids.add(uuid.UUID(str(skill_data.get('skill_id'))))
+            except ValueError:
+                pass
+
+        skills = Skill.objects.filter(
+            id__in=requested_ids,
+            is_active=True
+        ).only('id', 'name', 'verification_requirement').in_bulk()
+        taken_ids = set(VolunteerSkill.objects.filter(
+            volunteer_id=volunteer_id,
+            skill_id__in=requested_ids
+        ).values_list('skill_id', flat=True))
+
+        valid_levels = {choice[0] for choice in ProficiencyLevel.CHOICES}
+        to_create = []
         failed = []
 
         for skill_data in skills_data:
             try:
-                volunteer_skill = VolunteerSkillService.add_skill_to_volunteer(
-                    volunteer_id=volunteer_id,
-                    skill_id=skill_data.get('skill_id'),
-                    proficiency_level=skill_data.get('proficiency_level', ProficiencyLevel.BEGINNER),
-                    is_primary=skill_data.get('is_primary', False)
-                )
-                created.append({
-                    'skill_id': str(volunteer_skill.skill_id),
-                    'skill_name': volunteer_skill.skill.name
-                })
-            except (ValidationError, Exception) as e:
+                skill_id = uuid.UUID(str(skill_data.get('skill_id')))
+            except ValueError:
+                skill_id = None
+
+            proficiency_level = skill_data.get('proficiency_level', ProficiencyLevel.BEGINNER)
+            if skill_id in taken_ids:
+                error = "You already have this skill in your profile."
+            elif skill_id not in skills:
+                error = "Skill not found or inactive."
+            elif proficiency_level not in valid_levels:
+                error = f"Invalid proficiency level: {proficiency_level}"
+            else:
+                error = None
+
+            if error:
                 failed.append({
                     'skill_id': skill_data.get('skill_id'),
-                    'error': str(e)
+                    'error': error
                 })
+                continue
+
+            skill = skills[skill_id]
+            if skill.verification_requirement == Skill.VerificationRequirement.NONE:
+                verification_status = SkillVerificationStatus.NOT_REQUIRED
+            else:
+                verification_status = SkillVerificationStatus.PENDING
+
+            taken_ids.add(skill_id)
+            to_create.append(VolunteerSkill(
+                volunteer_id=volunteer_id,
+                skill=skill,
+                proficiency_level=proficiency_level,
+                verification_status=verification_status,
+                verification_requested=False,
+                verification_links=[],
+                is_primary=bool(skill_data.get('is_primary', False))
+            ))
+
+        # Only the last imported primary skill stays primary
+        primaries = [volunteer_skill for volunteer_skill in to_create if volunteer_skill.is_primary]
+        if primaries:
+            demoted = list(VolunteerSkill.objects.filter(
+                volunteer_id=volunteer_id,
+                is_primary=True
+            ))
+            if demoted:
+                # update() skips the save signals; replay their work for the demoted rows
+                VolunteerSkill.objects.filter(
+                    id__in=[volunteer_skill.id for volunteer_skill in demoted]
+                ).update(is_primary=False)
+                for volunteer_skill in demoted:
+                    volunteer_skill.is_primary = False
+                VolunteerSkillService.after_bulk_update(
+                    demoted,
+                    {
+                        str(volunteer_skill.id): volunteer_skill.verification_status
+                        for volunteer_skill in demoted
+                    }
+                )
+            for volunteer_skill in primaries[:-1]:
+                volunteer_skill.is_primary = False
+
+        VolunteerSkill.objects.bulk_create(to_create, batch_size=VolunteerSkillService.BULK_BATCH_SIZE)
+        VolunteerSkillService._after_bulk_create(volunteer_id, to_create)
 
         return {
             'total_attempted': len(skills_data),
-            'successfully_created': len(created),
+            'successfully_created': len(to_create),
             'failed': len(failed),
-            'created_skills': created,
+            'created_skills': [
+                {
+                    'skill_id': str(volunteer_skill.skill_id),
+                    'skill_name': volunteer_skill.skill.name
+                }
+                for volunteer_skill in to_create
+            ],
             'failed_skills': failed
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def _after_bulk_create(volunteer_id: str, volunteer_skills: List[VolunteerSkill]) -> None:
+        """
+        Do the work VolunteerSkill post_save signals would have done
+        (bulk_create does not send them), batched per import
+        """
+        if not volunteer_skills:
+            return
+
+        skill_ids = [str(volunteer_skill.skill_id) for volunteer_skill in volunteer_skills]
+        SkillUsageService.add_volunteer_skills(
+            (volunteer_skill.skill_id, volunteer_skill.verification_status)
+            for volunteer_skill in volunteer_skills
+        )
+
+        if volunteer_skill_index.is_enabled():
+            transaction.on_commit(lambda: volunteer_skill_index.update_many(volunteer_skills))
+        transaction.on_commit(lambda: VolunteerSearchService.invalidate_skill_searches(*skill_ids))
+        transaction.on_commit(
+            lambda: VolunteerSkillService.invalidate_volunteer_statistics(volunteer_id)
+        )
+        transaction.on_commit(
+            lambda: MissionMatchService.refresh_volunteer_skills(volunteer_id, skill_ids)
+        )
+
+    @staticmethod
+    def after_bulk_update(
+        volunteer_skills: List[VolunteerSkill],
+        previous_statuses: Dict[str, str]
+    ) -> None:
+        """
+        Do the work VolunteerSkill save signals would have done for rows
+        changed with a queryset update(), batched across volunteers
+
+        Args:
+            volunteer_skills: Updated rows in their new state
+            previous_statuses: Verification status of each row (by ID) before the update
+        """
+        if not volunteer_skills:
+            return
+
+        changed = [
+            volunteer_skill for volunteer_skill in volunteer_skills
+            if previous_statuses[str(volunteer_skill.id)] != volunteer_skill.verification_status
+        ]
+        SkillUsageService.move_volunteer_skills(
+            (
+                (volunteer_skill.skill_id, previous_statuses[str(volunteer_skill.id)]),
+                (volunteer_skill.skill_id, volunteer_skill.verification_status)
+            )
+            for volunteer_skill in changed
+        )
+
+        skill_ids = {str(volunteer_skill.skill_id) for volunteer_skill in volunteer_skills}
+        statistics_keys = {
+            VolunteerSkillService._statistics_version_key(volunteer_skill.volunteer_id)
+            for volunteer_skill in volunteer_skills
+        }
+        transaction.on_commit(lambda: VolunteerSearchService.invalidate_skill_searches(*skill_ids))
+        transaction.on_commit(lambda: bump_versions(*statistics_keys))
+
+        if not changed:
+            return
+        # The index and match scores only depend on the verification status
+        if volunteer_skill_index.is_enabled():
+            transaction.on_commit(lambda: volunteer_skill_index.update_many(changed))
+        changed_volunteer_ids = {str(volunteer_skill.volunteer_id) for volunteer_skill in changed}
+        changed_skill_ids = {str(volunteer_skill.skill_id) for volunteer_skill in changed}
+        transaction.on_commit(
+            lambda: MissionMatchService.refresh_volunteers_skills(changed_volunteer_ids, changed_skill_ids)
+        )
\ No newline at end of file
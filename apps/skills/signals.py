@@ -0,0 +1,358 @@
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from apps.accounts.models import VolunteerProfile
+from apps.missions.models import Mission
+from .models import VolunteerSkill, MissionSkill, Skill, SkillCategory, VerificationRequest
+from .services.skill_index import volunteer_skill_index
+from .services.mission_index import published_mission_index
+from .services.skill_autocomplete_index import skill_autocomplete_index
+from .services.mission_match_service import MissionMatchService
+from .services.volunteer_search_service import VolunteerSearchService
+from .services.skill_category_service import SkillCategoryService
+from .services.skill_service import SkillService
+from .services.skill_usage_service import SkillUsageService
+from .services.volunteer_skill_service import VolunteerSkillService
+from .services.document_blob_service import DocumentBlobService
+from .services.verification_service import VerificationService
+
+
+@receiver(post_save, sender=VolunteerSkill)
+def index_volunteer_skill(sender, instance, **kwargs):
+    """
+    Keep the in-memory volunteer skill index in sync on create/update
+    """
+    if volunteer_skill_index.is_enabled():
+        transaction.on_commit(lambda: volunteer_skill_index.update(instance))
+
+
+@receiver(post_delete, sender=VolunteerSkill)
+def unindex_volunteer_skill(sender, instance, **kwargs):
+    """
+    Drop deleted volunteer skills from the in-memory index
+    """
+    if volunteer_skill_index.is_enabled():
+        transaction.on_commit(lambda: volunteer_skill_index.remove(instance))
+
+
+@receiver(post_save, sender=VolunteerSkill)
+@receiver(post_delete, sender=VolunteerSkill)
+def invalidate_volunteer_search_cache(sender, instance, **kwargs):
+    """
+    Invalidate cached volunteer searches that involve this skill
+    """
+    transaction.on_commit(
+        lambda: VolunteerSearchService.invalidate_skill_searches(instance.skill_id)
+    )
+
+
+@receiver(post_save, sender=VolunteerSkill)
+@receiver(post_delete, sender=VolunteerSkill)
+def invalidate_volunteer_statistics(sender, instance, **kwargs):
+    """
+    Outdate the volunteer's cached skill statistics
+    """
+    transaction.on_commit(
+        lambda: VolunteerSkillService.invalidate_volunteer_statistics(instance.volunteer_id)
+    )
+
+
+@receiver(post_save, sender=VolunteerSkill)
+@receiver(post_delete, sender=VolunteerSkill)
+def refresh_volunteer_mission_matches(sender, instance, **kwargs):
+    """
+    Recompute the volunteer's match scores for missions using this skill
+    """
+    transaction.on_commit(
+        lambda: MissionMatchService.refresh_volunteer_skill(
+            instance.volunteer_id, instance.skill_id
+        )
+    )
+
+
+@receiver(post_save, sender=MissionSkill)
+@receiver(post_delete, sender=MissionSkill)
+def refresh_mission_matches(sender, instance, **kwargs):
+    """
+    Recompute all match scores of a mission when its skill requirements change
+    """
+    transaction.on_commit(
+        lambda: MissionMatchService.refresh_mission(instance.mission_id)
+    )
+
+
+@receiver(post_save, sender=MissionSkill)
+@receiver(post_delete, sender=MissionSkill)
+def reindex_mission_skills(sender, instance, **kwargs):
+    """
+    Keep the published mission index in sync with mission skill requirements
+    """
+    transaction.on_commit(
+        lambda: published_mission_index.refresh_mission(instance.mission_id)
+    )
+
+
+@receiver(pre_save, sender=Mission)
+def remember_mission_listing(sender, instance, **kwargs):
+    """
+    Remember the stored status and featured flag so post_save can tell
+    whether the mission's listing changed
+    """
+    if instance._state.adding:
+        instance._previous_listing = None
+    else:
+        instance._previous_listing = Mission.objects.filter(
+            pk=instance.pk
+        ).values_list('status', 'is_featured').first()
+
+
+@receiver(post_save, sender=Mission)
+def reindex_mission(sender, instance, raw=False, **kwargs):
+    """
+    Add or drop a mission from the published mission index when its status
+    or featured flag changes
+    """
+    if raw:
+        return
+    if getattr(instance, '_previous_listing', None) == (instance.status, instance.is_featured):
+        return
+    transaction.on_commit(
+        lambda: published_mission_index.refresh_mission(instance.id)
+    )
+
+
+@receiver(post_delete, sender=Mission)
+def unindex_mission(sender, instance, **kwargs):
+    """
+    Drop deleted missions from the published mission index
+    """
+    transaction.on_commit(
+        lambda: published_mission_index.remove_mission(instance.id)
+    )
+
+
+@receiver(pre_save, sender=VolunteerProfile)
+def remember_volunteer_travel(sender, instance, **kwargs):
+    """
+    Remember the stored travel settings so post_save can tell whether they changed
+    """
+    if instance._state.adding:
+        instance._previous_travel = None
+    else:
+        instance._previous_travel = VolunteerProfile.objects.filter(
+            pk=instance.pk
+        ).values_list('willing_to_travel', 'max_travel_distance_km').first()
+
+
+@receiver(post_save, sender=VolunteerProfile)
+def invalidate_travel_reach(sender, instance, raw=False, **kwargs):
+    """
+    Outdate the cached widest travel distance when travel settings change
+    """
+    if raw:
+        return
+    if getattr(instance, '_previous_travel', None) == (instance.willing_to_travel, instance.max_travel_distance_km):
+        return
+    transaction.on_commit(VolunteerSearchService.invalidate_travel_reach)
+
+
+@receiver(post_delete, sender=VolunteerProfile)
+def invalidate_deleted_travel_reach(sender, instance, **kwargs):
+    if instance.willing_to_travel:
+        transaction.on_commit(VolunteerSearchService.invalidate_travel_reach)
+
+
+@receiver(pre_save, sender=SkillCategory)
+def remember_category_parent(sender, instance, **kwargs):
+    """
+    Remember the stored parent so post_save can tell whether the category moved
+    """
+    if instance._state.adding:
+        instance._previous_parent_id = None
+    else:
+        instance._previous_parent_id = SkillCategory.objects.filter(
+            pk=instance.pk
+        ).values_list('parent_category_id', flat=True).first()
+
+
+@receiver(post_save, sender=SkillCategory)
+def update_category_closure(sender, instance, created, raw=False, **kwargs):
+    """
+    Keep the category closure table in step with the hierarchy
+    (in the same transaction, since cycle checks read it)
+    """
+    if raw:
+        return
+    if created:
+        SkillCategoryService.add_to_closure(instance)
+    elif instance.parent_category_id != getattr(instance, '_previous_parent_id', instance.parent_category_id):
+        SkillCategoryService.move_in_closure(instance)
+
+
+@receiver(post_save, sender=SkillCategory)
+@receiver(post_delete, sender=SkillCategory)
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+def invalidate_category_tree(sender, instance, **kwargs):
+    """
+    Outdate the cached category tree snapshot when categories or skills change
+    """
+    transaction.on_commit(SkillCategoryService.invalidate_category_tree)
+
+
+@receiver(post_save, sender=Skill)
+def refresh_skill_search_vector(sender, instance, raw=False, **kwargs):
+    """
+    Keep the skill's full-text search document in step with its text
+    """
+    if not raw:
+        SkillService.refresh_search_vector(instance.pk)
+
+
+@receiver(post_save, sender=SkillCategory)
+def refresh_category_search_vector(sender, instance, raw=False, **kwargs):
+    """
+    Keep the category's full-text search document in step with its text
+    """
+    if not raw:
+        SkillCategoryService.refresh_search_vector(instance.pk)
+
+
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+@receiver(post_save, sender=SkillCategory)
+@receiver(post_delete, sender=SkillCategory)
+def invalidate_skill_autocomplete(sender, instance, **kwargs):
+    """
+    Rebuild the autocomplete index after skills are created, renamed,
+    (de)activated or deleted, or their category changes
+    """
+    transaction.on_commit(skill_autocomplete_index.invalidate)
+
+
+@receiver(pre_save, sender=VolunteerSkill)
+def remember_volunteer_skill_usage(sender, instance, **kwargs):
+    """
+    Remember the stored skill, status and documents so post_save can move
+    the usage counters and document references (one query)
+    """
+    instance._previous_usage = None
+    instance._previous_documents = []
+    if instance._state.adding:
+        return
+
+    document_fields = DocumentBlobService.DOCUMENT_FIELDS[VolunteerSkill]
+    row = VolunteerSkill.objects.filter(
+        pk=instance.pk
+    ).values_list('skill_id', 'verification_status', *document_fields).first()
+    if row is not None:
+        instance._previous_usage = row[:2]
+        instance._previous_documents = DocumentBlobService.document_names(row[2:])
+
+
+@receiver(post_save, sender=VolunteerSkill)
+def count_volunteer_skill(sender, instance, raw=False, **kwargs):
+    """
+    Keep the skill usage counters in step (in the same transaction as the write)
+    """
+    if not raw:
+        SkillUsageService.move_volunteer_skill(
+            getattr(instance, '_previous_usage', None),
+            (instance.skill_id, instance.verification_status)
+        )
+
+
+@receiver(post_delete, sender=VolunteerSkill)
+def uncount_volunteer_skill(sender, instance, **kwargs):
+    SkillUsageService.move_volunteer_skill(
+        (instance.skill_id, instance.verification_status), None
+    )
+
+
+@receiver(pre_save, sender=MissionSkill)
+def remember_mission_skill_usage(sender, instance, **kwargs):
+    """
+    Remember the stored skill and requirement level so post_save can move the counters
+    """
+    if instance._state.adding:
+        instance._previous_usage = None
+    else:
+        instance._previous_usage = MissionSkill.objects.filter(
+            pk=instance.pk
+        ).values_list('skill_id', 'requirement_level').first()
+
+
+@receiver(post_save, sender=MissionSkill)
+def count_mission_skill(sender, instance, raw=False, **kwargs):
+    """
+    Keep the skill usage counters in step (in the same transaction as the write)
+    """
+    if not raw:
+        SkillUsageService.move_mission_skill(
+            getattr(instance, '_previous_usage', None),
+            (instance.skill_id, instance.requirement_level)
+        )
+
+
+@receiver(post_delete, sender=MissionSkill)
+def uncount_mission_skill(sender, instance, **kwargs):
+    SkillUsageService.move_mission_skill(
+        (instance.skill_id, instance.requirement_level), None
+    )
+
+
+@receiver(pre_save, sender=VerificationRequest)
+def remember_verification_request_state(sender, instance, **kwargs):
+    """
+    Remember the stored status and documents so post_save can move the
+    status counters and document references (one query)
+    """
+    instance._previous_review_status = None
+    instance._previous_documents = []
+    if instance._state.adding:
+        return
+
+    document_fields = DocumentBlobService.DOCUMENT_FIELDS[VerificationRequest]
+    row = VerificationRequest.objects.filter(
+        pk=instance.pk
+    ).values_list('review_status', *document_fields).first()
+    if row is not None:
+        instance._previous_review_status = row[0]
+        instance._previous_documents = DocumentBlobService.document_names(row[1:])
+
+
+@receiver(post_save, sender=VerificationRequest)
+def count_verification_request(sender, instance, raw=False, **kwargs):
+    """
+    Keep the review status counters in step (in the same transaction as the write)
+    """
+    if not raw:
+        VerificationService.move_status_counts([
+            (getattr(instance, '_previous_review_status', None), instance.review_status)
+        ])
+
+
+@receiver(post_delete, sender=VerificationRequest)
+def uncount_verification_request(sender, instance, **kwargs):
+    VerificationService.move_status_counts([(instance.review_status, None)])
+
+
+@receiver(post_save, sender=VolunteerSkill)
+@receiver(post_save, sender=VerificationRequest)
+def reference_documents(sender, instance, raw=False, **kwargs):
+    """
+    Keep document blob reference counts in step (in the same transaction as the write)
+    """
+    if not raw:
+        DocumentBlobService.move_references(
+            getattr(instance, '_previous_documents', []),
+            DocumentBlobService.instance_document_names(instance)
+        )
+
+
+@receiver(post_delete, sender=VolunteerSkill)
+@receiver(post_delete, sender=VerificationRequest)
+def release_documents(sender, instance, **kwargs):
+    DocumentBlobService.move_references(
+        DocumentBlobService.instance_document_names(instance), []
+    )
@@ -0,0 +1,2007 @@
+import hashlib
+import io
+import json
+import shutil
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
+from importlib import import_module
+from unittest.mock import patch
+
+from django.apps import apps
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from PIL import Image
+
+from apps.accounts.models import Address, OrganizationProfile, User, VolunteerProfile
+from apps.core.storage import document_storage
+from apps.core.constants import (
+    MissionStatus,
+    OrganizationType,
+    ProficiencyLevel,
+    RequirementLevel,
+    SkillVerificationStatus,
+    UserType,
+)
+from apps.missions.models import Mission, Participation
+from apps.skills.models import (
+    DocumentBlob,
+    MissionSkill,
+    MissionVolunteerMatch,
+    Skill,
+    SkillCategory,
+    SkillCategoryClosure,
+    SkillCooccurrence,
+    SkillUsageCounter,
+    SustainableDevelopmentGoal,
+    VerificationRequest,
+    VerificationStatusCounter,
+    VolunteerSkill,
+)
+from apps.skills.services import (
+    MissionMatchService,
+    SkillCategoryService,
+    DocumentBlobService,
+    DocumentProcessingService,
+    SkillCooccurrenceService,
+    SkillService,
+    SkillUsageService,
+    VerificationService,
+    VolunteerSearchService,
+    VolunteerSkillService,
+)
+from apps.skills.services.mission_index import PublishedMissionIndex, published_mission_index
+from apps.skills.services.mission_recommendation_service import MissionRecommendationService
+from apps.skills.serializers import SkillDetailSerializer
+from apps.skills.services.skill_autocomplete_index import SkillAutocompleteIndex, skill_autocomplete_index
+from apps.skills.services.skill_index import VolunteerSkillIndex, volunteer_skill_index
+
+
+def create_volunteer(name, address, **kwargs):
+    user = User.objects.create(
+        email=f'{name}@example.com',
+        username=name,
+        user_type=UserType.VOLUNTEER
+    )
+    return VolunteerProfile.objects.create(user=user, address=address, **kwargs)
+
+
+def create_mission(title, address, sdg_number=1, **kwargs):
+    user, _ = User.objects.get_or_create(
+        email='organization@example.com',
+        defaults={'username': 'organization', 'user_type': UserType.ORGANIZATION}
+    )
+    organization, _ = OrganizationProfile.objects.get_or_create(
+        user=user,
+        defaults={
+            'name': 'Croissant Rouge',
+            'description': 'Humanitarian organization running volunteer missions nationwide.',
+            'organization_type': OrganizationType.NGO,
+            'address': address,
+        }
+    )
+    sdg, _ = SustainableDevelopmentGoal.objects.get_or_create(
+        number=sdg_number,
+        defaults={'title': f'Goal {sdg_number}', 'description': 'Goal'}
+    )
+    start_date = kwargs.pop('start_date', timezone.now() + timedelta(days=7))
+    return Mission.objects.create(**{
+        'title': title,
+        'description': 'Mission',
+        'organization': organization,
+        'sdg': sdg,
+        'address': address,
+        'start_date': start_date,
+        'end_date': start_date + timedelta(days=1),
+        'application_deadline': start_date - timedelta(days=1),
+        'estimated_total_hours': 8,
+        'volunteers_needed': 5,
+        **kwargs,
+    })
+
+
+def create_verification_requests(count, skill_name='First Aid'):
+    """One verification request per new volunteer, oldest first"""
+    category, _ = SkillCategory.objects.get_or_create(name='Health')
+    skill, _ = Skill.objects.get_or_create(name=skill_name, defaults={'category': category})
+    address = Address.objects.create(
+        address_line_1='12 Boulevard Zighoud Youcef',
+        city='Constantine',
+        wilaya='Constantine'
+    )
+    requested_at = timezone.now() - timedelta(days=count)
+    verification_requests = []
+    for index in range(count):
+        volunteer = create_volunteer(f'{skill_name.lower().replace(" ", "")}{index}', address)
+        volunteer_skill = VolunteerSkill.objects.create(volunteer=volunteer, skill=skill)
+        verification_request = VerificationRequest.objects.create(volunteer_skill=volunteer_skill)
+        # request_date is auto_now_add; spread the requests out so the queue order is fixed
+        VerificationRequest.objects.filter(id=verification_request.id).update(
+            request_date=requested_at + timedelta(hours=index)
+        )
+        verification_requests.append(verification_request)
+    return verification_requests
+
+
+def create_reviewer(name):
+    return User.objects.create(
+        email=f'{name}@example.com',
+        username=name,
+        user_type=UserType.ADMIN,
+        is_staff=True
+    )
+
+
+class TemporaryMediaTestCase(TestCase):
+    """Stores uploaded documents under a throwaway MEDIA_ROOT"""
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        media_settings = self.settings(MEDIA_ROOT=media_root)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+
+
+@override_settings(SKILLS_VOLUNTEER_INDEX_ENABLED=False)
+class VolunteerSearchQueryCountTests(TestCase):
+    """Result assembly must not issue queries per result row"""
+
+    VOLUNTEER_COUNT = 50
+
+    @classmethod
+    def setUpTestData(cls):
+        category = SkillCategory.objects.create(name='Programming')
+        cls.skills = [
+            Skill.objects.create(name=f'Skill {index}', category=category)
+            for index in range(3)
+        ]
+        address = Address.objects.create(
+            address_line_1='1 Rue Didouche Mourad',
+            city='Algiers',
+            wilaya='Alger'
+        )
+
+        for index in range(cls.VOLUNTEER_COUNT):
+            user = User.objects.create(
+                email=f'volunteer{index}@example.com',
+                username=f'volunteer{index}',
+                user_type=UserType.VOLUNTEER,
+                phone_number='0555000000'
+            )
+            volunteer = VolunteerProfile.objects.create(user=user, address=address)
+            for skill in cls.skills:
+                VolunteerSkill.objects.create(
+                    volunteer=volunteer,
+                    skill=skill,
+                    proficiency_level=ProficiencyLevel.ADVANCED,
+                    verification_status=SkillVerificationStatus.VERIFIED
+                )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_search_by_skills_uses_fixed_number_of_queries(self):
+        skill_ids = [str(skill.id) for skill in self.skills]
+
+        # search + volunteer profiles + matched skills
+        with self.assertNumQueries(3):
+            results = VolunteerSearchService.search_volunteers_by_skills(
+                skill_ids=skill_ids,
+                match_type='all',
+                limit=self.VOLUNTEER_COUNT
+            )
+
+        self.assertEqual(len(results), self.VOLUNTEER_COUNT)
+        first = results[0]
+        self.assertEqual(first['phone_number'], '0555000000')
+        self.assertEqual(first['wilaya'], 'Alger')
+        self.assertEqual(first['matched_skills_count'], len(skill_ids))
+        self.assertEqual(first['matched_skills'][0]['category'], 'Programming')
+
+    def test_repeat_search_is_served_from_cache(self):
+        skill_ids = [str(skill.id) for skill in self.skills]
+        VolunteerSearchService.search_volunteers_by_skills(skill_ids=skill_ids)
+
+        # Only the ranking is cached: volunteer profiles + matched skills
+        with self.assertNumQueries(2):
+            VolunteerSearchService.search_volunteers_by_skills(skill_ids=list(reversed(skill_ids)))
+
+    def test_cached_search_shows_profile_edits(self):
+        skill_ids = [str(skill.id) for skill in self.skills]
+        first = VolunteerSearchService.search_volunteers_by_skills(skill_ids=skill_ids, limit=1)[0]
+
+        volunteer = VolunteerProfile.objects.get(id=first['volunteer_id'])
+        User.objects.filter(id=volunteer.user_id).update(first_name='Amel')
+        volunteer.address = Address.objects.create(
+            address_line_1='9 Avenue de l\'ALN',
+            city='Blida',
+            wilaya='Blida'
+        )
+        volunteer.save()
+
+        with self.assertNumQueries(2):
+            results = VolunteerSearchService.search_volunteers_by_skills(skill_ids=skill_ids, limit=1)
+        self.assertEqual(results[0]['volunteer_id'], first['volunteer_id'])
+        self.assertEqual(results[0]['wilaya'], 'Blida')
+        self.assertTrue(results[0]['volunteer_name'].startswith('Amel'))
+
+
+class VolunteerSkillIndexTests(TestCase):
+    """In-process bitmap index: search, writes and sync between processes"""
+
+    @classmethod
+    def setUpTestData(cls):
+        category = SkillCategory.objects.create(name='Languages')
+        cls.skills = [
+            Skill.objects.create(name=f'Language {index}', category=category)
+            for index in range(3)
+        ]
+        address = Address.objects.create(
+            address_line_1='1 Rue Larbi Ben M\'hidi',
+            city='Oran',
+            wilaya='Oran'
+        )
+        cls.volunteers = []
+        for index in range(3):
+            user = User.objects.create(
+                email=f'index{index}@example.com',
+                username=f'index{index}',
+                user_type=UserType.VOLUNTEER
+            )
+            cls.volunteers.append(VolunteerProfile.objects.create(user=user, address=address))
+
+        first, second, third = cls.volunteers
+        cls.first_skill = cls._add(first, cls.skills[0], SkillVerificationStatus.VERIFIED, ProficiencyLevel.ADVANCED)
+        cls._add(first, cls.skills[1], SkillVerificationStatus.PENDING, ProficiencyLevel.BEGINNER)
+        cls._add(second, cls.skills[0], SkillVerificationStatus.VERIFIED, ProficiencyLevel.EXPERT)
+        cls._add(third, cls.skills[1], SkillVerificationStatus.VERIFIED, ProficiencyLevel.ADVANCED)
+
+    @staticmethod
+    def _add(volunteer, skill, verification_status, proficiency_level):
+        return VolunteerSkill.objects.create(
+            volunteer=volunteer,
+            skill=skill,
+            verification_status=verification_status,
+            proficiency_level=proficiency_level
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.index = VolunteerSkillIndex()
+        self.index.rebuild()
+
+    def search(self, index, skills, **kwargs):
+        return dict(index.search([str(skill.id) for skill in skills], **kwargs))
+
+    def volunteer_id(self, position):
+        return str(self.volunteers[position].id)
+
+    def test_search_all_and_any(self):
+        self.assertEqual(
+            self.search(self.index, self.skills[:2]),
+            {self.volunteer_id(0): 2}
+        )
+        self.assertEqual(
+            self.search(self.index, self.skills[:2], match_type='any'),
+            {self.volunteer_id(0): 2, self.volunteer_id(1): 1, self.volunteer_id(2): 1}
+        )
+        # Volunteers matching more skills come first
+        ranked = self.index.search([str(skill.id) for skill in self.skills[:2]], match_type='any')
+        self.assertEqual(ranked[0], (self.volunteer_id(0), 2))
+
+    def test_search_filters_status_and_level(self):
+        self.assertEqual(
+            self.search(
+                self.index, [self.skills[1]],
+                verification_statuses=[SkillVerificationStatus.VERIFIED]
+            ),
+            {self.volunteer_id(2): 1}
+        )
+        self.assertEqual(
+            self.search(
+                self.index, [self.skills[0]],
+                proficiency_levels=[ProficiencyLevel.EXPERT]
+            ),
+            {self.volunteer_id(1): 1}
+        )
+
+    def test_update_moves_volunteer_skill_between_buckets(self):
+        self.first_skill.verification_status = SkillVerificationStatus.PENDING
+        self.first_skill.save()
+        self.index.update(self.first_skill)
+
+        verified = self.search(
+            self.index, [self.skills[0]],
+            verification_statuses=[SkillVerificationStatus.VERIFIED]
+        )
+        self.assertEqual(verified, {self.volunteer_id(1): 1})
+        self.assertIn(self.volunteer_id(0), self.search(self.index, [self.skills[0]]))
+
+    def test_remove(self):
+        self.index.remove(self.first_skill)
+        self.assertEqual(self.search(self.index, [self.skills[0]]), {self.volunteer_id(1): 1})
+
+    def test_other_process_write_is_replayed_without_rebuild(self):
+        other = VolunteerSkillIndex()
+        other.rebuild()
+        added = self._add(
+            self.volunteers[2], self.skills[2],
+            SkillVerificationStatus.VERIFIED, ProficiencyLevel.INTERMEDIATE
+        )
+        other.update(added)
+        other.remove(self.first_skill)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.search(self.index, [self.skills[2]]), {self.volunteer_id(2): 1})
+            self.assertEqual(self.search(self.index, [self.skills[0]]), {self.volunteer_id(1): 1})
+
+    def test_rebuilds_when_change_log_entry_is_missing(self):
+        other = VolunteerSkillIndex()
+        added = self._add(
+            self.volunteers[2], self.skills[2],
+            SkillVerificationStatus.VERIFIED, ProficiencyLevel.INTERMEDIATE
+        )
+        other.update(added)
+        cache.delete(other._change_key(cache.get(VolunteerSkillIndex.GENERATION_CACHE_KEY)))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.search(self.index, [self.skills[2]]), {self.volunteer_id(2): 1})
+
+    def test_write_committed_during_rebuild_is_not_lost(self):
+        other = VolunteerSkillIndex()
+        load_state = self.index._load_state
+        added = []
+
+        def load_state_then_write():
+            state = load_state()
+            # Another process commits and publishes after the scan read the table
+            added.append(self._add(
+                self.volunteers[2], self.skills[2],
+                SkillVerificationStatus.VERIFIED, ProficiencyLevel.INTERMEDIATE
+            ))
+            other.update(added[0])
+            return state
+
+        with patch.object(self.index, '_load_state', load_state_then_write):
+            self.index.rebuild()
+
+        self.assertEqual(self.search(self.index, [self.skills[2]]), {self.volunteer_id(2): 1})
+
+    def test_freed_slots_are_reused(self):
+        second_skill = VolunteerSkill.objects.get(volunteer=self.volunteers[1])
+        slot = self.index._slots[self.volunteer_id(1)]
+        # Moving a skill between buckets keeps the volunteer's skill count
+        self.index.update(second_skill)
+        self.index.remove(second_skill)
+        self.assertNotIn(self.volunteer_id(1), self.index._slots)
+
+        newcomer = create_volunteer('newcomer', self.volunteers[0].address)
+        added = self._add(newcomer, self.skills[2], SkillVerificationStatus.VERIFIED, ProficiencyLevel.BEGINNER)
+        self.index.update(added)
+
+        self.assertEqual(self.index._slots[str(newcomer.id)], slot)
+        self.assertEqual(len(self.index._volunteer_ids), 3)
+        self.assertEqual(self.search(self.index, [self.skills[2]]), {str(newcomer.id): 1})
+        self.assertEqual(self.search(self.index, [self.skills[0]]), {self.volunteer_id(0): 1})
+
+    def test_rebuild_compacts_slots(self):
+        VolunteerSkill.objects.filter(volunteer__in=self.volunteers[:2]).delete()
+        self.index.rebuild()
+
+        self.assertEqual(self.index._slots, {self.volunteer_id(2): 0})
+        self.assertEqual(self.search(self.index, [self.skills[1]]), {self.volunteer_id(2): 1})
+
+
+class MissionMatchServiceTests(TestCase):
+    """Match table rows follow MissionSkill and VolunteerSkill writes"""
+
+    @classmethod
+    def setUpTestData(cls):
+        category = SkillCategory.objects.create(name='Health')
+        cls.first_aid, cls.nursing, cls.driving = [
+            Skill.objects.create(name=name, category=category)
+            for name in ('First Aid', 'Nursing', 'Driving')
+        ]
+        cls.address = Address.objects.create(
+            address_line_1='2 Boulevard Zighout Youcef',
+            city='Constantine',
+            wilaya='Constantine'
+        )
+        cls.volunteer = create_volunteer('medic', cls.address)
+        cls.mission = create_mission('Blood drive', cls.address)
+
+    def add_mission_skill(self, skill, requirement_level):
+        with self.captureOnCommitCallbacks(execute=True):
+            return MissionSkill.objects.create(
+                mission=self.mission,
+                skill=skill,
+                requirement_level=requirement_level
+            )
+
+    def add_volunteer_skill(self, skill, verification_status=SkillVerificationStatus.PENDING):
+        with self.captureOnCommitCallbacks(execute=True):
+            return VolunteerSkill.objects.create(
+                volunteer=self.volunteer,
+                skill=skill,
+                verification_status=verification_status
+            )
+
+    def match(self):
+        return MissionVolunteerMatch.objects.get(mission=self.mission, volunteer=self.volunteer)
+
+    def test_volunteer_skill_writes_refresh_scores(self):
+        self.add_mission_skill(self.first_aid, RequirementLevel.REQUIRED)
+        self.add_mission_skill(self.nursing, RequirementLevel.CRITICAL)
+        self.add_mission_skill(self.driving, RequirementLevel.PREFERRED)
+        self.assertFalse(MissionVolunteerMatch.objects.exists())
+
+        first_aid = self.add_volunteer_skill(self.first_aid)
+        match = self.match()
+        self.assertEqual((match.required_skills_total, match.preferred_skills_total), (2, 1))
+        self.assertEqual(match.required_skills_matched, 1)
+        self.assertEqual(match.required_skills_missing, 1)
+        self.assertEqual(match.overall_score, 35.0)
+        self.assertEqual(match.verified_overall_score, 0.0)
+
+        self.add_volunteer_skill(self.driving, SkillVerificationStatus.VERIFIED)
+        self.assertEqual(self.match().overall_score, 65.0)
+        self.assertEqual(self.match().verified_overall_score, 30.0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first_aid.verification_status = SkillVerificationStatus.VERIFIED
+            first_aid.save()
+        self.assertEqual(self.match().verified_overall_score, 65.0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first_aid.delete()
+        self.assertEqual(self.match().overall_score, 30.0)
+        self.assertEqual(self.match().required_skills_missing, 2)
+
+    def test_mission_skill_writes_refresh_scores(self):
+        self.add_volunteer_skill(self.first_aid)
+        self.add_volunteer_skill(self.nursing)
+        first_aid = self.add_mission_skill(self.first_aid, RequirementLevel.REQUIRED)
+        # Missions without preferred skills score at most the required weight
+        self.assertEqual(self.match().overall_score, 70.0)
+
+        self.add_mission_skill(self.driving, RequirementLevel.REQUIRED)
+        self.assertEqual(self.match().overall_score, 35.0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first_aid.requirement_level = RequirementLevel.NICE_TO_HAVE
+            first_aid.save()
+        match = self.match()
+        self.assertEqual((match.required_skills_total, match.preferred_skills_total), (1, 1))
+        self.assertEqual(match.overall_score, 30.0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first_aid.delete()
+        self.assertFalse(MissionVolunteerMatch.objects.exists())
+
+    def test_refresh_mission_replaces_stale_rows(self):
+        self.add_volunteer_skill(self.first_aid)
+        self.add_mission_skill(self.first_aid, RequirementLevel.REQUIRED)
+        MissionVolunteerMatch.objects.update(overall_score=1.0)
+
+        self.assertEqual(MissionMatchService.refresh_mission(self.mission.id), 1)
+        self.assertEqual(self.match().overall_score, 70.0)
+
+    def test_refresh_volunteer_skill_only_touches_that_volunteer(self):
+        other = create_volunteer('paramedic', self.address)
+        VolunteerSkill.objects.create(volunteer=other, skill=self.first_aid)
+        VolunteerSkill.objects.create(volunteer=self.volunteer, skill=self.first_aid)
+        MissionSkill.objects.create(
+            mission=self.mission,
+            skill=self.first_aid,
+            requirement_level=RequirementLevel.REQUIRED
+        )
+
+        self.assertEqual(
+            MissionMatchService.refresh_volunteer_skill(self.volunteer.id, self.first_aid.id), 1
+        )
+        self.assertEqual(
+            list(MissionVolunteerMatch.objects.values_list('volunteer_id', flat=True)),
+            [self.volunteer.id]
+        )
+
+    def test_migration_backfills_existing_matches(self):
+        VolunteerSkill.objects.create(volunteer=self.volunteer, skill=self.first_aid)
+        VolunteerSkill.objects.create(
+            volunteer=self.volunteer,
+            skill=self.driving,
+            verification_status=SkillVerificationStatus.VERIFIED
+        )
+        MissionSkill.objects.create(
+            mission=self.mission,
+            skill=self.first_aid,
+            requirement_level=RequirementLevel.REQUIRED
+        )
+        MissionSkill.objects.create(
+            mission=self.mission,
+            skill=self.driving,
+            requirement_level=RequirementLevel.PREFERRED
+        )
+        self.assertFalse(MissionVolunteerMatch.objects.exists())
+
+        backfill = import_module('apps.skills.migrations.0014_backfill_mission_volunteer_matches')
+        backfill.populate_matches(apps, None)
+        backfilled = list(MissionVolunteerMatch.objects.values_list(
+            'overall_score', 'verified_overall_score', 'required_skills_missing'
+        ))
+
+        MissionMatchService.refresh_mission(self.mission.id)
+        refreshed = list(MissionVolunteerMatch.objects.values_list(
+            'overall_score', 'verified_overall_score', 'required_skills_missing'
+        ))
+        self.assertEqual(backfilled, refreshed)
+        self.assertEqual(refreshed, [(100.0, 30.0, 0)])
+
+
+class FindVolunteersForMissionsTests(TestCase):
+    """Batch matching reads the top rows per mission from the match table"""
+
+    @classmethod
+    def setUpTestData(cls):
+        category = SkillCategory.objects.create(name='Logistics')
+        cls.cooking, cls.driving, cls.lifting = [
+            Skill.objects.create(name=name, category=category)
+            for name in ('Cooking', 'Driving', 'Lifting')
+        ]
+        address = Address.objects.create(
+            address_line_1='5 Rue Ben Boulaid',
+            city='Batna',
+            wilaya='Batna'
+        )
+        cls.kitchen = create_mission('Soup kitchen', address)
+        cls.delivery = create_mission('Food delivery', address)
+        for mission, skill, level in (
+            (cls.kitchen, cls.cooking, RequirementLevel.REQUIRED),
+            (cls.kitchen, cls.lifting, RequirementLevel.PREFERRED),
+            (cls.delivery, cls.driving, RequirementLevel.REQUIRED),
+            (cls.delivery, cls.lifting, RequirementLevel.REQUIRED),
+        ):
+            MissionSkill.objects.create(mission=mission, skill=skill, requirement_level=level)
+
+        cls.volunteers = {}
+        for name, skills in (
+            ('chef', [cls.cooking, cls.lifting]),
+            ('cook', [cls.cooking]),
+            ('driver', [cls.driving, cls.lifting]),
+            ('mover', [cls.lifting]),
+        ):
+            volunteer = create_volunteer(name, address)
+            cls.volunteers[name] = str(volunteer.id)
+            for skill in skills:
+                VolunteerSkill.objects.create(
+                    volunteer=volunteer,
+                    skill=skill,
+                    verification_status=SkillVerificationStatus.VERIFIED
+                )
+        MissionMatchService.rebuild_all()
+
+    def ranked(self, results, mission):
+        return [
+            (result['volunteer_id'], result['mission_match']['overall_score'])
+            for result in results[str(mission.id)]
+        ]
+
+    def test_ranks_each_mission_from_match_table(self):
+        results = VolunteerSearchService.find_volunteers_for_missions(
+            [self.kitchen.id, self.delivery.id],
+            require_all_skills=False
+        )
+
+        # Equal scores are ordered by volunteer ID
+        self.assertEqual(self.ranked(results, self.kitchen), [
+            (self.volunteers['chef'], 100.0),
+            (self.volunteers['cook'], 70.0),
+            *sorted((self.volunteers[name], 30.0) for name in ('driver', 'mover')),
+        ])
+        self.assertEqual(
+            [volunteer_id for volunteer_id, _ in self.ranked(results, self.delivery)][0],
+            self.volunteers['driver']
+        )
+        chef = results[str(self.kitchen.id)][0]
+        self.assertEqual(chef['matched_skills_count'], 2)
+        self.assertTrue(chef['mission_match']['is_fully_qualified'])
+
+    def test_limit_applies_per_mission(self):
+        results = VolunteerSearchService.find_volunteers_for_missions(
+            [self.kitchen.id, self.delivery.id],
+            require_all_skills=False,
+            limit=1
+        )
+        self.assertEqual(self.ranked(results, self.kitchen), [(self.volunteers['chef'], 100.0)])
+        self.assertEqual(self.ranked(results, self.delivery), [(self.volunteers['driver'], 70.0)])
+
+    def test_require_all_skills_and_agreement_with_single_mission_search(self):
+        results = VolunteerSearchService.find_volunteers_for_missions(
+            [self.kitchen.id, self.delivery.id]
+        )
+        for mission in (self.kitchen, self.delivery):
+            single = VolunteerSearchService.find_volunteers_for_mission(mission.id)
+            self.assertEqual(results[str(mission.id)], single)
+        self.assertEqual(
+            [volunteer_id for volunteer_id, _ in self.ranked(results, self.kitchen)],
+            [self.volunteers['chef'], self.volunteers['cook']]
+        )
+
+    def test_missions_without_skills_or_matches_get_empty_lists(self):
+        address = Address.objects.first()
+        empty = create_mission('Beach cleanup', address)
+        results = VolunteerSearchService.find_volunteers_for_missions([empty.id])
+        self.assertEqual(results, {str(empty.id): []})
+
+    def test_query_count_does_not_depend_on_volunteers(self):
+        # mission skills + ranked match rows + profiles + matched skills
+        with self.assertNumQueries(4):
+            VolunteerSearchService.find_volunteers_for_missions(
+                [self.kitchen.id, self.delivery.id],
+                require_all_skills=False
+            )
+
+
+class PublishedMissionIndexTests(TestCase):
+    """Published mission index: lookups, replay and Mission signal filtering"""
+
+    @classmethod
+    def setUpTestData(cls):
+        category = SkillCategory.objects.create(name='Education')
+        cls.teaching, cls.tutoring = [
+            Skill.objects.create(name=name, category=category)
+            for name in ('Teaching', 'Tutoring')
+        ]
+        cls.address = Address.objects.create(
+            address_line_1='3 Rue de la Liberte',
+            city='Tlemcen',
+            wilaya='Tlemcen'
+        )
+        cls.school = create_mission('After school', cls.address, status=MissionStatus.PUBLISHED)
+        cls.draft = create_mission('Summer camp', cls.address)
+        for mission in (cls.school, cls.draft):
+            MissionSkill.objects.create(
+                mission=mission,
+                skill=cls.teaching,
+                requirement_level=RequirementLevel.CRITICAL
+            )
+        MissionSkill.objects.create(
+            mission=cls.school,
+            skill=cls.tutoring,
+            requirement_level=RequirementLevel.NICE_TO_HAVE
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.index = PublishedMissionIndex()
+        self.index.rebuild()
+
+    def candidates(self, index):
+        return {
+            mission_id: (required, preferred)
+            for mission_id, required, preferred in index.candidates([self.teaching.id])
+        }
+
+    def test_candidates_cover_published_missions_only(self):
+        self.assertEqual(self.candidates(self.index), {
+            str(self.school.id): ({str(self.teaching.id)}, {str(self.tutoring.id)}),
+        })
+
+    def test_other_process_refresh_reloads_only_that_mission(self):
+        other = PublishedMissionIndex()
+        Mission.objects.filter(id=self.draft.id).update(status=MissionStatus.PUBLISHED)
+        other.refresh_mission(self.draft.id)
+
+        # One query for the changed mission, not a rebuild
+        with self.assertNumQueries(1):
+            candidates = self.candidates(self.index)
+        self.assertEqual(set(candidates), {str(self.school.id), str(self.draft.id)})
+
+        Mission.objects.filter(id=self.school.id).delete()
+        other.remove_mission(self.school.id)
+        self.assertEqual(set(self.candidates(self.index)), {str(self.draft.id)})
+
+    def test_mission_saves_only_reindex_on_listing_changes(self):
+        generation_key = PublishedMissionIndex.GENERATION_CACHE_KEY
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.draft.title = 'Winter camp'
+            self.draft.save()
+        self.assertIsNone(cache.get(generation_key))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.draft.is_featured = True
+            self.draft.save()
+        self.assertEqual(cache.get(generation_key), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.draft.status = MissionStatus.PUBLISHED
+            self.draft.save()
+        self.assertEqual(cache.get(generation_key), 2)
+        self.assertIn(str(self.draft.id), self.candidates(self.index))
+
+
+class MissionRecommendationServiceTests(TestCase):
+    """Recommended missions: scoring, skill filters and open applications only"""
+
+    @classmethod
+    def setUpTestData(cls):
+        category = SkillCategory.objects.create(name='Education')
+        teaching, tutoring, coding = [
+            Skill.objects.create(name=name, category=category)
+            for name in ('Teaching', 'Tutoring', 'Coding')
+        ]
+        address = Address.objects.create(
+            address_line_1='3 Rue de la Liberte',
+            city='Tlemcen',
+            wilaya='Tlemcen'
+        )
+        cls.volunteer = create_volunteer('amel', address)
+        VolunteerSkill.objects.create(
+            volunteer=cls.volunteer,
+            skill=teaching,
+            verification_status=SkillVerificationStatus.VERIFIED
+        )
+        VolunteerSkill.objects.create(volunteer=cls.volunteer, skill=tutoring)
+
+        past = timezone.now() - timedelta(days=1)
+        cls.missions = {}
+        for title, required, preferred, kwargs in (
+            ('Full match', [teaching], [tutoring], {}),
+            ('Half match', [teaching, coding], [], {}),
+            ('Preferred only', [], [tutoring, coding], {}),
+            ('Closed', [teaching], [], {'application_deadline': past}),
+            ('Applied', [teaching], [], {}),
+            ('Draft', [teaching], [], {'status': MissionStatus.DRAFT}),
+        ):
+            kwargs.setdefault('status', MissionStatus.PUBLISHED)
+            mission = create_mission(title, address, **kwargs)
+            for skills, level in ((required, RequirementLevel.REQUIRED), (preferred, RequirementLevel.PREFERRED)):
+                for skill in skills:
+                    MissionSkill.objects.create(mission=mission, skill=skill, requirement_level=level)
+            cls.missions[title] = mission
+        Participation.objects.create(mission=cls.missions['Applied'], volunteer=cls.volunteer)
+
+    def setUp(self):
+        cache.clear()
+        published_mission_index.rebuild()
+
+    def recommend(self, **kwargs):
+        return [
+            (recommendation['title'], recommendation['mission_match']['overall_score'])
+            for recommendation in MissionRecommendationService.recommend_missions_for_volunteer(
+                str(self.volunteer.id), **kwargs
+            )
+        ]
+
+    def test_ranked_by_score(self):
+        self.assertEqual(self.recommend(), [
+            ('Full match', 100.0),
+            ('Preferred only', 85.0),
+            ('Half match', 35.0),
+        ])
+        self.assertEqual(self.recommend(limit=1), [('Full match', 100.0)])
+
+        half = MissionRecommendationService.recommend_missions_for_volunteer(str(self.volunteer.id))[2]
+        self.assertEqual(half['mission_match']['required_skills_missing'], 1)
+        self.assertFalse(half['mission_match']['is_fully_qualified'])
+
+    def test_require_all_skills(self):
+        self.assertEqual(
+            self.recommend(require_all_skills=True),
+            [('Full match', 100.0), ('Preferred only', 85.0)]
+        )
+
+    def test_verified_only(self):
+        self.assertEqual(
+            self.recommend(verified_only=True),
+            [('Full match', 70.0), ('Half match', 35.0)]
+        )
+
+    def test_missions_past_their_deadline_are_skipped(self):
+        Mission.objects.filter(id=self.missions['Full match'].id).update(
+            application_deadline=timezone.now() - timedelta(hours=1)
+        )
+        self.assertEqual(
+            [title for title, _ in self.recommend()],
+            ['Preferred only', 'Half match']
+        )
+
+    def test_volunteer_without_skills(self):
+        other = create_volunteer('karim', self.volunteer.address)
+        self.assertEqual(
+            MissionRecommendationService.recommend_missions_for_volunteer(str(other.id)),
+            []
+        )
+
+
+class FindVolunteersNearMissionTests(TestCase):
+    """Distance-aware matching: travel radii, the scan cap and the cached reach"""
+
+    @classmethod
+    def setUpTestData(cls):
+        category = SkillCategory.objects.create(name='Rescue')
+        cls.swimming = Skill.objects.create(name='Swimming', category=category)
+        mission_address = Address.objects.create(
+            address_line_1='Port',
+            city='Algiers',
+            wilaya='Alger',
+            latitude=Decimal('36.750000'),
+            longitude=Decimal('3.050000')
+        )
+        cls.mission = create_mission('Beach patrol', mission_address)
+        MissionSkill.objects.create(
+            mission=cls.mission,
+            skill=cls.swimming,
+            requirement_level=RequirementLevel.REQUIRED
+        )
+
+        cls.volunteers = {}
+        for name, latitude, longitude, willing, distance in (
+            # about 5 km away, stays local
+            ('local', '36.790000', '3.050000', False, 50),
+            # about 45 km away, travels 50 km
+            ('commuter', '36.350000', '3.050000', True, 50),
+            # about 45 km away, travels 20 km
+            ('homebody', '36.350000', '3.050000', True, 20),
+            # about 330 km away, travels 1000 km
+            ('nomad', '35.750000', '-0.600000', True, 1000),
+        ):
+            address = Address.objects.create(
+                address_line_1=name,
+                city=name,
+                wilaya='Alger',
+                latitude=Decimal(latitude),
+                longitude=Decimal(longitude)
+            )
+            volunteer = create_volunteer(
+                f'swimmer_{name}', address,
+                willing_to_travel=willing,
+                max_travel_distance_km=distance
+            )
+            cls.volunteers[name] = str(volunteer.id)
+            VolunteerSkill.objects.create(
+                volunteer=volunteer,
+                skill=cls.swimming,
+                verification_status=SkillVerificationStatus.VERIFIED
+            )
+        MissionMatchService.rebuild_all()
+
+    def setUp(self):
+        cache.clear()
+
+    def found(self, **kwargs):
+        return {
+            result['volunteer_id']: result['distance_km']
+            for result in VolunteerSearchService.find_volunteers_near_mission(self.mission.id, **kwargs)
+        }
+
+    def names(self, found):
+        return {name for name, volunteer_id in self.volunteers.items() if volunteer_id in found}
+
+    @override_settings(SKILLS_PROXIMITY_MAX_RADIUS_KM=2000)
+    def test_volunteers_within_their_own_travel_radius(self):
+        found = self.found()
+        self.assertEqual(self.names(found), {'local', 'commuter', 'nomad'})
+        self.assertAlmostEqual(found[self.volunteers['commuter']], 44.5, delta=1)
+
+        self.assertEqual(self.names(self.found(max_distance_km=10)), {'local'})
+
+    def test_scan_radius_is_capped(self):
+        self.assertEqual(self.names(self.found()), {'local', 'commuter'})
+
+    def test_travel_reach_is_cached_until_travel_settings_change(self):
+        self.assertEqual(VolunteerSearchService.get_travel_reach(), 1000)
+        with self.assertNumQueries(0):
+            VolunteerSearchService.get_travel_reach()
+
+        nomad = VolunteerProfile.objects.get(id=self.volunteers['nomad'])
+        with self.captureOnCommitCallbacks(execute=True):
+            nomad.bio = None
+            nomad.save()
+        with self.assertNumQueries(0):
+            VolunteerSearchService.get_travel_reach()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            nomad.max_travel_distance_km = 60
+            nomad.save()
+        self.assertEqual(VolunteerSearchService.get_travel_reach(), 60)
+
+    def test_query_count(self):
+        VolunteerSearchService.get_travel_reach()
+        # mission + mission skills + candidate rows + profiles + matched skills
+        with self.assertNumQueries(5):
+            self.found()
+
+
+class SkillSearchFallbackTests(TestCase):
+    """Skill and category search without PostgreSQL ranks in Python"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.health = SkillCategory.objects.create(name='Health', description='Medical care')
+        cls.transport = SkillCategory.objects.create(name='Transport', description='Moving supplies for health teams')
+        cls.first_aid = Skill.objects.create(name='First Aid', description='Emergency care', category=cls.health)
+        cls.driving = Skill.objects.create(
+            name='Driving', description='Delivering first aid kits', category=cls.transport
+        )
+        cls.nursing = Skill.objects.create(
+            name='Nursing', description='First aid and patient care', category=cls.health, is_active=False
+        )
+
+    def test_search_skills_returns_ranked_list(self):
+        results = SkillService.search_skills('first aid')
+        self.assertIsInstance(results, list)
+        self.assertEqual(results, [self.first_aid, self.driving])
+
+    def test_search_skills_matches_misspelled_name(self):
+        self.assertEqual(SkillService.search_skills('frist aid'), [self.first_aid])
+
+    def test_search_skills_filters_by_category(self):
+        self.assertEqual(
+            SkillService.search_skills('first aid', category_id=self.transport.id), [self.driving]
+        )
+
+    def test_search_categories_returns_ranked_list(self):
+        results = SkillCategoryService.search_categories('health')
+        self.assertIsInstance(results, list)
+        self.assertEqual(results, [self.health, self.transport])
+
+    def test_blank_query_returns_empty_list(self):
+        self.assertEqual(SkillService.search_skills(''), [])
+        self.assertEqual(SkillCategoryService.search_categories(''), [])
+
+
+class SkillAutocompleteIndexTests(TestCase):
+    """Prefix lookups over skill names and aliases, and rebuilds after skill writes"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.technology = SkillCategory.objects.create(name='Technology')
+        cls.javascript = Skill.objects.create(
+            name='JavaScript', category=cls.technology, aliases=['JS', 'ECMAScript']
+        )
+        cls.java = Skill.objects.create(name='Java', category=cls.technology)
+        cls.jazz = Skill.objects.create(name='Jazz Piano', category=cls.technology)
+        cls.web_design = Skill.objects.create(name='Web Design', category=cls.technology)
+        cls.ecology = Skill.objects.create(name='Ecology', category=cls.technology)
+        cls.cafe = Skill.objects.create(name='Café Management', category=cls.technology)
+        for skill, volunteer_count in ((cls.javascript, 5), (cls.java, 2), (cls.ecology, 1)):
+            SkillUsageCounter.objects.update_or_create(
+                skill=skill, defaults={'volunteer_count': volunteer_count}
+            )
+
+    def setUp(self):
+        cache.clear()
+        skill_autocomplete_index.invalidate()
+
+    def names(self, prefix, limit=10):
+        return [suggestion['name'] for suggestion in SkillService.autocomplete_skills(prefix, limit)]
+
+    def test_prefix_matches_are_ordered_by_popularity(self):
+        self.assertEqual(self.names('ja'), ['JavaScript', 'Java', 'Jazz Piano'])
+        self.assertEqual(self.names('jav'), ['JavaScript', 'Java'])
+
+    def test_any_word_can_start_a_match(self):
+        self.assertEqual(self.names('design'), ['Web Design'])
+        self.assertEqual(self.names('web d'), ['Web Design'])
+
+    def test_matching_ignores_case_and_accents(self):
+        self.assertEqual(self.names('CAFE'), ['Café Management'])
+
+    def test_alias_matches_are_flagged(self):
+        suggestions = SkillService.autocomplete_skills('js')
+        self.assertEqual([suggestion['id'] for suggestion in suggestions], [str(self.javascript.id)])
+        self.assertTrue(suggestions[0]['matched_alias'])
+        self.assertEqual(suggestions[0]['volunteer_count'], 5)
+
+    def test_name_matches_rank_ahead_of_alias_matches(self):
+        # JavaScript is more popular but only matches 'ec' through ECMAScript
+        suggestions = SkillService.autocomplete_skills('ec')
+        self.assertEqual(
+            [(suggestion['name'], suggestion['matched_alias']) for suggestion in suggestions],
+            [('Ecology', False), ('JavaScript', True)]
+        )
+
+    def test_limit(self):
+        self.assertEqual(self.names('ja', limit=2), ['JavaScript', 'Java'])
+        self.assertEqual(self.names('ja', limit=0), [])
+        self.assertEqual(self.names('  '), [])
+
+    def test_rename_and_deactivation_rebuild_the_index(self):
+        self.assertEqual(self.names('ja'), ['JavaScript', 'Java', 'Jazz Piano'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.java.name = 'Kotlin'
+            self.java.save()
+            self.jazz.is_active = False
+            self.jazz.save()
+
+        self.assertEqual(self.names('ja'), ['JavaScript'])
+        self.assertEqual(self.names('kot'), ['Kotlin'])
+
+    def test_other_processes_rebuild_after_a_change(self):
+        other = SkillAutocompleteIndex()
+        other.GENERATION_CHECK_SECONDS = 0
+        self.assertEqual(len(other.complete('ja')), 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.jazz.is_active = False
+            self.jazz.save()
+
+        self.assertEqual([suggestion['name'] for suggestion in other.complete('ja')], ['JavaScript', 'Java'])
+
+
+class SkillCategoryClosureTests(TestCase):
+    """Closure rows follow creates, moves and deletes of categories"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.health = SkillCategory.objects.create(name='Health')
+        cls.first_aid = SkillCategory.objects.create(name='First Aid', parent_category=cls.health)
+        cls.trauma = SkillCategory.objects.create(name='Trauma', parent_category=cls.first_aid)
+        cls.logistics = SkillCategory.objects.create(name='Logistics')
+
+    def links(self):
+        return set(SkillCategoryClosure.objects.values_list('ancestor_id', 'descendant_id', 'depth'))
+
+    def assertMatchesRebuild(self):
+        links = self.links()
+        SkillCategoryService.rebuild_closure()
+        self.assertEqual(self.links(), links)
+
+    def test_create_links_every_ancestor(self):
+        self.assertEqual(
+            set(SkillCategoryClosure.objects.filter(
+                descendant=self.trauma
+            ).values_list('ancestor_id', 'depth')),
+            {(self.trauma.id, 0), (self.first_aid.id, 1), (self.health.id, 2)}
+        )
+        self.assertEqual(
+            [category.id for category in SkillCategoryService.get_category_path(self.trauma)],
+            [self.health.id, self.first_aid.id, self.trauma.id]
+        )
+        self.assertMatchesRebuild()
+
+    def test_move_carries_the_subtree(self):
+        SkillCategoryService.update_category(
+            str(self.first_aid.id),
+            parent_category_id=str(self.logistics.id)
+        )
+
+        self.assertEqual(
+            set(SkillCategoryService.get_descendant_ids(str(self.logistics.id), include_self=False)),
+            {self.first_aid.id, self.trauma.id}
+        )
+        self.assertFalse(SkillCategoryService.get_descendants(str(self.health.id)).exists())
+        self.assertMatchesRebuild()
+
+        SkillCategoryService.update_category(str(self.first_aid.id), parent_category_id='')
+        self.assertEqual(
+            [category.id for category in SkillCategoryService.get_category_path(self.trauma)],
+            [self.first_aid.id, self.trauma.id]
+        )
+        self.assertMatchesRebuild()
+
+    def test_cycles_are_rejected(self):
+        for parent in (self.first_aid, self.trauma):
+            with self.subTest(parent=parent.name), self.assertRaises(ValidationError):
+                SkillCategoryService.update_category(
+                    str(self.first_aid.id),
+                    parent_category_id=str(parent.id)
+                )
+
+        self.first_aid.refresh_from_db()
+        self.assertEqual(self.first_aid.parent_category_id, self.health.id)
+        self.assertMatchesRebuild()
+
+    def test_delete_with_reassignment_shortens_paths(self):
+        SkillCategoryService.delete_category(str(self.first_aid.id), reassign_to_parent=True)
+
+        self.assertEqual(
+            set(SkillCategoryClosure.objects.filter(
+                descendant=self.trauma
+            ).values_list('ancestor_id', 'depth')),
+            {(self.trauma.id, 0), (self.health.id, 1)}
+        )
+        self.assertMatchesRebuild()
+
+    def test_rebuild_restores_a_damaged_table(self):
+        links = self.links()
+        SkillCategoryClosure.objects.filter(descendant=self.trauma).delete()
+
+        self.assertEqual(SkillCategoryService.rebuild_closure(), len(links))
+        self.assertEqual(self.links(), links)
+
+
+class SkillCategoryTreeSnapshotTests(TestCase):
+    """Cached tree snapshot: served from cache until the tree changes"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.health = SkillCategory.objects.create(name='Health')
+        cls.first_aid = SkillCategory.objects.create(name='First Aid', parent_category=cls.health)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_snapshot_is_cached_until_a_category_changes(self):
+        snapshot = SkillCategoryService.get_category_tree_snapshot()
+        tree = json.loads(snapshot['body'])
+        self.assertEqual([node['name'] for node in tree], ['Health'])
+        self.assertEqual([node['name'] for node in tree[0]['subcategories']], ['First Aid'])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(SkillCategoryService.get_category_tree_snapshot(), snapshot)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            SkillCategory.objects.create(name='Logistics')
+        refreshed = SkillCategoryService.get_category_tree_snapshot()
+        self.assertGreater(refreshed['version'], snapshot['version'])
+        self.assertEqual(
+            [node['name'] for node in json.loads(refreshed['body'])],
+            ['Health', 'Logistics']
+        )
+
+    def test_skill_changes_outdate_the_snapshot(self):
+        snapshot = SkillCategoryService.get_category_tree_snapshot()
+        with self.captureOnCommitCallbacks(execute=True):
+            Skill.objects.create(name='Triage', category=self.first_aid)
+
+        tree = json.loads(SkillCategoryService.get_category_tree_snapshot()['body'])
+        self.assertNotEqual(SkillCategoryService.get_category_tree_version(), snapshot['version'])
+        self.assertEqual(tree[0]['subcategories'][0]['skills_count'], 1)
+
+    def test_would_create_cycle(self):
+        self.assertTrue(SkillCategoryService.would_create_cycle(self.health, self.first_aid))
+        self.assertTrue(SkillCategoryService.would_create_cycle(self.health, self.health))
+        self.assertFalse(SkillCategoryService.would_create_cycle(self.first_aid, self.health))
+
+
+class SkillCategoryStatisticsTests(TestCase):
+    """Own and subtree counts, live and from the precomputed rollup"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.health = SkillCategory.objects.create(name='Health')
+        cls.first_aid = SkillCategory.objects.create(name='First Aid', parent_category=cls.health)
+        cls.trauma = SkillCategory.objects.create(name='Trauma', parent_category=cls.first_aid)
+        skills = {
+            name: Skill.objects.create(name=name, category=category)
+            for name, category in (
+                ('Nursing', cls.health),
+                ('CPR', cls.first_aid),
+                ('Triage', cls.first_aid),
+                ('Suturing', cls.trauma),
+            )
+        }
+        address = Address.objects.create(
+            address_line_1='5 Rue Larbi Ben Mhidi',
+            city='Oran',
+            wilaya='Oran'
+        )
+        for name, skill_names in (('amel', ('CPR', 'Triage')), ('karim', ('Nursing', 'Suturing'))):
+            volunteer = create_volunteer(name, address)
+            for skill_name in skill_names:
+                VolunteerSkill.objects.create(
+                    volunteer=volunteer,
+                    skill=skills[skill_name],
+                    proficiency_level=ProficiencyLevel.INTERMEDIATE
+                )
+
+    def counts(self, stats):
+        return {
+            key: stats[key]
+            for key in (
+                'total_skills', 'total_subcategories', 'total_volunteers',
+                'subtree_skills', 'subtree_subcategories', 'subtree_volunteers',
+                'depth_level',
+            )
+        }
+
+    def test_live_statistics_count_each_volunteer_once(self):
+        with self.assertNumQueries(2):
+            first_aid = SkillCategoryService.get_category_statistics(str(self.first_aid.id))
+        self.assertEqual(self.counts(first_aid), {
+            'total_skills': 2,
+            'total_subcategories': 1,
+            'total_volunteers': 1,
+            'subtree_skills': 3,
+            'subtree_subcategories': 1,
+            'subtree_volunteers': 2,
+            'depth_level': 2,
+        })
+        self.assertIsNone(first_aid['computed_at'])
+
+        health = SkillCategoryService.get_category_statistics(str(self.health.id))
+        self.assertEqual(
+            (health['total_skills'], health['subtree_skills'], health['subtree_subcategories']),
+            (1, 4, 2)
+        )
+
+    def test_precomputed_statistics_match_live_ones(self):
+        self.assertEqual(SkillCategoryService.refresh_statistics_rollup(), 3)
+
+        for category in (self.health, self.first_aid, self.trauma):
+            with self.subTest(category=category.name):
+                live = SkillCategoryService.get_category_statistics(str(category.id))
+                stored = SkillCategoryService.get_category_statistics(
+                    str(category.id), precomputed=True
+                )
+                self.assertEqual(self.counts(stored), self.counts(live))
+                self.assertIsNotNone(stored['computed_at'])
+
+    def test_precomputed_falls_back_to_live_counts(self):
+        stats = SkillCategoryService.get_category_statistics(str(self.trauma.id), precomputed=True)
+        self.assertIsNone(stats['computed_at'])
+        self.assertEqual(stats['subtree_volunteers'], 1)
+
+
+@override_settings(SKILLS_VOLUNTEER_INDEX_ENABLED=False)
+class SearchVolunteersByCategoryTests(TestCase):
+    """Category search over the category alone or its whole subtree"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.health = SkillCategory.objects.create(name='Health')
+        cls.first_aid = SkillCategory.objects.create(name='First Aid', parent_category=cls.health)
+        cls.nursing = Skill.objects.create(name='Nursing', category=cls.health)
+        cls.cpr = Skill.objects.create(name='CPR', category=cls.first_aid)
+        address = Address.objects.create(
+            address_line_1='5 Rue Larbi Ben Mhidi',
+            city='Oran',
+            wilaya='Oran'
+        )
+        cls.volunteers = {}
+        for name, skill in (('amel', cls.nursing), ('karim', cls.cpr)):
+            volunteer = create_volunteer(name, address)
+            VolunteerSkill.objects.create(
+                volunteer=volunteer,
+                skill=skill,
+                proficiency_level=ProficiencyLevel.ADVANCED,
+                verification_status=SkillVerificationStatus.VERIFIED
+            )
+            cls.volunteers[str(volunteer.id)] = name
+
+    def setUp(self):
+        cache.clear()
+
+    def names(self, category, **kwargs):
+        return {
+            self.volunteers[result['volunteer_id']]
+            for result in VolunteerSearchService.search_volunteers_by_category(
+                str(category.id), **kwargs
+            )
+        }
+
+    def test_subcategories_are_included_on_request(self):
+        self.assertEqual(self.names(self.health), {'amel'})
+        self.assertEqual(self.names(self.health, include_subcategories=True), {'amel', 'karim'})
+        self.assertEqual(self.names(self.first_aid, include_subcategories=True), {'karim'})
+
+    def test_subcategory_skill_writes_outdate_ancestor_searches(self):
+        self.assertEqual(self.names(self.health, include_subcategories=True), {'amel', 'karim'})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            VolunteerSkill.objects.filter(skill=self.cpr).delete()
+        self.assertEqual(self.names(self.health, include_subcategories=True), {'amel'})
+
+    def test_category_moves_outdate_searches(self):
+        logistics = SkillCategory.objects.create(name='Logistics')
+        self.assertEqual(self.names(logistics, include_subcategories=True), set())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.first_aid.parent_category = logistics
+            self.first_aid.save()
+        self.assertEqual(self.names(logistics, include_subcategories=True), {'karim'})
+        self.assertEqual(self.names(self.health, include_subcategories=True), {'amel'})
+
+    def test_index_path_matches_query_path(self):
+        expected = self.names(self.health, include_subcategories=True)
+        cache.clear()
+        with self.settings(SKILLS_VOLUNTEER_INDEX_ENABLED=True):
+            volunteer_skill_index.rebuild()
+            self.assertEqual(self.names(self.health, include_subcategories=True), expected)
+
+
+class SkillCooccurrenceServiceTests(TestCase):
+    """Co-occurrence rebuild: cosine scores, deterministic ties and suggestions"""
+
+    @classmethod
+    def setUpTestData(cls):
+        category = SkillCategory.objects.create(name='Outreach')
+        cls.skills = {
+            name: Skill.objects.create(name=name, category=category)
+            for name in ('Arabic', 'French', 'English', 'Driving')
+        }
+        address = Address.objects.create(
+            address_line_1='2 Rue Abane Ramdane',
+            city='Bejaia',
+            wilaya='Bejaia'
+        )
+        for name, skill_names in (
+            ('amel', ('Arabic', 'French')),
+            ('karim', ('Arabic', 'English')),
+            ('nadia', ('Arabic', 'French', 'Driving')),
+            ('yacine', ('English', 'Driving')),
+        ):
+            volunteer = create_volunteer(name, address)
+            for skill_name in skill_names:
+                VolunteerSkill.objects.create(
+                    volunteer=volunteer,
+                    skill=cls.skills[skill_name],
+                    proficiency_level=ProficiencyLevel.INTERMEDIATE
+                )
+
+    def related(self, name):
+        return [
+            (pair.related_skill.name, pair.volunteer_count, round(pair.score, 3))
+            for pair in SkillCooccurrence.objects.filter(
+                skill=self.skills[name]
+            ).select_related('related_skill').order_by('rank')
+        ]
+
+    def by_id(self, *names):
+        return sorted(names, key=lambda name: str(self.skills[name].id))
+
+    def test_rebuild_scores_pairs_by_cosine(self):
+        self.assertEqual(SkillCooccurrenceService.rebuild(), 10)
+        self.assertEqual(self.related('French'), [('Arabic', 2, 0.816), ('Driving', 1, 0.5)])
+
+        # Driving and English tie on score and count: the lower ID ranks first
+        first, second = self.by_id('Driving', 'English')
+        self.assertEqual(self.related('Arabic'), [
+            ('French', 2, 0.816),
+            (first, 1, 0.408),
+            (second, 1, 0.408),
+        ])
+
+    def test_ties_at_the_top_k_cut_keep_the_lower_id(self):
+        SkillCooccurrenceService.rebuild(top_k=1)
+        # Driving relates to French and English at 0.5 each, Arabic at 0.408
+        self.assertEqual(self.related('Driving'), [(self.by_id('French', 'English')[0], 1, 0.5)])
+
+    def test_suggestions_exclude_held_skills(self):
+        SkillCooccurrenceService.rebuild()
+        suggested = SkillCooccurrenceService.suggest_related_skills(
+            [self.skills['Arabic'].id, self.skills['French'].id]
+        )
+        self.assertEqual(
+            {skill.name for skill in suggested},
+            {'Driving', 'English'}
+        )
+        self.assertEqual(SkillCooccurrenceService.suggest_related_skills([]), [])
+
+
+class SkillUsageCounterTests(TestCase):
+    """Usage counters follow skill writes and reconcile() repairs drift"""
+
+    @classmethod
+    def setUpTestData(cls):
+        category = SkillCategory.objects.create(name='Logistics')
+        cls.driving, cls.loading = [
+            Skill.objects.create(name=name, category=category)
+            for name in ('Driving', 'Loading')
+        ]
+        cls.address = Address.objects.create(
+            address_line_1='8 Rue Emir Abdelkader',
+            city='Setif',
+            wilaya='Setif'
+        )
+        cls.volunteer = create_volunteer('amel', cls.address)
+
+    def counters(self, skill):
+        usage = SkillUsageCounter.objects.filter(skill=skill).values(
+            'volunteer_count', 'volunteers_pending', 'volunteers_verified',
+            'mission_count', 'missions_required', 'missions_critical'
+        ).first()
+        return usage and {field: count for field, count in usage.items() if count}
+
+    def test_volunteer_skill_writes_move_counters(self):
+        volunteer_skill = VolunteerSkill.objects.create(volunteer=self.volunteer, skill=self.driving)
+        self.assertEqual(self.counters(self.driving), {'volunteer_count': 1, 'volunteers_pending': 1})
+
+        volunteer_skill.verification_status = SkillVerificationStatus.VERIFIED
+        volunteer_skill.save()
+        self.assertEqual(self.counters(self.driving), {'volunteer_count': 1, 'volunteers_verified': 1})
+
+        volunteer_skill.skill = self.loading
+        volunteer_skill.save()
+        self.assertEqual(self.counters(self.driving), {})
+        self.assertEqual(self.counters(self.loading), {'volunteer_count': 1, 'volunteers_verified': 1})
+
+        volunteer_skill.delete()
+        self.assertEqual(self.counters(self.loading), {})
+
+    def test_mission_skill_writes_move_counters(self):
+        mission = create_mission('Food bank', self.address)
+        mission_skill = MissionSkill.objects.create(
+            mission=mission,
+            skill=self.driving,
+            requirement_level=RequirementLevel.REQUIRED
+        )
+        self.assertEqual(self.counters(self.driving), {'mission_count': 1, 'missions_required': 1})
+
+        mission_skill.requirement_level = RequirementLevel.CRITICAL
+        mission_skill.save()
+        self.assertEqual(self.counters(self.driving), {'mission_count': 1, 'missions_critical': 1})
+
+        mission.delete()
+        self.assertEqual(self.counters(self.driving), {})
+
+    def test_decrements_never_go_below_zero_or_create_rows(self):
+        SkillUsageService.move_volunteer_skill((self.loading.id, SkillVerificationStatus.PENDING), None)
+        self.assertIsNone(self.counters(self.loading))
+
+        VolunteerSkill.objects.create(volunteer=self.volunteer, skill=self.driving)
+        SkillUsageCounter.objects.filter(skill=self.driving).update(volunteer_count=0, volunteers_pending=0)
+        VolunteerSkill.objects.filter(skill=self.driving).get().delete()
+        self.assertEqual(self.counters(self.driving), {})
+
+    def test_bulk_moves_apply_summed_deltas(self):
+        other = create_volunteer('karim', self.address)
+        VolunteerSkill.objects.bulk_create([
+            VolunteerSkill(volunteer=volunteer, skill=self.driving)
+            for volunteer in (self.volunteer, other)
+        ])
+        SkillUsageService.add_volunteer_skills(
+            [(self.driving.id, SkillVerificationStatus.PENDING)] * 2
+        )
+        self.assertEqual(self.counters(self.driving), {'volunteer_count': 2, 'volunteers_pending': 2})
+        self.assertEqual(SkillUsageService.reconcile(), 0)
+
+    def test_reconcile_rewrites_only_drifted_rows(self):
+        VolunteerSkill.objects.create(volunteer=self.volunteer, skill=self.driving)
+        VolunteerSkill.objects.create(volunteer=self.volunteer, skill=self.loading)
+        SkillUsageCounter.objects.filter(skill=self.driving).update(volunteer_count=7)
+
+        self.assertEqual(SkillUsageService.reconcile(), 1)
+        self.assertEqual(self.counters(self.driving), {'volunteer_count': 1, 'volunteers_pending': 1})
+        self.assertEqual(SkillUsageService.reconcile(), 0)
+
+    def test_delete_refuses_used_skill_despite_drifted_counter(self):
+        VolunteerSkill.objects.create(volunteer=self.volunteer, skill=self.driving)
+        SkillUsageCounter.objects.filter(skill=self.driving).update(volunteer_count=0)
+
+        with self.assertRaisesMessage(ValidationError, 'used by 1 volunteers and 0 missions'):
+            SkillService.delete_skill(self.driving.id)
+        self.assertTrue(VolunteerSkill.objects.filter(skill=self.driving).exists())
+
+    def test_delete_allows_unused_skill_despite_drifted_counter(self):
+        SkillUsageCounter.objects.update_or_create(skill=self.loading, defaults={'volunteer_count': 3})
+
+        result = SkillService.delete_skill(self.loading.id)
+        self.assertEqual((result['affected_volunteers'], result['affected_missions']), (0, 0))
+        self.assertFalse(Skill.objects.filter(pk=self.loading.pk).exists())
+
+    def test_detail_serializer_counts_skills_without_usage_as_zero(self):
+        SkillUsageCounter.objects.filter(skill=self.loading).delete()
+        VolunteerSkill.objects.create(volunteer=self.volunteer, skill=self.driving)
+
+        loading = SkillDetailSerializer(Skill.objects.get(pk=self.loading.pk)).data
+        self.assertEqual((loading['volunteer_count'], loading['mission_count']), (0, 0))
+        driving = SkillDetailSerializer(Skill.objects.get(pk=self.driving.pk)).data
+        self.assertEqual((driving['volunteer_count'], driving['mission_count']), (1, 0))
+
+
+@override_settings(SKILLS_VOLUNTEER_INDEX_ENABLED=False)
+class VolunteerSkillBulkImportTests(TestCase):
+    """Bulk import: validation in one pass and signal work for every touched row"""
+
+    @classmethod
+    def setUpTestData(cls):
+        category = SkillCategory.objects.create(name='Logistics')
+        cls.driving, cls.loading = [
+            Skill.objects.create(name=name, category=category)
+            for name in ('Driving', 'Loading')
+        ]
+        address = Address.objects.create(
+            address_line_1='8 Rue Emir Abdelkader',
+            city='Setif',
+            wilaya='Setif'
+        )
+        cls.volunteer = create_volunteer('amel', address)
+        cls.primary = VolunteerSkill.objects.create(
+            volunteer=cls.volunteer,
+            skill=cls.driving,
+            is_primary=True
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_invalid_items_are_reported_and_skipped(self):
+        result = VolunteerSkillService.bulk_import_skills(str(self.volunteer.id), [
+            {'skill_id': str(self.driving.id)},
+            {'skill_id': 'not-a-uuid'},
+            {'skill_id': str(self.loading.id), 'proficiency_level': 'guru'},
+            {'skill_id': str(self.loading.id)},
+        ])
+        self.assertEqual((result['successfully_created'], result['failed']), (1, 3))
+        self.assertEqual(SkillUsageService.reconcile(), 0)
+
+    def test_demoted_primary_invalidates_its_searches(self):
+        VolunteerSearchService.search_volunteers_by_skills([str(self.driving.id)])
+        version_key = VolunteerSearchService._skill_version_key(str(self.driving.id))
+        version = cache.get(version_key)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            VolunteerSkillService.bulk_import_skills(str(self.volunteer.id), [
+                {'skill_id': str(self.loading.id), 'is_primary': True},
+            ])
+
+        self.primary.refresh_from_db()
+        self.assertFalse(self.primary.is_primary)
+        self.assertGreater(cache.get(version_key), version)
+        self.assertEqual(
+            VolunteerSkillService.get_volunteer_skill_statistics(str(self.volunteer.id))['primary_skill'],
+            'Loading'
+        )
+
+
+class VolunteerSkillStatisticsTests(TestCase):
+    """Per-volunteer statistics: two queries, cached until relevant writes"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = SkillCategory.objects.create(name='Logistics')
+        cls.driving, cls.loading = [
+            Skill.objects.create(name=name, category=cls.category)
+            for name in ('Driving', 'Loading')
+        ]
+        address = Address.objects.create(
+            address_line_1='8 Rue Emir Abdelkader',
+            city='Setif',
+            wilaya='Setif'
+        )
+        cls.volunteer = create_volunteer('amel', address)
+        cls.other = create_volunteer('karim', address)
+        VolunteerSkill.objects.create(
+            volunteer=cls.volunteer,
+            skill=cls.driving,
+            proficiency_level=ProficiencyLevel.EXPERT,
+            verification_status=SkillVerificationStatus.VERIFIED,
+            is_primary=True
+        )
+        VolunteerSkill.objects.create(volunteer=cls.volunteer, skill=cls.loading)
+
+    def setUp(self):
+        cache.clear()
+
+    def statistics(self):
+        return VolunteerSkillService.get_volunteer_skill_statistics(str(self.volunteer.id))
+
+    def test_statistics_are_computed_in_two_queries_and_cached(self):
+        with self.assertNumQueries(2):
+            statistics = self.statistics()
+        self.assertEqual(
+            (statistics['total_skills'], statistics['verified_skills'], statistics['pending_verification']),
+            (2, 1, 1)
+        )
+        self.assertEqual(statistics['primary_skill'], 'Driving')
+        self.assertEqual(statistics['category_distribution'], {'Logistics': 2})
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.statistics(), statistics)
+
+    def test_own_skill_writes_outdate_the_cache(self):
+        self.statistics()
+        with self.captureOnCommitCallbacks(execute=True):
+            VolunteerSkill.objects.filter(
+                volunteer=self.volunteer, skill=self.loading
+            ).get().delete()
+        self.assertEqual(self.statistics()['total_skills'], 1)
+
+    def test_other_volunteers_writes_keep_the_cache(self):
+        self.statistics()
+        with self.captureOnCommitCallbacks(execute=True):
+            VolunteerSkill.objects.create(volunteer=self.other, skill=self.loading)
+        with self.assertNumQueries(0):
+            self.statistics()
+
+    def test_category_renames_outdate_the_cache(self):
+        self.statistics()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category.name = 'Transport'
+            self.category.save()
+        self.assertEqual(self.statistics()['category_distribution'], {'Transport': 2})
+
+
+class VerificationReviewQueueTests(TestCase):
+    """Claimable review queue: disjoint claims, leases and releases"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.requests = create_verification_requests(5)
+        cls.alice = create_reviewer('alice')
+        cls.bruno = create_reviewer('bruno')
+
+    def ids(self, verification_requests):
+        return [verification_request.id for verification_request in verification_requests]
+
+    def stats(self):
+        stats = VerificationService.get_verification_request_stats()
+        return stats['pending_review'], stats['under_review']
+
+    def test_concurrent_reviewers_get_disjoint_batches(self):
+        alice_claims = VerificationService.claim_verification_requests(self.alice.id, limit=2)
+        bruno_claims = VerificationService.claim_verification_requests(self.bruno.id, limit=2)
+
+        self.assertEqual(self.ids(alice_claims), self.ids(self.requests[:2]))
+        self.assertEqual(self.ids(bruno_claims), self.ids(self.requests[2:4]))
+        self.assertEqual(
+            set(VerificationRequest.objects.filter(
+                claimed_by=self.alice
+            ).values_list('review_status', flat=True)),
+            {'under_review'}
+        )
+        self.assertEqual(self.stats(), (1, 4))
+
+    def test_claiming_again_renews_own_claims(self):
+        first = VerificationService.claim_verification_requests(self.alice.id, limit=2, lease_seconds=60)
+        again = VerificationService.claim_verification_requests(self.alice.id, limit=2, lease_seconds=600)
+
+        self.assertEqual(self.ids(again), self.ids(first))
+        self.assertGreater(again[0].claim_expires_at, first[0].claim_expires_at)
+        self.assertEqual(self.stats(), (3, 2))
+
+    def test_expired_claims_return_to_the_queue(self):
+        VerificationService.claim_verification_requests(self.alice.id, limit=2)
+        VerificationRequest.objects.filter(claimed_by=self.alice).update(
+            claim_expires_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        bruno_claims = VerificationService.claim_verification_requests(self.bruno.id, limit=2)
+        self.assertEqual(self.ids(bruno_claims), self.ids(self.requests[:2]))
+        self.assertEqual(self.stats(), (3, 2))
+
+    def test_claimed_requests_cannot_be_reviewed_by_others(self):
+        claimed = VerificationService.claim_verification_requests(self.alice.id, limit=1)[0]
+
+        with self.assertRaises(ValidationError):
+            VerificationService.review_verification_request(claimed.id, self.bruno.id, 'approved')
+
+        reviewed = VerificationService.review_verification_request(claimed.id, self.alice.id, 'approved')
+        self.assertIsNone(reviewed.claimed_by_id)
+        self.assertEqual(
+            VolunteerSkill.objects.get(id=claimed.volunteer_skill_id).verification_status,
+            SkillVerificationStatus.VERIFIED
+        )
+
+    def test_release_hands_claims_back(self):
+        claimed = VerificationService.claim_verification_requests(self.alice.id, limit=3)
+
+        self.assertEqual(VerificationService.release_verification_requests(self.bruno.id), 0)
+        self.assertEqual(
+            VerificationService.release_verification_requests(self.alice.id, [claimed[0].id]),
+            1
+        )
+        self.assertEqual(VerificationService.release_verification_requests(self.alice.id), 2)
+        self.assertFalse(VerificationRequest.objects.filter(claimed_by__isnull=False).exists())
+        self.assertEqual(self.stats(), (5, 0))
+
+    def test_claim_size_is_bounded(self):
+        for limit in (0, VerificationService.MAX_CLAIM_SIZE + 1):
+            with self.subTest(limit=limit), self.assertRaises(ValidationError):
+                VerificationService.claim_verification_requests(self.alice.id, limit=limit)
+
+
+class BulkVerificationReviewTests(TestCase):
+    """Set-based bulk review: per-request outcomes and counter deltas"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.requests = create_verification_requests(4)
+        cls.alice = create_reviewer('alice')
+        cls.bruno = create_reviewer('bruno')
+
+    def review(self, verification_requests, review_status, reviewer=None):
+        return VerificationService.bulk_review_verification_requests(
+            [verification_request.id for verification_request in verification_requests],
+            (reviewer or self.alice).id,
+            review_status,
+            review_notes='Checked'
+        )
+
+    def test_approval_verifies_skills_and_moves_counters(self):
+        with self.assertNumQueries(9):
+            result = self.review(self.requests[:3], 'approved')
+        self.assertEqual(result['successfully_reviewed'], 3)
+
+        self.assertEqual(
+            list(VolunteerSkill.objects.filter(
+                verification_requests__in=self.requests[:3]
+            ).values_list('verification_status', 'verification_requested').distinct()),
+            [(SkillVerificationStatus.VERIFIED, False)]
+        )
+        stats = VerificationService.get_verification_request_stats()
+        self.assertEqual((stats['pending_review'], stats['approved']), (1, 3))
+
+        skill = self.requests[0].volunteer_skill.skill
+        self.assertEqual(
+            SkillUsageCounter.objects.filter(skill=skill).values_list(
+                'volunteers_pending', 'volunteers_verified'
+            ).get(),
+            (1, 3)
+        )
+        self.assertEqual(VerificationService.reconcile_status_counters(), 0)
+        self.assertEqual(SkillUsageService.reconcile(), 0)
+
+    def test_failures_are_reported_per_request(self):
+        VerificationService.claim_verification_requests(self.bruno.id, limit=1)
+        missing_id = '00000000-0000-0000-0000-000000000000'
+
+        result = VerificationService.bulk_review_verification_requests(
+            [self.requests[0].id, self.requests[1].id, self.requests[1].id, missing_id],
+            self.alice.id,
+            'rejected'
+        )
+        self.assertEqual(result['total_attempted'], 3)
+        self.assertEqual(result['reviewed_requests'], [str(self.requests[1].id)])
+        self.assertEqual(
+            [failure['verification_request_id'] for failure in result['failed_requests']],
+            [str(self.requests[0].id), missing_id]
+        )
+
+        stats = VerificationService.get_verification_request_stats()
+        self.assertEqual(
+            (stats['pending_review'], stats['under_review'], stats['rejected']),
+            (2, 1, 1)
+        )
+        self.assertEqual(VerificationService.reconcile_status_counters(), 0)
+
+    def test_matches_single_reviews(self):
+        self.review(self.requests[:2], 'needs_more_info')
+        VerificationService.review_verification_request(
+            self.requests[2].id, self.alice.id, 'needs_more_info', review_notes='Checked'
+        )
+
+        self.assertEqual(
+            set(VolunteerSkill.objects.filter(
+                verification_requests__in=self.requests[:3]
+            ).values_list('verification_notes', 'verification_requested')),
+            {('Needs more information: Checked', False)}
+        )
+        self.assertEqual(
+            VerificationService.get_verification_request_stats()['needs_more_info'], 3
+        )
+
+
+class DocumentBlobReferenceTests(TemporaryMediaTestCase):
+    """Content-addressed documents: dedup, reference counts and deletion"""
+
+    CONTENT = b'%PDF-1.4 first aid certificate'
+
+    @classmethod
+    def setUpTestData(cls):
+        category = SkillCategory.objects.create(name='Health')
+        cls.skill = Skill.objects.create(name='First Aid', category=category)
+        cls.address = Address.objects.create(
+            address_line_1='12 Boulevard Zighoud Youcef',
+            city='Constantine',
+            wilaya='Constantine'
+        )
+
+    def add_skill(self, volunteer_name, filename, content=CONTENT):
+        return VolunteerSkill.objects.create(
+            volunteer=create_volunteer(volunteer_name, self.address),
+            skill=self.skill,
+            supporting_document=SimpleUploadedFile(filename, content)
+        )
+
+    def reference_counts(self):
+        return dict(DocumentBlob.objects.values_list('name', 'reference_count'))
+
+    def test_identical_uploads_share_one_blob(self):
+        first = self.add_skill('amel', 'certificate.pdf')
+        second = self.add_skill('karim', 'scan.PDF')
+
+        name = first.supporting_document.name
+        self.assertEqual(second.supporting_document.name, name)
+        self.assertEqual(document_storage.digest_of(name), hashlib.sha256(self.CONTENT).hexdigest())
+        self.assertEqual(self.reference_counts(), {name: 2})
+        self.assertEqual(DocumentBlob.objects.get().size, len(self.CONTENT))
+
+    def test_blob_is_deleted_with_its_last_reference(self):
+        first = self.add_skill('amel', 'certificate.pdf')
+        second = self.add_skill('karim', 'certificate.pdf')
+        name = first.supporting_document.name
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertEqual(self.reference_counts(), {name: 1})
+        self.assertTrue(document_storage.exists(name))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+        self.assertEqual(self.reference_counts(), {})
+        self.assertFalse(document_storage.exists(name))
+
+    def test_replacing_a_document_moves_its_reference(self):
+        volunteer_skill = self.add_skill('amel', 'certificate.pdf')
+        old_name = volunteer_skill.supporting_document.name
+
+        with self.captureOnCommitCallbacks(execute=True):
+            volunteer_skill.supporting_document = SimpleUploadedFile('renewed.pdf', b'%PDF-1.4 renewed')
+            volunteer_skill.save()
+
+        self.assertEqual(self.reference_counts(), {volunteer_skill.supporting_document.name: 1})
+        self.assertFalse(document_storage.exists(old_name))
+
+    def test_reference_added_before_deletion_keeps_the_blob(self):
+        name = self.add_skill('amel', 'certificate.pdf').supporting_document.name
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            DocumentBlobService.move_references([name], [])
+        DocumentBlobService.move_references([], [name])
+        for callback in callbacks:
+            callback()
+
+        self.assertEqual(self.reference_counts(), {name: 1})
+        self.assertTrue(document_storage.exists(name))
+
+    def test_reconcile_repairs_counts_and_drops_orphans(self):
+        name = self.add_skill('amel', 'certificate.pdf').supporting_document.name
+        orphan = document_storage.save('orphan.pdf', SimpleUploadedFile('orphan.pdf', b'orphan'))
+        DocumentBlobService.move_references([], [orphan])
+        DocumentBlob.objects.filter(name=name).update(reference_count=5)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(DocumentBlobService.reconcile(), 2)
+
+        self.assertEqual(self.reference_counts(), {name: 1})
+        self.assertFalse(document_storage.exists(orphan))
+        self.assertEqual(DocumentBlobService.reconcile(), 0)
+
+
+class DocumentProcessingTests(TemporaryMediaTestCase):
+    """Background document processing: claims, derivatives and retries"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.address = Address.objects.create(
+            address_line_1='12 Boulevard Zighoud Youcef',
+            city='Constantine',
+            wilaya='Constantine'
+        )
+
+    def store(self, filename, content):
+        name = document_storage.save(filename, SimpleUploadedFile(filename, content))
+        DocumentBlobService.move_references([], [name])
+        return DocumentBlob.objects.get(name=name)
+
+    def image(self, size=(2000, 1000)):
+        buffer = io.BytesIO()
+        Image.new('RGB', size, 'red').save(buffer, format='PNG')
+        return buffer.getvalue()
+
+    def test_images_get_metadata_and_derivatives(self):
+        blob = self.store('id-card.png', self.image())
+
+        self.assertEqual(DocumentProcessingService.process_pending(), 1)
+        blob.refresh_from_db()
+        self.assertEqual(blob.processing_status, DocumentBlob.ProcessingStatus.DONE)
+        self.assertEqual(blob.content_type, 'image/png')
+        self.assertEqual((blob.metadata['width'], blob.metadata['height']), (2000, 1000))
+        with default_storage.open(blob.thumbnail) as thumbnail:
+            self.assertEqual(Image.open(thumbnail).size, (256, 128))
+        with default_storage.open(blob.preview) as preview:
+            self.assertEqual(Image.open(preview).size, (1024, 512))
+
+        self.assertEqual(DocumentProcessingService.process_pending(), 0)
+
+    def test_pdfs_record_their_version_only(self):
+        blob = self.store('diploma.pdf', b'%PDF-1.7 diploma')
+        DocumentProcessingService.process_pending()
+
+        blob.refresh_from_db()
+        self.assertEqual(blob.content_type, 'application/pdf')
+        self.assertEqual(blob.metadata['pdf_version'], '1.7')
+        self.assertEqual((blob.thumbnail, blob.preview), ('', ''))
+
+    def test_checksum_mismatches_are_retried_then_failed(self):
+        blob = self.store('diploma.pdf', b'%PDF-1.7 diploma')
+        with open(document_storage.path(blob.name), 'wb') as document:
+            document.write(b'%PDF-1.7 tampered')
+
+        for attempt in range(1, DocumentProcessingService.MAX_ATTEMPTS + 1):
+            with self.assertLogs('apps.skills.services.document_processing_service', 'WARNING'):
+                self.assertEqual(DocumentProcessingService.process_pending(), 1)
+            blob.refresh_from_db()
+            self.assertEqual(blob.processing_attempts, attempt)
+            self.assertIn('Checksum mismatch', blob.processing_error)
+
+        self.assertEqual(blob.processing_status, DocumentBlob.ProcessingStatus.FAILED)
+        self.assertEqual(DocumentProcessingService.process_pending(), 0)
+
+    def test_lapsed_leases_are_claimed_again(self):
+        first, second = self.store('a.pdf', b'%PDF-1.7 a'), self.store('b.pdf', b'%PDF-1.7 b')
+
+        self.assertEqual(
+            [blob.id for blob in DocumentProcessingService.claim_blobs(limit=1)],
+            [first.id]
+        )
+        self.assertEqual(
+            [blob.id for blob in DocumentProcessingService.claim_blobs()],
+            [second.id]
+        )
+        DocumentBlob.objects.filter(id=first.id).update(
+            processing_expires_at=timezone.now() - timedelta(seconds=1)
+        )
+        self.assertEqual(
+            [blob.id for blob in DocumentProcessingService.claim_blobs()],
+            [first.id]
+        )
+
+    def test_blobs_deleted_while_processing_drop_their_derivatives(self):
+        blob = self.store('id-card.png', self.image((64, 64)))
+        claimed = DocumentProcessingService.claim_blobs()[0]
+        analyze = DocumentProcessingService._analyze
+        derivatives = {}
+
+        def analyze_then_release(blob):
+            result = analyze(blob)
+            derivatives.update(result[2])
+            with self.captureOnCommitCallbacks(execute=True):
+                DocumentBlobService.move_references([blob.name], [])
+            return result
+
+        with patch.object(DocumentProcessingService, '_analyze', side_effect=analyze_then_release):
+            self.assertFalse(DocumentProcessingService.process_blob(claimed))
+
+        self.assertFalse(DocumentBlob.objects.filter(id=blob.id).exists())
+        self.assertEqual(set(derivatives), {'thumbnail', 'preview'})
+        for name in derivatives.values():
+            self.assertFalse(default_storage.exists(name))
+
+
+class VerificationStatusCounterTests(TestCase):
+    """Review status counters: kept in step by signals, repaired by reconcile"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.requests = create_verification_requests(3)
+        cls.alice = create_reviewer('alice')
+
+    def counts(self):
+        return dict(VerificationStatusCounter.objects.filter(count__gt=0).values_list('review_status', 'count'))
+
+    def test_stats_are_read_from_the_counters(self):
+        with self.assertNumQueries(1):
+            stats = VerificationService.get_verification_request_stats()
+        self.assertEqual(stats, {
+            'total_requests': 3,
+            'pending_review': 3,
+            'under_review': 0,
+            'approved': 0,
+            'rejected': 0,
+            'needs_more_info': 0,
+        })
+
+    def test_saves_and_deletes_move_the_counters(self):
+        first, second, _ = self.requests
+        VerificationService.review_verification_request(first.id, self.alice.id, 'rejected')
+        self.assertEqual(self.counts(), {'pending': 2, 'rejected': 1})
+
+        second.request_notes = 'Updated'
+        second.save()
+        self.assertEqual(self.counts(), {'pending': 2, 'rejected': 1})
+
+        second.volunteer_skill.delete()
+        self.assertEqual(self.counts(), {'pending': 1, 'rejected': 1})
+
+    def test_decrements_of_empty_statuses_are_dropped(self):
+        VerificationService.move_status_counts([('approved', None), ('pending', 'rejected')])
+        self.assertEqual(self.counts(), {'pending': 2, 'rejected': 1})
+
+    def test_reconcile_rewrites_drifted_statuses(self):
+        VerificationStatusCounter.objects.filter(review_status='pending').update(count=10)
+        VerificationRequest.objects.filter(id=self.requests[0].id).update(review_status='approved')
+
+        self.assertEqual(VerificationService.reconcile_status_counters(), 2)
+        self.assertEqual(self.counts(), {'pending': 2, 'approved': 1})
+        self.assertEqual(VerificationService.reconcile_status_counters(), 0)
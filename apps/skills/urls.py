@@ -93,6 +93,10 @@ urlpatterns += [
     path('skills/by_category/', 
          SkillViewSet.as_view({'get': 'by_category'}), 
          name='skill-by-category'),
+    
+    path('skills/autocomplete/', 
+         SkillViewSet.as_view({'get': 'autocomplete'}), 
+         name='skill-autocomplete'),
 ]
 
 # ============ Volunteer Skill URLs ============
@@ -125,6 +129,18 @@ urlpatterns += [
          VolunteerSkillViewSet.as_view({'get': 'pending_verification_requests'}), 
          name='pending-verification-requests'),
     
+    path('volunteer-skills/verification-request-statistics/', 
+         VolunteerSkillViewSet.as_view({'get': 'verification_request_statistics'}), 
+         name='verification-request-statistics'),
+    
+    path('volunteer-skills/claim-verification-requests/', 
+         VolunteerSkillViewSet.as_view({'post': 'claim_verification_requests'}), 
+         name='claim-verification-requests'),
+    
+    path('volunteer-skills/release-verification-requests/', 
+         VolunteerSkillViewSet.as_view({'post': 'release_verification_requests'}), 
+         name='release-verification-requests'),
+    
     path('volunteer-skills/review-verification/', 
          VolunteerSkillViewSet.as_view({'post': 'review_verification'}), 
          name='review-verification-general'),
@@ -133,6 +149,10 @@ urlpatterns += [
          VolunteerSkillViewSet.as_view({'post': 'review_verification'}), 
          name='review-verification-specific'),
     
+    path('volunteer-skills/bulk-review-verification/', 
+         VolunteerSkillViewSet.as_view({'post': 'bulk_review_verification'}), 
+         name='bulk-review-verification'),
+    
     # Statistics and Suggestions
     path('volunteer-skills/statistics/', 
          VolunteerSkillViewSet.as_view({'get': 'statistics'}), 
@@ -141,6 +161,9 @@ urlpatterns += [
     path('volunteer-skills/suggestions/', 
          VolunteerSkillViewSet.as_view({'get': 'suggestions'}), 
          name='suggestions'),
+    path('volunteer-skills/mission-recommendations/', 
+         VolunteerSkillViewSet.as_view({'get': 'mission_recommendations'}), 
+         name='mission-recommendations'),
     
     # Bulk Operations
     path('volunteer-skills/bulk-import/', 
@@ -213,6 +236,14 @@ urlpatterns += [
          VolunteerSearchViewSet.as_view({'get': 'by_mission'}), 
          name='volunteer-search-by-mission'),
     
+    path('volunteer-search/by_mission_nearby/', 
+         VolunteerSearchViewSet.as_view({'get': 'by_mission_nearby'}), 
+         name='volunteer-search-by-mission-nearby'),
+    
+    path('volunteer-search/by_missions/', 
+         VolunteerSearchViewSet.as_view({'get': 'by_missions'}), 
+         name='volunteer-search-by-missions'),
+    
     path('volunteer-search/by_skill_category/', 
          VolunteerSearchViewSet.as_view({'get': 'by_skill_category'}), 
          name='volunteer-search-by-category'),
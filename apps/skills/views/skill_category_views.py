@@ -2,6 +2,8 @@
 Skill Category ViewSet
 Handles API endpoints for skill category management
 """
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags, quote_etag
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -14,7 +16,6 @@ from ..serializers import (
     SkillCategoryDetailSerializer,
     SkillCategoryCreateSerializer,
     SkillCategoryUpdateSerializer,
-    SkillCategoryTreeSerializer,
     SkillCategoryStatisticsSerializer,
 )
 from apps.core.permissions import get_skill_category_permissions
@@ -91,11 +92,27 @@ class SkillCategoryViewSet(viewsets.ModelViewSet):
     def tree(self, request):
         """
         Get hierarchical category tree
+        
+        Served from a cached snapshot. Responses carry an ETag of the tree
+        version; send it back in If-None-Match to get 304 Not Modified.
         """
         try:
-            tree_data = SkillCategoryService.get_category_tree()
-            serializer = SkillCategoryTreeSerializer(tree_data, many=True)
-            return Response(serializer.data)
+            version = SkillCategoryService.get_category_tree_version()
+            etag = quote_etag(f'category-tree-{version}')
+            
+            if_none_match = request.headers.get('If-None-Match')
+            if if_none_match:
+                etags = parse_etags(if_none_match)
+                if '*' in etags or etag in etags:
+                    response = HttpResponseNotModified()
+                    response['ETag'] = etag
+                    return response
+            
+            snapshot = SkillCategoryService.get_category_tree_snapshot()
+            response = HttpResponse(snapshot['body'], content_type='application/json')
+            response['ETag'] = quote_etag(f"category-tree-{snapshot['version']}")
+            response['Cache-Control'] = 'no-cache'
+            return response
         except Exception as e:
             return Response(
                 {'error': str(e)},
@@ -105,10 +122,15 @@ class SkillCategoryViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['get'])
     def statistics(self, request, id=None):
         """
-        Get statistics for a specific category
+        Get statistics for a specific category, with totals rolled up
+        over all descendant subcategories
+        
+        Query params:
+        - precomputed: Read the nightly rollup instead of counting live (default: false)
         """
         try:
-            stats = SkillCategoryService.get_category_statistics(id)
+            precomputed = request.query_params.get('precomputed', 'false').lower() == 'true'
+            stats = SkillCategoryService.get_category_statistics(id, precomputed=precomputed)
             serializer = SkillCategoryStatisticsSerializer(stats)
             return Response(serializer.data)
         except Exception as e:
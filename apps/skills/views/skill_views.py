@@ -15,6 +15,7 @@ from ..serializers import (
     SkillCreateSerializer,
     SkillUpdateSerializer,
     SkillStatisticsSerializer,
+    SkillAutocompleteSerializer,
 )
 from apps.core.permissions import get_skill_permissions
 
@@ -67,7 +68,7 @@ class SkillViewSet(viewsets.ModelViewSet):
             else:
                 queryset = queryset.filter(verification_requirement='none')
         
-        return queryset.select_related('category')
+        return queryset.select_related('category', 'usage')
     
     def list(self, request, *args, **kwargs):
         """
@@ -176,6 +177,33 @@ class SkillViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
+    @action(detail=False, methods=['get'])
+    def autocomplete(self, request):
+        """
+        Suggest skills whose name or alias starts with the typed text
+        
+        Query Parameters:
+        - q: Text typed so far (required)
+        - limit: Number of suggestions (default: 10, max: 50)
+        """
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response(
+                {'error': 'Search query is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            limit = min(int(request.query_params.get('limit', 10)), 50)
+            suggestions = SkillService.autocomplete_skills(query, limit)
+            serializer = SkillAutocompleteSerializer(suggestions, many=True)
+            return Response(serializer.data)
+        except Exception as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+    
     @action(detail=False, methods=['get'])
     def by_category(self, request):
         """
@@ -211,7 +239,8 @@ class SkillViewSet(viewsets.ModelViewSet):
                 category_id=str(serializer.validated_data['category'].id),
                 description=serializer.validated_data.get('description'),
                 verification_requirement=serializer.validated_data.get('verification_requirement'),
-                is_active=serializer.validated_data.get('is_active', True)
+                is_active=serializer.validated_data.get('is_active', True),
+                aliases=serializer.validated_data.get('aliases')
             )
             
             response_serializer = SkillDetailSerializer(skill)
@@ -238,7 +267,8 @@ class SkillViewSet(viewsets.ModelViewSet):
                 if serializer.validated_data.get('category') else None,
                 description=serializer.validated_data.get('description'),
                 verification_requirement=serializer.validated_data.get('verification_requirement'),
-                is_active=serializer.validated_data.get('is_active')
+                is_active=serializer.validated_data.get('is_active'),
+                aliases=serializer.validated_data.get('aliases')
             )
             
             response_serializer = SkillDetailSerializer(skill)
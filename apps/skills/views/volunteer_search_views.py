@@ -12,6 +12,8 @@ from ..services import VolunteerSearchService
 from ..serializers import (
     VolunteerSearchResultSerializer,
     VolunteerSkillMatchSerializer,
+    VolunteerProximityMatchSerializer,
+    MissionVolunteerMatchesSerializer,
 )
 from apps.core.permissions import (
     CanSearchVolunteers,
@@ -31,8 +33,11 @@ class VolunteerSearchViewSet(viewsets.ViewSet):
     Endpoints:
     - GET /volunteer-search/by_skills/ - Search volunteers by skill IDs
     - GET /volunteer-search/by_mission/ - Find matching volunteers for mission
+    - GET /volunteer-search/by_mission_nearby/ - Find matching volunteers within travel range of a mission
+    - GET /volunteer-search/by_missions/ - Find matching volunteers for many missions at once
     - GET /volunteer-search/by_skill_category/ - Search volunteers by skill category
     """
+    MAX_BATCH_MISSIONS = 100
     
     def get_permissions(self):
         """
@@ -166,6 +171,125 @@ class VolunteerSearchViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
     
+    @action(detail=False, methods=['get'])
+    def by_mission_nearby(self, request):
+        """
+        Find matching volunteers who can travel to a mission [Organization/Admin only]
+        
+        Each volunteer is kept only if the mission lies within their own
+        travel radius. Addresses without coordinates use their wilaya centroid.
+        
+        Query Parameters:
+        - mission_id: Mission UUID (required)
+        - max_distance_km: Maximum distance from the mission (optional)
+        - require_all: true/false (default: true)
+        - verified_only: true/false (default: true)
+        - limit: Number of results (default: 50)
+        
+        Example:
+        GET /volunteer-search/by_mission_nearby/?mission_id=uuid&max_distance_km=30
+        """
+        mission_id = request.query_params.get('mission_id')
+        if not mission_id:
+            return Response(
+                {'error': 'mission_id parameter is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        require_all = request.query_params.get('require_all', 'true').lower() == 'true'
+        verified_only = request.query_params.get('verified_only', 'true').lower() == 'true'
+        
+        try:
+            limit = int(request.query_params.get('limit', 50))
+            max_distance_km = request.query_params.get('max_distance_km')
+            max_distance_km = float(max_distance_km) if max_distance_km else None
+            
+            results = VolunteerSearchService.find_volunteers_near_mission(
+                mission_id=mission_id,
+                require_all_skills=require_all,
+                verified_only=verified_only,
+                max_distance_km=max_distance_km,
+                limit=limit
+            )
+            
+            serializer = VolunteerProximityMatchSerializer(results, many=True)
+            return Response({
+                'count': len(results),
+                'mission_id': mission_id,
+                'search_criteria': {
+                    'require_all_skills': require_all,
+                    'verified_only': verified_only,
+                    'max_distance_km': max_distance_km,
+                },
+                'results': serializer.data
+            })
+        except Exception as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+    
+    @action(detail=False, methods=['get'])
+    def by_missions(self, request):
+        """
+        Find matching volunteers for several missions in one pass [Organization/Admin only]
+        
+        Query Parameters:
+        - mission_ids: Comma-separated list of mission UUIDs (required, max 100)
+        - require_all: true/false (default: true)
+        - verified_only: true/false (default: true)
+        - limit: Number of results per mission (default: 50)
+        
+        Example:
+        GET /volunteer-search/by_missions/?mission_ids=uuid1,uuid2&require_all=true
+        """
+        mission_ids_param = request.query_params.get('mission_ids', '')
+        mission_ids = [mid.strip() for mid in mission_ids_param.split(',') if mid.strip()]
+        if not mission_ids:
+            return Response(
+                {'error': 'mission_ids parameter is required (comma-separated UUIDs)'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if len(mission_ids) > self.MAX_BATCH_MISSIONS:
+            return Response(
+                {'error': f'At most {self.MAX_BATCH_MISSIONS} mission_ids can be searched at once'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        require_all = request.query_params.get('require_all', 'true').lower() == 'true'
+        verified_only = request.query_params.get('verified_only', 'true').lower() == 'true'
+        limit = int(request.query_params.get('limit', 50))
+        
+        try:
+            results = VolunteerSearchService.find_volunteers_for_missions(
+                mission_ids=mission_ids,
+                require_all_skills=require_all,
+                verified_only=verified_only,
+                limit=limit
+            )
+            
+            serializer = MissionVolunteerMatchesSerializer(
+                [
+                    {'mission_id': mission_id, 'count': len(volunteers), 'volunteers': volunteers}
+                    for mission_id, volunteers in results.items()
+                ],
+                many=True
+            )
+            return Response({
+                'count': len(results),
+                'search_criteria': {
+                    'require_all_skills': require_all,
+                    'verified_only': verified_only,
+                },
+                'results': serializer.data
+            })
+        except Exception as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+    
     @action(detail=False, methods=['get'])
     def by_skill_category(self, request):
         """
@@ -175,10 +299,12 @@ class VolunteerSearchViewSet(viewsets.ViewSet):
         - category_id: Skill category UUID (required)
         - verified_only: true/false (default: true)
         - min_proficiency: beginner/intermediate/advanced/expert (optional)
+        - include_subcategories: true/false (default: false)
+          - true: Also match skills of all descendant categories
         - limit: Number of results (default: 50)
         
         Example:
-        GET /volunteer-search/by_skill_category/?category_id=uuid&verified_only=true
+        GET /volunteer-search/by_skill_category/?category_id=uuid&verified_only=true&include_subcategories=true
         """
         category_id = request.query_params.get('category_id')
         if not category_id:
@@ -189,6 +315,7 @@ class VolunteerSearchViewSet(viewsets.ViewSet):
         
         verified_only = request.query_params.get('verified_only', 'true').lower() == 'true'
         min_proficiency = request.query_params.get('min_proficiency', None)
+        include_subcategories = request.query_params.get('include_subcategories', 'false').lower() == 'true'
         limit = int(request.query_params.get('limit', 50))
         
         try:
@@ -196,7 +323,8 @@ class VolunteerSearchViewSet(viewsets.ViewSet):
                 category_id=category_id,
                 verified_only=verified_only,
                 min_proficiency_level=min_proficiency,
-                limit=limit
+                limit=limit,
+                include_subcategories=include_subcategories
             )
             
             serializer = VolunteerSearchResultSerializer(results, many=True)
@@ -206,6 +334,7 @@ class VolunteerSearchViewSet(viewsets.ViewSet):
                 'search_criteria': {
                     'verified_only': verified_only,
                     'min_proficiency': min_proficiency,
+                    'include_subcategories': include_subcategories,
                 },
                 'results': serializer.data
             })
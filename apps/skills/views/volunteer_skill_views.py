@@ -4,7 +4,7 @@ from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 
 from ..models import VolunteerSkill, VerificationRequest
-from ..services import VolunteerSkillService, VerificationService
+from ..services import VolunteerSkillService, VerificationService, MissionRecommendationService
 from ..serializers import (
     VolunteerSkillListSerializer,
     VolunteerSkillDetailSerializer,
@@ -15,8 +15,13 @@ from ..serializers import (
     VolunteerSkillBulkImportSerializer,
     SkillRequirementCheckSerializer,
     VerificationRequestSerializer,
+    VerificationRequestStatisticsSerializer,
     VerificationRequestCreateSerializer,
     VerificationRequestReviewSerializer,
+    VerificationRequestBulkReviewSerializer,
+    VerificationRequestClaimSerializer,
+    VerificationRequestReleaseSerializer,
+    MissionRecommendationSerializer,
 )
 from apps.core.permissions import get_volunteer_skill_permissions
 
@@ -26,11 +31,13 @@ class VolunteerSkillViewSet(viewsets.ModelViewSet):
     ViewSet for managing volunteer skills
     
     Permissions:
-    - verify/review_verification/pending_verification_requests: Admin only
+    - verify/review_verification/bulk_review_verification/pending_verification_requests: Admin only
+    - claim_verification_requests/release_verification_requests: Admin only
+    - verification_request_statistics: Admin only
     - request_verification: Volunteer can request for own skills
     - verification_requests: Volunteer can view own verification requests
     - create/update/delete/bulk_import: Volunteer can manage own skills
-    - list/retrieve/statistics/suggestions/check_requirements/verified: Volunteer sees own, admin sees all
+    - list/retrieve/statistics/suggestions/mission_recommendations/check_requirements/verified: Volunteer sees own, admin sees all
     """
     queryset = VolunteerSkill.objects.all()
     serializer_class = VolunteerSkillListSerializer
@@ -169,6 +176,65 @@ class VolunteerSkillViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
     
+    @action(detail=False, methods=['get'])
+    def verification_request_statistics(self, request):
+        """
+        Get verification request counts per review status (Admin only)
+        """
+        try:
+            stats = VerificationService.get_verification_request_stats()
+            
+            serializer = VerificationRequestStatisticsSerializer(stats)
+            return Response(serializer.data)
+        except Exception as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+    
+    @action(detail=False, methods=['post'])
+    def claim_verification_requests(self, request):
+        """
+        Claim the next verification requests to review (Admin only)
+        """
+        serializer = VerificationRequestClaimSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        try:
+            claimed = VerificationService.claim_verification_requests(
+                reviewer_id=str(request.user.id),
+                limit=serializer.validated_data['limit']
+            )
+            
+            response_serializer = VerificationRequestSerializer(claimed, many=True)
+            return Response(response_serializer.data)
+        except Exception as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+    
+    @action(detail=False, methods=['post'])
+    def release_verification_requests(self, request):
+        """
+        Return claimed verification requests to the review queue (Admin only)
+        """
+        serializer = VerificationRequestReleaseSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        try:
+            released = VerificationService.release_verification_requests(
+                reviewer_id=str(request.user.id),
+                verification_request_ids=serializer.validated_data.get('verification_request_ids')
+            )
+            
+            return Response({'released': released})
+        except Exception as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+    
     @action(detail=True, methods=['post'])
     def review_verification(self, request, id=None):
         """
@@ -205,6 +271,30 @@ class VolunteerSkillViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
     
+    @action(detail=False, methods=['post'])
+    def bulk_review_verification(self, request):
+        """
+        Apply one review decision to many verification requests (Admin only)
+        """
+        serializer = VerificationRequestBulkReviewSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        try:
+            result = VerificationService.bulk_review_verification_requests(
+                verification_request_ids=serializer.validated_data['verification_request_ids'],
+                reviewer_id=str(request.user.id),
+                review_status=serializer.validated_data['review_status'],
+                review_notes=serializer.validated_data.get('review_notes', ''),
+                admin_notes=serializer.validated_data.get('admin_notes', '')
+            )
+            
+            return Response(result)
+        except Exception as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+    
     @action(detail=False, methods=['get'])
     def statistics(self, request):
         """
@@ -281,6 +371,59 @@ class VolunteerSkillViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
     
+    @action(detail=False, methods=['get'])
+    def mission_recommendations(self, request):
+        """
+        Get published missions ranked by skill match for a volunteer
+        (Volunteer sees own, Admin sees any)
+        
+        Query params:
+        - volunteer_id: Volunteer profile ID (admin only)
+        - verified_only: Only count verified skills (default: false)
+        - require_all: Only missions whose required skills are all held (default: false)
+        - limit: Maximum results (default: 10)
+        """
+        volunteer_id = request.query_params.get('volunteer_id')
+        user = request.user
+        
+        if not user.is_staff:
+            if hasattr(user, 'volunteer_profile'):
+                volunteer_id = str(user.volunteer_profile.id)
+            else:
+                return Response(
+                    {'error': 'You can only view your own mission recommendations'},
+                    status=status.HTTP_403_FORBIDDEN
+                )
+        
+        if not volunteer_id:
+            return Response(
+                {'error': 'volunteer_id is required as query parameter'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            verified_only = request.query_params.get('verified_only', 'false').lower() == 'true'
+            require_all = request.query_params.get('require_all', 'false').lower() == 'true'
+            limit = int(request.query_params.get('limit', 10))
+            
+            recommendations = MissionRecommendationService.recommend_missions_for_volunteer(
+                volunteer_id=volunteer_id,
+                verified_only=verified_only,
+                require_all_skills=require_all,
+                limit=limit
+            )
+            
+            serializer = MissionRecommendationSerializer(recommendations, many=True)
+            return Response({
+                'count': len(recommendations),
+                'results': serializer.data
+            })
+        except Exception as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+    
     @action(detail=False, methods=['post'])
     def bulk_import(self, request):
         """
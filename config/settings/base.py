@@ -26,6 +26,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     
     # Third party apps
     'rest_framework',
@@ -104,6 +105,28 @@ else:
             ssl_require=True
         )
     }
+
+# Cache Configuration
+# Shared Redis cache when REDIS_URL is set, per-process memory cache otherwise
+REDIS_URL = os.getenv('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': REDIS_URL,
+            'OPTIONS': {
+                'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            },
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # PASSWORD_HASHERS
 PASSWORD_HASHERS = [
     'django.contrib.auth.hashers.Argon2PasswordHasher',
@@ -212,6 +235,30 @@ CORS_ALLOWED_ORIGINS = [
 
 CORS_ALLOW_CREDENTIALS = True
 
+# Skills search
+# Serve volunteer skill searches from the in-process bitmap index
+SKILLS_VOLUNTEER_INDEX_ENABLED = os.getenv('SKILLS_VOLUNTEER_INDEX_ENABLED', 'False').lower() == 'true'
+# Seconds a cached volunteer search result may live (skill changes invalidate it earlier)
+SKILLS_SEARCH_CACHE_TIMEOUT = int(os.getenv('SKILLS_SEARCH_CACHE_TIMEOUT', '300'))
+# Widest area (km around a mission) scanned by distance-aware volunteer search.
+# Defaults to the volunteer profile's default travel distance. The geohash
+# prefilter scans the 9 cells around the mission: up to about 120 km at
+# Algerian latitudes these are ~156 km cells, past it ~1250 x 625 km cells,
+# which is close to a full scan. Volunteers willing to travel further than
+# this are only found within it.
+SKILLS_PROXIMITY_MAX_RADIUS_KM = int(os.getenv('SKILLS_PROXIMITY_MAX_RADIUS_KM', '50'))
+# Seconds before the skill autocomplete index reloads to pick up popularity changes
+SKILLS_AUTOCOMPLETE_REFRESH_SECONDS = int(os.getenv('SKILLS_AUTOCOMPLETE_REFRESH_SECONDS', '300'))
+# Seconds cached volunteer skill statistics may live (skill changes invalidate them earlier)
+SKILLS_VOLUNTEER_STATISTICS_CACHE_TIMEOUT = int(os.getenv('SKILLS_VOLUNTEER_STATISTICS_CACHE_TIMEOUT', '3600'))
+# Seconds a reviewer's claim on a verification request lasts before it returns to the queue
+SKILLS_VERIFICATION_CLAIM_SECONDS = int(os.getenv('SKILLS_VERIFICATION_CLAIM_SECONDS', '900'))
+# Post-process uploaded documents in a background thread of each web process
+# instead of the process_documents worker (handy locally)
+SKILLS_DOCUMENT_PROCESSING_IN_PROCESS = os.getenv('SKILLS_DOCUMENT_PROCESSING_IN_PROCESS', 'False').lower() == 'true'
+# Seconds a worker may hold a claimed document before another worker retries it
+SKILLS_DOCUMENT_PROCESSING_LEASE_SECONDS = int(os.getenv('SKILLS_DOCUMENT_PROCESSING_LEASE_SECONDS', '300'))
+
 # Logging
 LOGGING = {
     'version': 1,